@@ -0,0 +1,187 @@
+"""Loop-health monitoring and task admission control."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import os
+import sys
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+)
+
+# Third-Party Imports
+from celery.utils.log import get_logger
+
+__all__ = (
+    "AdmissionController",
+    "LoopMonitor",
+    "current_rss",
+)
+
+logger = get_logger(__name__)
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss() -> int:
+    """Get the current resident set size of this process, in bytes."""
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        # Not Linux, so settle for the peak RSS instead (which
+        # `getrusage` reports in bytes on macOS, KiB elsewhere)
+        # Standard Library Imports
+        import resource  # pylint: disable=import-outside-toplevel
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class LoopMonitor:
+    """Measure how late an event loop runs a periodic timer (i.e. how long
+    it's being blocked for)."""
+
+    def __init__(self, loop: aio.AbstractEventLoop, interval: float = 0.1) -> None:
+        self.loop = loop
+        self.interval = interval
+        self.lag: float = 0.0
+        self.max_lag: float = 0.0
+        self._future: Optional[Any] = None
+        self._probe_task: Optional[aio.Task] = None
+
+    @property
+    def active(self) -> bool:
+        """Check whether the loop is being probed."""
+        return self._future is not None
+
+    def start(self) -> None:
+        """Start probing the loop."""
+        if self._future is None:
+            self._future = aio.run_coroutine_threadsafe(self._probe(), self.loop)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop probing the loop, waiting (up to `timeout` seconds) for the
+        probe to finish if the loop is running in another thread."""
+        if (future := self._future) is None:
+            return
+
+        self._future = None
+        future.cancel()
+
+        try:
+            on_loop = aio.get_running_loop() is self.loop
+        except RuntimeError:
+            on_loop = False
+
+        # Cancelling the future only asks the loop to cancel the probe,
+        # which would otherwise still be pending if the loop is closed
+        # right after the monitor is stopped
+        if self.loop.is_running() and not on_loop:
+            try:
+                aio.run_coroutine_threadsafe(self._settle(), self.loop).result(timeout)
+            except Exception:  # pylint: disable=broad-except
+                logger.debug("Event loop probe didn't finish within %ss", timeout)
+
+    async def _settle(self) -> None:
+        if self._probe_task is not None:
+            await aio.wait((self._probe_task,))
+            self._probe_task = None
+
+    async def _probe(self) -> None:
+        self._probe_task = aio.current_task()
+
+        while True:
+            started = time.monotonic()
+            await aio.sleep(self.interval)
+            self.lag = max(0.0, time.monotonic() - started - self.interval)
+            self.max_lag = max(self.max_lag, self.lag)
+
+
+class AdmissionController:
+    """Decide whether the worker pool is healthy enough to start another
+    task."""
+
+    def __init__(
+        self,
+        monitor: LoopMonitor,
+        max_lag: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        max_rss: Optional[int] = None,
+        max_defer: float = 30.0,
+        poll_interval: float = 0.05,
+        sleep: Callable[[float], Any] = time.sleep,
+    ) -> None:
+        self.monitor = monitor
+        self.max_lag = max_lag
+        self.max_in_flight = max_in_flight
+        self.max_rss = max_rss
+        self.max_defer = max_defer
+        self.poll_interval = poll_interval
+        self.sleep = sleep
+        self.in_flight: int = 0
+        self.stats: Dict[str, int] = {"admitted": 0, "deferred": 0, "shed": 0}
+
+        self._lock = threading.Lock()
+
+    def enter(self) -> None:
+        """Record that a coroutine has been scheduled on the loop."""
+        with self._lock:
+            self.in_flight += 1
+
+    def exit(self) -> None:
+        """Record that a scheduled coroutine has finished."""
+        with self._lock:
+            self.in_flight -= 1
+
+    def overloaded(self) -> Optional[str]:
+        """Get the reason the pool is over budget, if it is."""
+        if self.max_lag is not None and self.monitor.lag > self.max_lag:
+            return f"event loop lag {self.monitor.lag:.3f}s > {self.max_lag}s"
+
+        if self.max_in_flight is not None and self.in_flight >= self.max_in_flight:
+            return f"{self.in_flight} coroutines in flight >= {self.max_in_flight}"
+
+        if self.max_rss is not None and (rss := current_rss()) > self.max_rss:
+            return f"RSS {rss} bytes > {self.max_rss} bytes"
+
+        return None
+
+    def admit(self, task: Any) -> bool:
+        """Check whether the supplied task may be started now.
+
+        Tasks declared with `sheddable=True` (and `acks_late`, so that
+        their messages are still unacknowledged) are refused outright
+        while the pool is over budget, so they can be requeued. Any
+        other task is deferred until the pool recovers (or `max_defer`
+        seconds pass), which also keeps the worker from reserving any
+        more messages in the meantime.
+        """
+        if (reason := self.overloaded()) is None:
+            self.stats["admitted"] += 1
+            return True
+
+        # Messages of tasks without `acks_late` have already been
+        # acknowledged, so rejecting them would lose them for good
+        if getattr(task, "sheddable", False) and getattr(task, "acks_late", False):
+            self.stats["shed"] += 1
+            logger.warning("Shedding task %s: %s", task.name, reason)
+            return False
+
+        self.stats["deferred"] += 1
+        logger.warning("Deferring task %s: %s", task.name, reason)
+
+        deadline = time.monotonic() + self.max_defer
+
+        while self.overloaded() and time.monotonic() < deadline:
+            self.sleep(self.poll_interval)
+
+        self.stats["admitted"] += 1
+        return True
@@ -0,0 +1,167 @@
+"""Opt-in, sampled tracking of the memory allocated by each task.
+
+Many coroutine tasks interleave on the pool's event loop, so the
+growth of the process as a whole can't be pinned on any one of them.
+`AllocationTracker` takes a `tracemalloc` snapshot before and after a
+sampled task's body runs and attributes to the task only those
+allocations whose traceback passes through the task's own code, i.e.
+those made by the task's coroutine (or thread) rather than by any other
+task running at the same time.
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import collections
+import contextlib
+import dis
+import inspect
+import threading
+import tracemalloc
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+# Package-Level Imports
+from celery_aio_pool.types import AnyCallable
+
+__all__ = ("AllocationTracker",)
+
+
+def _line_span(code: Any) -> Tuple[int, int]:
+    """Get the first and last line numbers of the supplied code object."""
+    if hasattr(code, "co_lines"):
+        lines = [line for _, _, line in code.co_lines() if line]
+    else:
+        lines = [line for _, line in dis.findlinestarts(code) if line]
+
+    return min(lines, default=code.co_firstlineno), max(lines, default=code.co_firstlineno)
+
+
+class AllocationTracker:
+    """Attribute the memory retained by sampled task executions to their
+    task's name."""
+
+    def __init__(self) -> None:
+        self.every: int = 10
+        self.task_name: Optional[str] = None
+        self.active: bool = False
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+        self._lock = threading.Lock()
+        self._seen: collections.Counter = collections.Counter()
+        self._started_tracing: bool = False
+
+    def start(self, every: int = 10, task_name: Optional[str] = None, nframes: int = 25) -> None:
+        """Start tracking 1-in-`every` executions of each task (or only of
+        `task_name`), keeping up to `nframes` frames per allocation."""
+        with self._lock:
+            if self.active:
+                raise RuntimeError("Allocation tracking is already running")
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(max(1, int(nframes)))
+                self._started_tracing = True
+
+            self.every = max(1, int(every))
+            self.task_name = task_name
+            self.stats.clear()
+            self._seen.clear()
+            self.active = True
+
+    def stop(self) -> bool:
+        """Stop tracking allocations, returning `False` if tracking wasn't
+        running. Collected statistics are kept until the next start."""
+        with self._lock:
+            if not self.active:
+                return False
+
+            self.active = False
+
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+        return True
+
+    def wants(self, task_name: str) -> bool:
+        """Decide whether the next execution of the named task should be
+        tracked."""
+        if not self.active or (self.task_name is not None and task_name != self.task_name):
+            return False
+
+        with self._lock:
+            seen = self._seen[task_name]
+            self._seen[task_name] += 1
+
+        return seen % self.every == 0
+
+    @contextlib.contextmanager
+    def measure(self, task_name: str, function: AnyCallable) -> Iterator[None]:
+        """Track the allocations made by the supplied task function while
+        the context is active, if this execution is sampled."""
+        if not self.wants(task_name):
+            yield
+            return
+
+        code = getattr(inspect.unwrap(function), "__code__", None)
+        before = tracemalloc.take_snapshot()
+
+        try:
+            yield
+        finally:
+            if self.active and code is not None:
+                self._record(task_name, code, before, tracemalloc.take_snapshot())
+
+    def _record(self, task_name: str, code: Any, before: Any, after: Any) -> None:
+        filename = code.co_filename
+        first, last = _line_span(code)
+        only_task_code = [tracemalloc.Filter(True, filename, all_frames=True)]
+
+        retained, sites = 0, collections.Counter()
+
+        for stat in after.filter_traces(only_task_code).compare_to(before.filter_traces(only_task_code), "traceback"):
+            if not stat.size_diff or not any(
+                frame.filename == filename and first <= frame.lineno <= last for frame in stat.traceback
+            ):
+                continue
+
+            site = stat.traceback[-1]
+            retained += stat.size_diff
+            sites[f"{site.filename}:{site.lineno}"] += stat.size_diff
+
+        with self._lock:
+            entry = self.stats.setdefault(task_name, {"samples": 0, "retained": 0, "sites": collections.Counter()})
+            entry["samples"] += 1
+            entry["retained"] += retained
+            entry["sites"].update(sites)
+
+    def report(self, limit: int = 10) -> Dict[str, Dict[str, Any]]:
+        """Summarize the allocations retained by each tracked task, with its
+        top `limit` allocation sites."""
+        with self._lock:
+            stats = {name: dict(entry, sites=collections.Counter(entry["sites"])) for name, entry in self.stats.items()}
+
+        report: Dict[str, Dict[str, Any]] = {}
+
+        for name, entry in sorted(stats.items(), key=lambda item: item[1]["retained"], reverse=True):
+            top: List[Tuple[str, int]] = sorted(
+                ((site, size) for site, size in entry["sites"].items() if size),
+                key=lambda item: abs(item[1]),
+                reverse=True,
+            )[:limit]
+
+            report[name] = {
+                "samples": entry["samples"],
+                "retained": entry["retained"],
+                "retained_per_task": entry["retained"] // max(1, entry["samples"]),
+                "top_sites": top,
+            }
+
+        return report
@@ -0,0 +1,374 @@
+"""Claim-check offloading of large task arguments and results.
+
+Bytes-like task arguments and results larger than the configured
+`aio_pool_claim_check_threshold` are written to a blob store, and only a
+small reference to them travels through the broker / result backend.
+Argument blobs are deleted once their task has succeeded or failed
+for good, and result blobs when their results are forgotten. Blobs
+left behind (e.g. by revoked tasks) are purged once they're older than
+the app's `result_expires`.
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import abc
+import asyncio as aio
+import mmap
+import os
+import tempfile
+import time
+import uuid
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# Third-Party Imports
+import celery
+import celery.result
+from celery.utils.imports import symbol_by_name
+
+# Package-Level Imports
+from celery_aio_pool.eager import eager_executor
+
+__all__ = (
+    "BlobStore",
+    "ClaimCheck",
+    "ClaimCheckResult",
+    "ClaimCheckTask",
+    "FileSystemBlobStore",
+    "is_reference",
+)
+
+
+BytesLike = Union[bytes, bytearray, memoryview]
+Reference = Dict[str, Any]
+
+CLAIM_CHECK_KEY = "__aio_pool_claim_check__"
+
+# The prefix of the keys offloaded results are stored under
+RESULT_PREFIX = "result-"
+
+
+def is_reference(value: Any) -> bool:
+    """Check whether the supplied value is a claim-check reference."""
+    return isinstance(value, dict) and CLAIM_CHECK_KEY in value
+
+
+class BlobStore(abc.ABC):
+    """Storage backend for offloaded payloads."""
+
+    @abc.abstractmethod
+    async def put(self, data: BytesLike) -> str:
+        """Store the supplied data and return the key it was stored
+        under."""
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> BytesLike:
+        """Fetch the data stored under the supplied key."""
+
+    @abc.abstractmethod
+    async def delete(self, key: str) -> None:
+        """Delete the data stored under the supplied key."""
+
+    async def put_result(self, data: BytesLike) -> str:
+        """Store the supplied task result and return the key it was stored
+        under."""
+        return await self.put(data)
+
+    async def purge_results(self, max_age: float) -> int:
+        """Delete the stored task results older than `max_age` seconds, and
+        return how many were deleted.
+
+        Stores that expire their contents by other means (e.g. bucket
+        lifecycle rules) needn't override this.
+        """
+        return 0
+
+    async def purge_arguments(self, max_age: float) -> int:
+        """Delete the stored task arguments older than `max_age` seconds,
+        and return how many were deleted.
+
+        Stores that expire their contents by other means (e.g. bucket
+        lifecycle rules) needn't override this.
+        """
+        return 0
+
+
+class FileSystemBlobStore(BlobStore):
+    """Blob store backed by a (possibly shared) local directory.
+
+    Payloads are memory-mapped when read, so tasks receive a read-
+    only `memoryview` over the file instead of a copy of its
+    contents. The mapping is closed by `ClaimCheck.release` once the
+    task is done with it.
+    """
+
+    def __init__(self, root: Optional[str] = None) -> None:
+        self.root = root or os.path.join(tempfile.gettempdir(), "celery-aio-claim-check")
+        os.makedirs(self.root, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        """Get the path of the file backing the supplied key."""
+        return os.path.join(self.root, os.path.basename(key))
+
+    async def put(self, data: BytesLike) -> str:
+        """Store the supplied data and return the key it was stored
+        under."""
+        key = uuid.uuid4().hex
+        await aio.to_thread(self._write, self.path(key), data)
+        return key
+
+    async def put_result(self, data: BytesLike) -> str:
+        """Store the supplied task result and return the key it was stored
+        under."""
+        key = f"{RESULT_PREFIX}{uuid.uuid4().hex}"
+        await aio.to_thread(self._write, self.path(key), data)
+        return key
+
+    async def get(self, key: str) -> BytesLike:
+        """Memory-map the data stored under the supplied key."""
+        return await aio.to_thread(self._map, self.path(key))
+
+    async def delete(self, key: str) -> None:
+        """Delete the data stored under the supplied key."""
+        await aio.to_thread(self._unlink, self.path(key))
+
+    async def purge_results(self, max_age: float) -> int:
+        """Delete the stored task results older than `max_age` seconds, and
+        return how many were deleted."""
+        return await aio.to_thread(self._purge, time.time() - max_age, results=True)
+
+    async def purge_arguments(self, max_age: float) -> int:
+        """Delete the stored task arguments older than `max_age` seconds,
+        and return how many were deleted."""
+        return await aio.to_thread(self._purge, time.time() - max_age, results=False)
+
+    @staticmethod
+    def _map(path: str) -> BytesLike:
+        with open(path, "rb") as blob:
+            if not os.fstat(blob.fileno()).st_size:
+                return b""
+
+            mapped = mmap.mmap(blob.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            return memoryview(mapped)
+        except BaseException:
+            mapped.close()
+            raise
+
+    @staticmethod
+    def _unlink(path: str) -> bool:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            return False
+
+        return True
+
+    def _purge(self, cutoff: float, results: bool) -> int:
+        purged = 0
+
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                try:
+                    expired = entry.name.startswith(RESULT_PREFIX) is results and entry.stat().st_mtime < cutoff
+                except FileNotFoundError:
+                    continue
+
+                purged += expired and self._unlink(entry.path)
+
+        return purged
+
+    @staticmethod
+    def _write(path: str, data: BytesLike) -> None:
+        # Write to a temporary file and move it into place so that
+        # readers can never observe a partially written payload
+        with open(f"{path}.partial", "wb") as blob:
+            blob.write(data)
+
+        os.replace(f"{path}.partial", path)
+
+
+class ClaimCheck:
+    """Offload large bytes-like values to a `BlobStore` and resolve the
+    references left in their place."""
+
+    def __init__(self, store: BlobStore, threshold: int) -> None:
+        self.store = store
+        self.threshold = threshold
+
+    @classmethod
+    def from_app(cls, app: celery.Celery) -> Optional["ClaimCheck"]:
+        """Get the claim-check configured for the supplied app, or `None` if
+        claim-checks aren't enabled."""
+        if (threshold := app.conf.get("aio_pool_claim_check_threshold")) is None:
+            return None
+
+        if (claim_check := getattr(app, "_aio_pool_claim_check", None)) is None:
+            store = app.conf.get("aio_pool_claim_check_store")
+
+            if store is None:
+                store = FileSystemBlobStore(app.conf.get("aio_pool_claim_check_dir"))
+            elif isinstance(store, str):
+                store = symbol_by_name(store)()
+
+            claim_check = app._aio_pool_claim_check = cls(store, int(threshold))
+
+        return claim_check
+
+    def should_offload(self, value: Any) -> bool:
+        """Check whether the supplied value is large enough to offload."""
+        return isinstance(value, (bytes, bytearray, memoryview)) and memoryview(value).nbytes > self.threshold
+
+    async def offload(self, value: Any) -> Any:
+        """Replace the supplied value with a reference if it's large enough
+        to be offloaded."""
+        if not self.should_offload(value):
+            return value
+
+        return {
+            CLAIM_CHECK_KEY: await self.store.put(value),
+            "size": memoryview(value).nbytes,
+        }
+
+    async def offload_result(self, value: Any) -> Any:
+        """Replace the supplied task result with a reference if it's large
+        enough to be offloaded."""
+        if not self.should_offload(value):
+            return value
+
+        return {
+            CLAIM_CHECK_KEY: await self.store.put_result(value),
+            "size": memoryview(value).nbytes,
+        }
+
+    async def resolve(self, value: Any) -> Any:
+        """Replace the supplied reference with the data it refers to."""
+        if not is_reference(value):
+            return value
+
+        return await self.store.get(value[CLAIM_CHECK_KEY])
+
+    def retrieve(self, value: Any) -> Any:
+        """Synchronously resolve the supplied reference, e.g. to fetch an
+        offloaded result returned by `AsyncResult.get`."""
+        return eager_executor.run(self.resolve, value)
+
+    def discard(self, value: Any) -> None:
+        """Synchronously delete the blob the supplied reference refers to,
+        e.g. when the result it was returned as is forgotten."""
+        if is_reference(value):
+            eager_executor.run(self.store.delete, value[CLAIM_CHECK_KEY])
+
+    @staticmethod
+    def release(*values: Any) -> None:
+        """Close the memory-mapped files backing any of the supplied
+        (resolved) values.
+
+        Mappings that are still referenced elsewhere (e.g. by a result
+        that's been kept around) are left to be closed once they're
+        garbage-collected.
+        """
+        for value in values:
+            if isinstance(value, memoryview) and isinstance(mapped := value.obj, mmap.mmap):
+                value.release()
+
+                try:
+                    mapped.close()
+                except BufferError:
+                    pass
+
+    async def expire(
+        self,
+        results_max_age: Optional[float],
+        arguments_max_age: Optional[float] = None,
+        interval: Optional[float] = None,
+    ) -> None:
+        """Purge the results older than `results_max_age` seconds, and the
+        arguments older than `arguments_max_age` seconds, from the store
+        every `interval` seconds (by default, whichever is shortest of
+        the maximum ages and an hour), until cancelled."""
+        interval = interval or min(age for age in (results_max_age, arguments_max_age, 3600.0) if age)
+
+        while True:
+            if results_max_age:
+                await self.store.purge_results(results_max_age)
+
+            if arguments_max_age:
+                await self.store.purge_arguments(arguments_max_age)
+
+            await aio.sleep(interval)
+
+    async def offload_arguments(
+        self,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """Offload any large task arguments."""
+        return await self._map_arguments(self.offload, args, kwargs)
+
+    async def resolve_arguments(
+        self,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """Concurrently resolve any referenced task arguments."""
+        return await self._map_arguments(self.resolve, args, kwargs)
+
+    async def delete_arguments(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        """Delete the blobs referenced by the supplied task arguments."""
+        references: List[Reference] = [value for value in (*args, *kwargs.values()) if is_reference(value)]
+
+        await aio.gather(*(self.store.delete(reference[CLAIM_CHECK_KEY]) for reference in references))
+
+    @staticmethod
+    async def _map_arguments(
+        mapper: Any,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        values = await aio.gather(*map(mapper, args), *map(mapper, kwargs.values()))
+        return tuple(values[: len(args)]), dict(zip(kwargs, values[len(args) :]))
+
+
+class ClaimCheckResult(celery.result.AsyncResult):
+    """Task result that deletes the blob of an offloaded result when it's
+    forgotten."""
+
+    def forget(self) -> None:
+        """Forget the result, and delete its blob if it was offloaded."""
+        if claim_check := ClaimCheck.from_app(self.app):
+            claim_check.discard(self.result)
+
+        super().forget()
+
+
+class ClaimCheckTask(celery.Task):
+    """Task base class that offloads large arguments before publishing.
+
+    Use it with `@app.task(base=ClaimCheckTask)` on the producer side;
+    workers running `AsyncIOPool` resolve the references automatically.
+    """
+
+    def AsyncResult(self, task_id: str, **kwargs: Any) -> ClaimCheckResult:
+        """Get the `ClaimCheckResult` for the specified task."""
+        return ClaimCheckResult(task_id, backend=self.backend, task_name=self.name, app=self._get_app(), **kwargs)
+
+    def apply_async(self, args=None, kwargs=None, *_args: Any, **options: Any) -> Any:
+        """Offload large arguments, then publish the task as usual."""
+        if claim_check := ClaimCheck.from_app(self.app):
+            args, kwargs = eager_executor.run(
+                claim_check.offload_arguments,
+                tuple(args or ()),
+                dict(kwargs or {}),
+            )
+
+        return super().apply_async(args, kwargs, *_args, **options)
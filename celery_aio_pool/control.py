@@ -0,0 +1,145 @@
+"""Remote-control commands for workers running `AsyncIOPool`."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
+
+# Third-Party Imports
+from celery.worker.control import (
+    control_command,
+    inspect_command,
+    nok,
+    ok,
+)
+
+__all__ = (
+    "aio_memory_profile",
+    "aio_memory_profile_stop",
+    "aio_memory_report",
+    "aio_memoize_clear",
+    "aio_profile",
+    "aio_profile_stop",
+)
+
+
+def _worker_pool(state: Any) -> Any:
+    """Get the `AsyncIOPool` instance bound to the worker's consumer."""
+    # Package-Level Imports
+    from celery_aio_pool.pool import AsyncIOPool
+
+    pool = getattr(state.consumer, "pool", None)
+
+    return pool if isinstance(pool, AsyncIOPool) else None
+
+
+@control_command(
+    args=[
+        ("duration", float),
+        ("task_name", str),
+        ("every", int),
+        ("fmt", str),
+    ],
+    signature="[duration=10.0] [task_name=None] [every=1] [fmt=collapsed|speedscope]",
+)
+def aio_profile(
+    state: Any,
+    duration: float = 10.0,
+    task_name: Optional[str] = None,
+    every: int = 1,
+    fmt: str = "collapsed",
+) -> Dict[str, Any]:
+    """Sample the worker's event loop thread for `duration` seconds,
+    optionally restricted to 1-in-`every` executions of `task_name`."""
+    if not (pool := _worker_pool(state)):
+        return nok("worker is not using AsyncIOPool")
+
+    try:
+        path = pool.profiler.start(
+            duration=duration,
+            task_name=task_name or None,
+            every=every,
+            fmt=fmt,
+        )
+    except (ValueError, RuntimeError) as error:
+        return nok(str(error))
+
+    return ok(f"profiling event loop for {duration}s, writing to {path}")
+
+
+@control_command()
+def aio_profile_stop(state: Any) -> Dict[str, Any]:
+    """Stop a running event loop profile and write it to disk."""
+    if not (pool := _worker_pool(state)):
+        return nok("worker is not using AsyncIOPool")
+
+    if not (path := pool.profiler.stop()):
+        return nok("event loop profiler is not running")
+
+    return ok(f"event loop profile written to {path}")
+
+
+@control_command(
+    args=[
+        ("every", int),
+        ("task_name", str),
+        ("nframes", int),
+    ],
+    signature="[every=10] [task_name=None] [nframes=25]",
+)
+def aio_memory_profile(
+    state: Any,
+    every: int = 10,
+    task_name: Optional[str] = None,
+    nframes: int = 25,
+) -> Dict[str, Any]:
+    """Start tracking the allocations of 1-in-`every` executions of each
+    task (or only of `task_name`)."""
+    if not (pool := _worker_pool(state)):
+        return nok("worker is not using AsyncIOPool")
+
+    try:
+        pool.allocations.start(every=every, task_name=task_name or None, nframes=nframes)
+    except RuntimeError as error:
+        return nok(str(error))
+
+    return ok(f"tracking allocations of 1-in-{max(1, every)} task executions")
+
+
+@control_command()
+def aio_memory_profile_stop(state: Any) -> Dict[str, Any]:
+    """Stop tracking task allocations (collected statistics are kept)."""
+    if not (pool := _worker_pool(state)):
+        return nok("worker is not using AsyncIOPool")
+
+    if not pool.allocations.stop():
+        return nok("allocation tracking is not running")
+
+    return ok("allocation tracking stopped")
+
+
+@inspect_command(
+    args=[("limit", int)],
+    signature="[limit=10]",
+)
+def aio_memory_report(state: Any, limit: int = 10) -> Dict[str, Any]:
+    """Report the memory retained by each tracked task and its top
+    allocation sites."""
+    if not (pool := _worker_pool(state)):
+        return nok("worker is not using AsyncIOPool")
+
+    return pool.allocations.report(limit=limit)
+
+
+@control_command()
+def aio_memoize_clear(state: Any) -> Dict[str, Any]:
+    """Drop every memoized task result cached by the worker."""
+    if not (pool := _worker_pool(state)):
+        return nok("worker is not using AsyncIOPool")
+
+    return ok(f"dropped {pool.memo_cache.clear()} memoized results")
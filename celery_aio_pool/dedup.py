@@ -0,0 +1,222 @@
+"""Deduplication of redelivered tasks that have already succeeded.
+
+With `worker_deduplicate_successful_tasks` enabled, Celery looks up
+the state of every redelivered task in the result backend, one
+blocking read at a time. `DedupIndex` answers from worker-local
+memory where it can and otherwise batches the backend reads, starting
+them on the pool's event loop as soon as a redelivered message is
+received rather than when it's finally executed.
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import concurrent.futures
+import hashlib
+import math
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
+
+# Third-Party Imports
+from celery import states
+from celery.backends.base import KeyValueStoreBackend
+from celery.utils.collections import LimitedSet
+from celery.utils.functional import chunks
+from celery.utils.log import get_logger
+
+__all__ = (
+    "BloomFilter",
+    "DedupIndex",
+)
+
+logger = get_logger(__name__)
+
+
+class BloomFilter:
+    """A fixed-size Bloom filter of strings."""
+
+    def __init__(self, capacity: int, error_rate: float = 1e-6) -> None:
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> List[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    def add(self, item: str) -> None:
+        """Add the supplied item to the filter."""
+        for position in self._positions(item):
+            self.bits[position // 8] |= 1 << (position % 8)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position // 8] & (1 << (position % 8)) for position in self._positions(item))
+
+
+def fetch_states(backend: Any, task_ids: Sequence[str]) -> Dict[str, str]:
+    """Fetch the states of the supplied tasks, with a single round trip
+    where the backend supports it."""
+    if isinstance(backend, KeyValueStoreBackend):
+        keys = [backend.get_key_for_task(task_id) for task_id in task_ids]
+        values = backend.mget(keys)
+
+        # Some clients return a mapping of keys to values instead
+        # of a list of values in the same order as the keys
+        if hasattr(values, "items"):
+            values = [values.get(key) for key in keys]
+
+        return {
+            task_id: backend.decode_result(value)["status"] if value else states.PENDING
+            for task_id, value in zip(task_ids, values)
+        }
+
+    return {task_id: backend.get_task_meta(task_id)["status"] for task_id in task_ids}
+
+
+class DedupIndex:
+    """Index of successfully completed task ids backed by batched, async
+    result backend lookups."""
+
+    def __init__(
+        self,
+        loop: aio.AbstractEventLoop,
+        maxlen: int = 50000,
+        expires: float = 10800,
+        bloom_capacity: Optional[int] = None,
+        bloom_error_rate: float = 1e-6,
+        batch_size: int = 100,
+        batch_window: float = 0.005,
+        wait: Callable[[concurrent.futures.Future], Any] = concurrent.futures.Future.result,
+    ) -> None:
+        self.loop = loop
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.wait = wait
+        self.completed = LimitedSet(maxlen=maxlen, expires=expires)
+        self.bloom = BloomFilter(bloom_capacity, bloom_error_rate) if bloom_capacity else None
+        self.stats: Dict[str, int] = {"hits": 0, "lookups": 0, "batches": 0, "filtered": 0}
+
+        self._lock = threading.Lock()
+        self._queued: Dict[Any, List[str]] = {}
+        self._lookups: Dict[str, concurrent.futures.Future] = {}
+        self._max_lookups = maxlen
+
+    def mark_completed(self, task_id: str) -> None:
+        """Record the supplied task as having completed successfully."""
+        self.completed.add(task_id)
+
+        if self.bloom is not None:
+            self.bloom.add(task_id)
+
+    def known_completed(self, task_id: str) -> bool:
+        """Check whether the supplied task is known to have completed,
+        without consulting the result backend."""
+        return task_id in self.completed
+
+    def may_have_completed(self, task_id: str) -> bool:
+        """Check whether the result backend should be asked if the supplied
+        task has completed.
+
+        Without a Bloom filter, it always should. With one, only ids
+        the filter (possibly falsely) reports as completed are looked
+        up, so a false positive costs a lookup rather than skipping a
+        task that never ran.
+        """
+        return self.bloom is None or task_id in self.bloom
+
+    def prefetch(self, task_id: str, backend: Any) -> Optional[concurrent.futures.Future]:
+        """Queue a batched backend lookup of the supplied task's state and
+        return the future that will hold it, or `None` if the task is
+        already known to have completed."""
+        if self.known_completed(task_id):
+            return None
+
+        if not self.may_have_completed(task_id):
+            self.stats["filtered"] += 1
+            lookup: concurrent.futures.Future = concurrent.futures.Future()
+            lookup.set_result(None)
+            return lookup
+
+        with self._lock:
+            if (lookup := self._lookups.get(task_id)) is not None:
+                return lookup
+
+            # Lookups are kept until the task they're for is executed,
+            # so evict the oldest finished ones if tasks are received
+            # but never executed (e.g. because they've been revoked)
+            if len(self._lookups) >= self._max_lookups:
+                for stale in [key for key, value in self._lookups.items() if value.done()][: self.batch_size]:
+                    del self._lookups[stale]
+
+            lookup = self._lookups[task_id] = concurrent.futures.Future()
+            queue = self._queued.setdefault(backend, [])
+            queue.append(task_id)
+
+            # The first id queued for a backend opens a short window
+            # for other lookups to join the same batch
+            if len(queue) == 1:
+                self.loop.call_soon_threadsafe(self._flush_later, backend)
+
+        return lookup
+
+    def is_duplicate(self, task_id: str, backend: Any) -> bool:
+        """Check whether the supplied (redelivered) task has already
+        completed successfully."""
+        if (lookup := self.prefetch(task_id, backend)) is None:
+            self.stats["hits"] += 1
+            return True
+
+        try:
+            return self.wait(lookup) == states.SUCCESS
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Could not look up the state of task %s: %r", task_id, exc)
+            return False
+        finally:
+            with self._lock:
+                self._lookups.pop(task_id, None)
+
+    def _flush_later(self, backend: Any) -> None:
+        self.loop.call_later(self.batch_window, lambda: self.loop.create_task(self._flush(backend)))
+
+    async def _flush(self, backend: Any) -> None:
+        with self._lock:
+            task_ids = self._queued.pop(backend, [])
+
+        await aio.gather(*(self._lookup(backend, batch) for batch in chunks(iter(task_ids), self.batch_size)))
+
+    async def _lookup(self, backend: Any, task_ids: List[str]) -> None:
+        self.stats["batches"] += 1
+        self.stats["lookups"] += len(task_ids)
+
+        try:
+            found = await aio.to_thread(fetch_states, backend, task_ids)
+        except Exception as exc:  # pylint: disable=broad-except
+            found, error = {}, exc
+        else:
+            error = None
+
+        with self._lock:
+            futures = [(task_id, self._lookups.get(task_id)) for task_id in task_ids]
+
+        for task_id, future in futures:
+            if future is None or future.done():
+                continue
+
+            if error is not None:
+                future.set_exception(error)
+                continue
+
+            if (state := found.get(task_id)) == states.SUCCESS:
+                self.mark_completed(task_id)
+
+            future.set_result(state)
@@ -0,0 +1,88 @@
+"""Lightweight executor for tasks run outside a worker (i.e. eagerly)."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import concurrent.futures
+import inspect
+import threading
+from typing import (
+    Any,
+    Optional,
+)
+
+# Package-Level Imports
+from celery_aio_pool.types import (
+    AnyCallable,
+    AnyCoroutine,
+)
+
+__all__ = (
+    "EagerExecutor",
+    "eager_executor",
+)
+
+
+class EagerExecutor:
+    """Run task functions in the calling thread without creating a full
+    `AsyncIOPool`.
+
+    Coroutines are run to completion on an event loop cached per
+    thread. If the calling thread is already running an event loop
+    (which can't be re-entered), the coroutine is handed off to a
+    small pool of helper threads that do the same.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._offload: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    def run(
+        self,
+        task_function: AnyCallable | AnyCoroutine,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Run the supplied task function to completion and return its
+        result."""
+        # Unlike the worker pool, there's no eventloop thread to
+        # protect, so regular functions are simply called inline
+        if callable(task_function) and not inspect.isawaitable(task_function):
+            task_function = task_function(*args, **kwargs)
+
+        while inspect.isawaitable(task_function):
+            task_function = self._await(task_function)
+
+        return task_function
+
+    def _await(self, awaitable: Any) -> Any:
+        try:
+            aio.get_running_loop()
+        except RuntimeError:
+            return self._thread_loop().run_until_complete(awaitable)
+
+        return self._offloader().submit(self._await, awaitable).result()
+
+    def _thread_loop(self) -> aio.AbstractEventLoop:
+        loop: Optional[aio.AbstractEventLoop] = getattr(self._local, "loop", None)
+
+        if loop is None or loop.is_closed():
+            loop = self._local.loop = aio.new_event_loop()
+
+        return loop
+
+    def _offloader(self) -> concurrent.futures.ThreadPoolExecutor:
+        if self._offload is None:
+            with self._lock:
+                if self._offload is None:
+                    self._offload = concurrent.futures.ThreadPoolExecutor(
+                        thread_name_prefix="celery-aio-eager",
+                    )
+
+        return self._offload
+
+
+eager_executor = EagerExecutor()
@@ -0,0 +1,120 @@
+"""Eager start of the coroutines submitted to the pool's event loop.
+
+Normally a coroutine handed to the loop with `run_coroutine_threadsafe`
+is wrapped in a `Task` whose first step is only scheduled, so it
+doesn't start running until the loop's next iteration. Coroutines that
+complete without ever suspending (e.g. tasks that hit a cache) pay for
+that `Task` and the extra iteration all the same.
+
+When eager start is enabled, submitted coroutines run synchronously on
+the loop up to their first suspension instead, and a `Task` is only
+created for those that actually suspend. Python 3.12+ does this with
+`asyncio.eager_task_factory`; older versions use `submit_eagerly`.
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import concurrent.futures
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Optional,
+)
+
+# Package-Level Imports
+from celery_aio_pool.types import AnyCoroutine
+
+__all__ = (
+    "EAGER_TASK_FACTORY",
+    "submit_eagerly",
+)
+
+EAGER_TASK_FACTORY: Optional[Callable[..., aio.Task]] = getattr(aio, "eager_task_factory", None)
+
+
+class _Resumed:
+    """Awaitable that drives a coroutine which has already been started,
+    picking up from the value it last yielded."""
+
+    __slots__ = ("coroutine", "yielded")
+
+    def __init__(self, coroutine: AnyCoroutine, yielded: Any) -> None:
+        self.coroutine = coroutine
+        self.yielded = yielded
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        coroutine, value = self.coroutine, self.yielded
+
+        while True:
+            try:
+                sent = yield value
+            except BaseException as exc:  # pylint: disable=broad-except
+                try:
+                    value = coroutine.throw(exc)
+                except StopIteration as done:
+                    return done.value
+            else:
+                try:
+                    value = coroutine.send(sent)
+                except StopIteration as done:
+                    return done.value
+
+
+async def _resume(coroutine: AnyCoroutine, yielded: Any) -> Any:
+    return await _Resumed(coroutine, yielded)
+
+
+def _copy_outcome(task: aio.Task, future: concurrent.futures.Future) -> None:
+    # The future is already running, so it can't be cancelled itself
+    if task.cancelled():
+        future.set_exception(aio.CancelledError())
+    elif (error := task.exception()) is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(task.result())
+
+
+def _start(
+    coroutine: AnyCoroutine,
+    loop: aio.AbstractEventLoop,
+    future: concurrent.futures.Future,
+) -> None:
+    if not future.set_running_or_notify_cancel():
+        coroutine.close()
+        return
+
+    try:
+        yielded = coroutine.send(None)
+    except StopIteration as done:
+        future.set_result(done.value)
+        return
+    except (KeyboardInterrupt, SystemExit) as exc:
+        future.set_exception(exc)
+        raise
+    except BaseException as exc:  # pylint: disable=broad-except
+        future.set_exception(exc)
+        return
+
+    # The coroutine suspended, so it's handed over to a `Task` to
+    # be resumed once whatever it's waiting on is done
+    task = loop.create_task(_resume(coroutine, yielded))
+    task.add_done_callback(lambda done: _copy_outcome(done, future))
+
+
+def submit_eagerly(coroutine: AnyCoroutine, loop: aio.AbstractEventLoop) -> concurrent.futures.Future:
+    """Submit the supplied coroutine to the (running) loop, starting it
+    eagerly in the loop's thread.
+
+    Unlike with `asyncio.eager_task_factory`, there is no current
+    task while the coroutine runs up to its first suspension, so
+    anything relying on `asyncio.current_task()` (e.g.
+    `asyncio.timeout`) must come after the coroutine's first `await`
+    that actually suspends.
+    """
+    future: concurrent.futures.Future = concurrent.futures.Future()
+    loop.call_soon_threadsafe(_start, coroutine, loop, future)
+    return future
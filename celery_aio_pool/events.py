@@ -0,0 +1,236 @@
+"""Batched task-event publishing from the worker pool's event loop."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import collections
+import threading
+from functools import partial
+from typing import (
+    Any,
+    Deque,
+    List,
+    Optional,
+    Set,
+)
+
+# Third-Party Imports
+from celery.app.events import Events
+from celery.events.dispatcher import EventDispatcher
+from celery.events.event import (
+    Event,
+    group_from,
+)
+from celery.utils.functional import chunks
+from celery.utils.log import get_logger
+from celery.utils.time import utcoffset
+
+__all__ = (
+    "BatchingEventDispatcher",
+    "BatchingEvents",
+)
+
+logger = get_logger(__name__)
+
+
+class BatchingEventDispatcher(EventDispatcher):
+    """Event dispatcher that buffers task events and publishes them in
+    batches from the worker pool's event loop.
+
+    Events are sent as `task.multi` messages (the same format Celery
+    uses for its own buffered events) through producers acquired from
+    the app's producer pool. The buffer is bounded, and the oldest
+    events are dropped once it's full. Batches that fail to publish
+    are put back in the buffer and retried.
+    """
+
+    #: The event group that is buffered, all others are sent immediately
+    batch_group = "task"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        conf = self.app.conf
+
+        self.batch_size: int = conf.get("aio_pool_events_batch_size", 100)
+        self.flush_interval: float = conf.get("aio_pool_events_flush_interval", 0.1)
+        self.close_timeout: float = conf.get("aio_pool_events_close_timeout", 10.0)
+        self.loop: Optional[aio.AbstractEventLoop] = None
+        self.dropped: int = 0
+
+        self._pending_lock = threading.Lock()
+        self._pending: Deque[dict] = collections.deque(maxlen=conf.get("aio_pool_events_max_buffered", 10000))
+        self._flush_handle: Optional[aio.TimerHandle] = None
+        self._flush_scheduled: bool = False
+        self._publishing: Set[aio.Task] = set()
+
+    def _event_loop(self) -> Optional[aio.AbstractEventLoop]:
+        if self.loop is None:
+            # Package-Level Imports
+            from celery_aio_pool.pool import AsyncIOPool
+
+            if worker_pool := AsyncIOPool.singleton:
+                self.loop = worker_pool.loop
+
+        return self.loop if self.loop is not None and self.loop.is_running() else None
+
+    def send(
+        self,
+        type: str,  # pylint: disable=redefined-builtin
+        blind: bool = False,
+        utcoffset: Any = utcoffset,  # pylint: disable=redefined-outer-name
+        retry: bool = False,
+        retry_policy: Optional[dict] = None,
+        Event: Any = Event,  # pylint: disable=redefined-outer-name
+        **fields: Any,
+    ) -> Any:
+        """Buffer task events to be published by the pool's event loop, and
+        send everything else as usual."""
+        group = group_from(type)
+
+        if not self.enabled or group != self.batch_group or (loop := self._event_loop()) is None:
+            return super().send(
+                type,
+                blind=blind,
+                utcoffset=utcoffset,
+                retry=retry,
+                retry_policy=retry_policy,
+                Event=Event,
+                **fields,
+            )
+
+        if self.groups and group not in self.groups:
+            return None
+
+        event = Event(
+            type,
+            hostname=self.hostname,
+            utcoffset=utcoffset(),
+            pid=self.pid,
+            clock=None if blind else self.clock.forward(),
+            **fields,
+        )
+
+        with self._pending_lock:
+            if len(self._pending) == self._pending.maxlen:
+                self.dropped += 1
+
+            self._pending.append(event)
+
+            if len(self._pending) >= self.batch_size:
+                self._flush_scheduled = True
+                loop.call_soon_threadsafe(self._flush_now)
+            elif not self._flush_scheduled:
+                self._flush_scheduled = True
+                loop.call_soon_threadsafe(self._flush_later)
+
+        return None
+
+    def _flush_later(self) -> None:
+        if self._flush_handle is None:
+            self._flush_handle = self.loop.call_later(self.flush_interval, self._flush_now)
+
+    def _flush_now(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if batch := self._take_pending():
+            # Publishes are tracked until they're done, so that they can't
+            # be garbage-collected mid-flight and `close` can wait for them
+            publishing = self.loop.create_task(aio.to_thread(self._publish_batch, batch))
+            publishing.add_done_callback(partial(self._published, batch))
+            self._publishing.add(publishing)
+
+    def _published(self, batch: List[dict], publishing: aio.Task) -> None:
+        self._publishing.discard(publishing)
+
+        if publishing.cancelled() or (exc := publishing.exception()) is None:
+            return
+
+        logger.warning("Could not publish %d task events, retrying: %r", len(batch), exc)
+
+        # Put the batch back in front of the events buffered since,
+        # keeping as many of its newest events as there's room for
+        with self._pending_lock:
+            room = self._pending.maxlen - len(self._pending)
+            self.dropped += max(0, len(batch) - room)
+            self._pending.extendleft(reversed(batch[max(0, len(batch) - room) :]))
+
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                self._flush_later()
+
+    def _take_pending(self) -> List[dict]:
+        with self._pending_lock:
+            batch = list(self._pending)
+            self._pending.clear()
+            self._flush_scheduled = False
+
+        return batch
+
+    def _publish_batch(self, events: List[dict]) -> None:
+        with self.app.producer_or_acquire() as producer:
+            for batch in chunks(iter(events), self.batch_size):
+                with self.mutex:
+                    self._publish(batch, producer, f"{self.batch_group}.multi")
+
+    def flush(self, errors: bool = True, groups: bool = True) -> None:
+        """Flush the outbound buffers, including any task events that are
+        still waiting to be published by the pool's event loop."""
+        if groups and (batch := self._take_pending()):
+            self._publish_batch(batch)
+
+        super().flush(errors=errors, groups=groups)
+
+    def close(self) -> None:
+        """Wait for the batches being published by the pool's event loop,
+        publish any task events that are still buffered and close the
+        dispatcher."""
+        loop = self._event_loop()
+
+        if self._publishing and loop is not None and not self._on_loop(loop):
+            try:
+                aio.run_coroutine_threadsafe(self._settle(), loop).result(self.close_timeout)
+            except Exception as exc:
+                logger.warning("Gave up waiting for task events to be published: %r", exc)
+
+        if batch := self._take_pending():
+            self._publish_batch(batch)
+
+        super().close()
+
+    async def _settle(self) -> None:
+        # Failed publishes are put back in the buffer by their
+        # done callbacks, which run before `wait` returns
+        while self._publishing:
+            await aio.wait(tuple(self._publishing))
+            await aio.sleep(0)
+
+    @staticmethod
+    def _on_loop(loop: aio.AbstractEventLoop) -> bool:
+        try:
+            return aio.get_running_loop() is loop
+        except RuntimeError:
+            return False
+
+
+class BatchingEvents(Events):
+    """The app's `events`, whose dispatchers batch task events while the
+    app's `aio_pool_events_batching` setting is on.
+
+    Install it with `Celery(events="celery_aio_pool.events:BatchingEvents")`
+    (which `AsyncIOPool` does itself for apps that haven't set up their
+    events yet).
+    """
+
+    @property
+    def dispatcher_cls(self) -> Any:
+        """Get the class (or its `"module:Class"` path) used by the app's
+        event dispatchers."""
+        if self.app.conf.get("aio_pool_events_batching", False):
+            return BatchingEventDispatcher
+
+        return super().dispatcher_cls
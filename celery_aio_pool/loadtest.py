@@ -0,0 +1,432 @@
+"""Offline load testing of `AsyncIOPool`.
+
+The broker and result backend used here live entirely in the memory
+of the process running the load test, so measurements reflect the
+worker pool rather than the speed of an external service (or of
+kombu's filesystem transport). A worker using `AsyncIOPool` runs in a
+thread of the same process and is fed a deterministic (seeded) mix of
+tasks, after which throughput, latency percentiles, peak RSS and event
+loop lag are reported.
+
+Run it with `python -m celery_aio_pool.loadtest --help`.
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import argparse
+import asyncio as aio
+import json
+import math
+import random
+import socket
+import sys
+import threading
+import time
+from collections import defaultdict
+from queue import Empty
+from typing import (
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# Third-Party Imports
+import celery
+import kombu.transport
+from celery import states
+from celery.backends.base import KeyValueStoreBackend
+from kombu.transport import memory, virtual
+
+# Package-Level Imports
+from celery_aio_pool import patch_celery_tracer
+from celery_aio_pool.admission import current_rss
+from celery_aio_pool.pool import AsyncIOPool
+
+__all__ = (
+    "LoadProfile",
+    "LoadReport",
+    "MemoryBackend",
+    "MemoryTransport",
+    "benchmark_cache_hits",
+    "create_app",
+    "run_load",
+)
+
+BROKER_URL = "aio-memory://"
+BACKEND = f"{__name__}:MemoryBackend"
+
+# Signalled every time a message is published, so that waiting
+# consumers wake up immediately instead of polling for messages
+_published = threading.Condition()
+
+
+class MemoryChannel(memory.Channel):
+    """In-memory channel that wakes up waiting consumers as soon as a
+    message is published."""
+
+    events: Dict[str, Any] = defaultdict(set)
+    queues: Dict[str, Any] = {}
+    published: int = 0
+
+    @staticmethod
+    def _notify() -> None:
+        with _published:
+            MemoryChannel.published += 1
+            _published.notify_all()
+
+    def _put(self, queue: str, message: Any, **kwargs: Any) -> None:
+        super()._put(queue, message, **kwargs)
+        self._notify()
+
+    def _put_fanout(self, exchange: str, message: Any, routing_key: Optional[str] = None, **kwargs: Any) -> None:
+        super()._put_fanout(exchange, message, routing_key, **kwargs)
+        self._notify()
+
+
+class MemoryTransport(memory.Transport):
+    """In-memory transport whose consumers block until a message is
+    published rather than sleeping between polls."""
+
+    Channel = MemoryChannel
+
+    global_state = virtual.BrokerState()
+
+    driver_type = "aio-memory"
+    driver_name = "aio-memory"
+
+    def drain_events(self, connection: Any, timeout: Optional[float] = None) -> None:
+        """Deliver the next message, waiting up to `timeout` seconds for
+        one to be published."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with _published:
+                seen = MemoryChannel.published
+
+            try:
+                return self.cycle.get(self._deliver, timeout=timeout)
+            except Empty:
+                pass
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+
+            if remaining is not None and remaining <= 0:
+                raise socket.timeout()
+
+            with _published:
+                _published.wait_for(lambda: MemoryChannel.published != seen, remaining)
+
+
+kombu.transport.TRANSPORT_ALIASES.setdefault("aio-memory", f"{__name__}:MemoryTransport")
+
+
+class MemoryBackend(KeyValueStoreBackend):
+    """Result backend that keeps results in the memory of the current
+    process and records when each task finished."""
+
+    data: Dict[Any, Any] = {}
+    completed: Dict[str, float] = {}
+
+    _lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Get the value stored under the supplied key."""
+        return self.data.get(key)
+
+    def mget(self, keys: Sequence[Any]) -> List[Any]:
+        """Get the values stored under the supplied keys."""
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store the supplied value under the supplied key."""
+        self.data[key] = value
+
+    def delete(self, key: Any) -> None:
+        """Delete the value stored under the supplied key."""
+        self.data.pop(key, None)
+
+    def incr(self, key: Any) -> int:
+        """Increment the counter stored under the supplied key."""
+        with self._lock:
+            value = self.data[key] = int(self.data.get(key) or 0) + 1
+
+        return value
+
+    def expire(self, key: Any, value: Any) -> None:
+        """Results are never expired."""
+
+    def _store_result(
+        self,
+        task_id: str,
+        result: Any,
+        state: str,
+        traceback: Any = None,
+        request: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        stored = super()._store_result(task_id, result, state, traceback, request, **kwargs)
+
+        if state in states.READY_STATES:
+            with self._lock:
+                self.completed[task_id] = time.monotonic()
+
+        return stored
+
+
+class LoadTestError(Exception):
+    """Raised by load-test tasks that were told to fail."""
+
+
+class LoadProfile(NamedTuple):
+    """The mix of tasks to send to the worker."""
+
+    count: int = 1000
+    rate: float = 200.0
+    payload_size: int = 1024
+    async_ratio: float = 0.5
+    failure_rate: float = 0.0
+    task_time: float = 0.0
+    seed: int = 0
+    timeout: float = 300.0
+
+
+class LoadReport(NamedTuple):
+    """The measured behavior of the worker under load."""
+
+    submitted: int
+    succeeded: int
+    failed: int
+    elapsed: float
+    throughput: float
+    latency: Dict[str, float]
+    peak_rss: int
+    loop_lag: Dict[str, float]
+
+
+def create_app(**settings: Any) -> celery.Celery:
+    """Create a Celery app using the in-memory broker and backend, with the
+    tasks used by the load generator."""
+    app = celery.Celery(
+        "celery-aio-pool-loadtest",
+        broker=BROKER_URL,
+        backend=BACKEND,
+        set_as_current=False,
+    )
+    app.conf.update(worker_hijack_root_logger=False, **settings)
+
+    @app.task(name="loadtest.sync")
+    def sync_task(payload: str, duration: float, fail: bool) -> int:
+        time.sleep(duration)
+
+        if fail:
+            raise LoadTestError("Told to fail")
+
+        return len(payload)
+
+    @app.task(name="loadtest.async")
+    async def async_task(payload: str, duration: float, fail: bool) -> int:
+        await aio.sleep(duration)
+
+        if fail:
+            raise LoadTestError("Told to fail")
+
+        return len(payload)
+
+    return app
+
+
+def schedule(profile: LoadProfile) -> List[Tuple[float, str, bool]]:
+    """Work out when each task is sent (relative to the start of the run),
+    which task it is and whether it fails."""
+    rng = random.Random(profile.seed)
+    offset, planned = 0.0, []
+
+    for _ in range(profile.count):
+        offset += rng.expovariate(profile.rate)
+        name = "loadtest.async" if rng.random() < profile.async_ratio else "loadtest.sync"
+        planned.append((offset, name, rng.random() < profile.failure_rate))
+
+    return planned
+
+
+def percentile(ordered: Sequence[float], pct: float) -> float:
+    """Get the supplied percentile of the (sorted) values, by nearest
+    rank."""
+    if not ordered:
+        return 0.0
+
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))]
+
+
+def run_load(
+    profile: LoadProfile,
+    app: Optional[celery.Celery] = None,
+    loglevel: str = "CRITICAL",
+) -> LoadReport:
+    """Start a worker using `AsyncIOPool`, replay the supplied load
+    profile against it and report on how it coped."""
+    # The worker's consumer binds `build_tracer` when it's imported,
+    # so the tracer has to be patched before the worker is imported
+    assert patch_celery_tracer()
+
+    # Third-Party Imports
+    from celery.contrib.testing.worker import start_worker
+
+    app = app or create_app()
+    planned, payload = schedule(profile), "x" * profile.payload_size
+    submitted: Dict[str, float] = {}
+    lag_samples: List[float] = []
+    peak_rss = current_rss()
+    sampling = threading.Event()
+
+    MemoryBackend.completed.clear()
+
+    def sample() -> None:
+        nonlocal peak_rss
+
+        while not sampling.wait(0.05):
+            peak_rss = max(peak_rss, current_rss())
+
+            if AsyncIOPool.singleton is not None:
+                lag_samples.append(AsyncIOPool.singleton.loop_monitor.lag)
+
+    with start_worker(app, pool=AsyncIOPool, perform_ping_check=False, loglevel=loglevel):
+        sampler = threading.Thread(target=sample, name="celery-aio-pool-loadtest-sampler", daemon=True)
+        sampler.start()
+
+        started = time.monotonic()
+
+        for offset, name, fail in planned:
+            if (delay := started + offset - time.monotonic()) > 0:
+                time.sleep(delay)
+
+            # Tasks can finish before `send_task` has even returned, so
+            # they're timed from just before they're published
+            sent = time.monotonic()
+            submitted[app.send_task(name, (payload, profile.task_time, fail)).id] = sent
+
+        deadline = time.monotonic() + profile.timeout
+
+        while time.monotonic() < deadline:
+            with MemoryBackend._lock:
+                if submitted.keys() <= MemoryBackend.completed.keys():
+                    break
+
+            time.sleep(0.01)
+
+        # Tasks still running (after a timeout) keep completing while
+        # the worker stops, so the measurement is taken beforehand
+        with MemoryBackend._lock:
+            finished = {task_id: done for task_id, done in MemoryBackend.completed.items() if task_id in submitted}
+
+        sampling.set()
+        sampler.join()
+
+    backend = app.backend
+    latencies = sorted(done - submitted[task_id] for task_id, done in finished.items())
+    succeeded = sum(backend.get_state(task_id) == states.SUCCESS for task_id in finished)
+    elapsed = (max(finished.values()) - started) if finished else 0.0
+
+    return LoadReport(
+        submitted=len(submitted),
+        succeeded=succeeded,
+        failed=len(finished) - succeeded,
+        elapsed=elapsed,
+        throughput=len(finished) / elapsed if elapsed else 0.0,
+        latency={
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1] if latencies else 0.0,
+        },
+        peak_rss=peak_rss,
+        loop_lag={
+            "mean": sum(lag_samples) / len(lag_samples) if lag_samples else 0.0,
+            "max": AsyncIOPool.singleton.loop_monitor.max_lag if AsyncIOPool.singleton else 0.0,
+        },
+    )
+
+
+def benchmark_cache_hits(count: int = 20000) -> Dict[str, float]:
+    """Measure the mean time (in microseconds) it takes the worker pool to
+    run a coroutine that completes without suspending, with and without
+    eager start."""
+    pool = AsyncIOPool(1, app=create_app(), threads=True)
+    cache = {"key": "value"}
+    timings: Dict[str, float] = {}
+
+    async def cache_hit() -> str:
+        return cache["key"]
+
+    for eager in (False, True):
+        pool.set_eager_tasks(eager)
+        pool.run(cache_hit)
+
+        started = time.perf_counter()
+
+        for _ in range(count):
+            pool.run(cache_hit)
+
+        timings["eager" if eager else "scheduled"] = (time.perf_counter() - started) / count * 1e6
+
+    return timings
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run a load test from the command line."""
+    defaults = LoadProfile()
+    parser = argparse.ArgumentParser(
+        prog="python -m celery_aio_pool.loadtest",
+        description="Replay a mix of tasks against an AsyncIOPool worker using an in-memory broker and backend.",
+    )
+    parser.add_argument("--count", type=int, default=defaults.count, help="number of tasks to send")
+    parser.add_argument("--rate", type=float, default=defaults.rate, help="mean arrival rate, in tasks per second")
+    parser.add_argument("--payload-size", type=int, default=defaults.payload_size, help="task payload size, in bytes")
+    parser.add_argument("--async-ratio", type=float, default=defaults.async_ratio, help="fraction of async tasks")
+    parser.add_argument("--failure-rate", type=float, default=defaults.failure_rate, help="fraction of failing tasks")
+    parser.add_argument("--task-time", type=float, default=defaults.task_time, help="seconds each task takes")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="seed for the task mix and arrival times")
+    parser.add_argument("--timeout", type=float, default=defaults.timeout, help="seconds to wait for tasks to finish")
+    parser.add_argument("--eager-tasks", action="store_true", help="start coroutines eagerly")
+    parser.add_argument(
+        "--cache-hit-benchmark",
+        type=int,
+        metavar="COUNT",
+        help="instead of a load test, time COUNT cache-hit coroutines with and without eager start",
+    )
+    parser.add_argument("--loglevel", default="CRITICAL", help="worker log level")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+
+    args = vars(parser.parse_args(argv))
+    loglevel, as_json = args.pop("loglevel"), args.pop("json")
+    eager_tasks, cache_hits = args.pop("eager_tasks"), args.pop("cache_hit_benchmark")
+
+    if cache_hits:
+        timings = benchmark_cache_hits(cache_hits)
+        print(json.dumps(timings, indent=2) if as_json else "\n".join(
+            f"{mode + ':':<11} {micros:.1f}µs per task" for mode, micros in timings.items()
+        ))
+        return 0
+
+    report = run_load(LoadProfile(**args), app=create_app(aio_pool_eager_tasks=eager_tasks), loglevel=loglevel)
+
+    if as_json:
+        print(json.dumps(report._asdict(), indent=2))
+    else:
+        print(f"tasks:      {report.submitted} sent, {report.succeeded} succeeded, {report.failed} failed")
+        print(f"throughput: {report.throughput:.1f} tasks/s over {report.elapsed:.2f}s")
+        print("latency:    " + ", ".join(f"{key} {value * 1000:.2f}ms" for key, value in report.latency.items()))
+        print(f"peak RSS:   {report.peak_rss / 2**20:.1f} MiB")
+        print("loop lag:   " + ", ".join(f"{key} {value * 1000:.2f}ms" for key, value in report.loop_lag.items()))
+
+    return 0 if report.succeeded + report.failed == report.submitted else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Worker-local memoization of task results.
+
+Tasks declared with `memoize=True` (or `memoize=<seconds>`) have their
+results cached in the worker, keyed by their name and a hash of their
+arguments. While a result is cached, executions with the same arguments
+skip the task's body and go straight to the tracer's usual success path,
+so their results are still stored and their callbacks still applied.
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+)
+
+__all__ = (
+    "MISSING",
+    "MemoCache",
+)
+
+# Returned by `MemoCache.get` when nothing is cached for a key
+MISSING: Any = object()
+
+
+class MemoCache:
+    """An LRU cache of task results with per-entry expiry, bounded by its
+    number of entries and (optionally) their pickled size."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: float = 60.0,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+        self._lock = threading.Lock()
+        # key -> (expires at, value, size)
+        self._entries: OrderedDict[Hashable, Tuple[float, Any, int]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Get the result cached for the supplied key, or `MISSING`."""
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                self.stats["misses"] += 1
+                return MISSING
+
+            expires, value, size = entry
+
+            if expires <= time.monotonic():
+                del self._entries[key]
+                self.size -= size
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return MISSING
+
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+
+        return value
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> bool:
+        """Cache the supplied result for `ttl` seconds (or the cache's
+        default), evicting the least recently used results as needed."""
+        size = 0
+
+        # Results are only measured when the cache is bounded by size,
+        # and those that can't be measured aren't cached at all
+        if self.max_bytes is not None:
+            try:
+                size = len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+            except Exception:  # pylint: disable=broad-except
+                return False
+
+            if size > self.max_bytes:
+                return False
+
+        with self._lock:
+            if (previous := self._entries.pop(key, None)) is not None:
+                self.size -= previous[2]
+
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value, size)
+            self.size += size
+
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.size > self.max_bytes
+            ):
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.size -= evicted
+                self.stats["evictions"] += 1
+
+        return True
+
+    def clear(self) -> int:
+        """Drop every cached result and return how many there were."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self.size = 0
+
+        return count
+
+    def info(self) -> Dict[str, Any]:
+        """Get the cache's hit / miss / eviction counters and its current
+        number of entries and size."""
+        with self._lock:
+            return dict(self.stats, entries=len(self._entries), bytes=self.size)
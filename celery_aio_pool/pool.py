@@ -5,11 +5,13 @@ from __future__ import annotations
 
 # Standard Library Imports
 import asyncio as aio
+import concurrent.futures
 import inspect
 import os
 import sys
 import threading
 import time
+from contextvars import ContextVar
 from typing import (
     Any,
     Callable,
@@ -20,25 +22,68 @@ from typing import (
 )
 
 # Third-Party Imports
+import celery
 import celery.concurrency.base
 import celery.concurrency.solo
 import celery.signals
 from billiard.einfo import ExceptionInfo
 from billiard.exceptions import WorkerLostError
+from celery.app.events import Events
 from celery.exceptions import (
     WorkerShutdown,
     WorkerTerminate,
     reraise,
 )
+from celery.utils.imports import symbol_by_name
+from celery.utils.log import get_logger
+from celery.utils.time import maybe_timedelta
 
 # Package-Level Imports
+from celery_aio_pool.admission import (
+    AdmissionController,
+    LoopMonitor,
+)
+from celery_aio_pool.allocations import AllocationTracker
+from celery_aio_pool.claimcheck import ClaimCheck
+from celery_aio_pool.dedup import DedupIndex
+from celery_aio_pool.eager import eager_executor
+from celery_aio_pool.eagertasks import (
+    EAGER_TASK_FACTORY,
+    submit_eagerly,
+)
+from celery_aio_pool.events import BatchingEvents
+from celery_aio_pool.memoize import MemoCache
+from celery_aio_pool.process import (
+    call_task,
+    create_process_executor,
+    picklable,
+)
+from celery_aio_pool.profiler import LoopProfiler
+from celery_aio_pool.ratelimit import rate_limiters
+from celery_aio_pool.retry import LocalRetryScheduler
+from celery_aio_pool.sharding import (
+    LoopShards,
+    current_loop_shard,
+)
+from celery_aio_pool.singleflight import SingleFlight
 from celery_aio_pool.types import (
     AnyCallable,
     AnyCoroutine,
     AnyException,
+    TaskLabel,
+)
+from celery_aio_pool.warmup import warm_up
+
+# Imported for its side effect of registering the pool's
+# remote-control commands with Celery's control panel
+import celery_aio_pool.control  # noqa: F401  isort: skip
+
+__all__ = (
+    "AsyncIOPool",
+    "current_task_label",
 )
 
-__all__ = ("AsyncIOPool",)
+logger = get_logger(__name__)
 
 
 WorkerPoolInfo = Dict[
@@ -47,7 +92,11 @@ WorkerPoolInfo = Dict[
         Union[
             int,
             bool,
+            str,
+            float,
             Tuple[int, ...],
+            Dict[str, int],
+            Dict[str, Dict[str, Any]],
             aio.AbstractEventLoop,
         ]
     ],
@@ -69,11 +118,36 @@ if not callable(getattr(aio, "to_thread", None)):
     aio.to_thread = aio_to_thread_backport
 
 
+# The identity of the Celery task currently being traced. The tracer
+# sets this before handing the task's body to the pool, so anything
+# the pool schedules on the loop can be attributed to its task
+current_task_label: ContextVar[Optional[TaskLabel]] = ContextVar(
+    "celery_aio_pool_current_task_label",
+    default=None,
+)
+
+
 class AsyncIOPool(celery.concurrency.solo.TaskPool):
     """Custom asyncio Celery worker pool class."""
 
     loop: aio.AbstractEventLoop
     loop_runner: threading.Thread
+    profiler: LoopProfiler
+    allocations: AllocationTracker
+    retry_scheduler: LocalRetryScheduler
+    process_executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+    dedup: Optional[DedupIndex] = None
+    claim_check_expiry: Optional[concurrent.futures.Future] = None
+    admission: Optional[AdmissionController] = None
+    loop_monitor: LoopMonitor
+    integrated: bool = False
+    eager_tasks: bool = False
+    shards: Optional[LoopShards] = None
+    dispatcher: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    single_flight: SingleFlight
+    memo_cache: MemoCache
+    warmup: Optional[Dict[str, Any]] = None
+    _pump_timer: Optional[Any] = None
     singleton: Optional["AsyncIOPool"] = None
 
     def __new__(cls, *args: Any, **kwargs: Any) -> "AsyncIOPool":
@@ -117,6 +191,11 @@ class AsyncIOPool(celery.concurrency.solo.TaskPool):
         except RuntimeError:
             pass
 
+        # Celery only asks for a threaded pool when the worker's
+        # consumer *isn't* driven by an event loop (a kombu `Hub`),
+        # which is what the pool's integrated mode relies on
+        threaded = kwargs.get("threads", True)
+
         # Regardless of what the user specifies in the local
         # configuration, `threads` and `forking_enable` should
         # *always* be False when using `AsyncIOPool` as the
@@ -135,37 +214,333 @@ class AsyncIOPool(celery.concurrency.solo.TaskPool):
         )
 
         # ... perform the usual "housekeeping", ...
-        self.limit = 1
+        requested_limit, self.limit = self.limit, 1
         celery.signals.worker_process_init.send(sender=None)
 
         # ... create the pool's asyncio eventloop ...
         self.loop = aio.new_event_loop()
 
-        # ... and let it run in an instance-bound thread.
-        self.loop_runner = threading.Thread(
-            target=self.loop.run_forever,
-            name="celery-worker-async-loop",
-            daemon=True,
+        # Coroutines that finish without suspending (e.g. cache hits)
+        # can skip being scheduled as a `Task` if they're started
+        # eagerly, which has to be configured before the loop runs
+        self.set_eager_tasks(self.setting("aio_pool_eager_tasks", False))
+
+        # In integrated mode the loop is owned by the consumer's
+        # thread, which runs tasks on it directly and has its hub
+        # pump the loop in between messages, so that nothing has to
+        # cross a thread boundary on its way in or out of the pool
+        self.integrated = bool(self.setting("aio_pool_integrated_loop", False))
+
+        if self.integrated and threaded:
+            logger.warning(
+                "The worker's transport doesn't support an event loop, "
+                "so AsyncIOPool is falling back to a thread-bound loop"
+            )
+            self.integrated = False
+
+        if self.integrated:
+            self.loop_runner = threading.current_thread()
+        else:
+            # ... and let it run in an instance-bound thread.
+            self.loop_runner = threading.Thread(
+                target=self.loop.run_forever,
+                name="celery-worker-async-loop",
+                daemon=True,
+            )
+
+            self.loop_runner.start()
+
+        # Task executions can be spread over several loops, each
+        # running in a thread of its own (the pool's loop included)
+        if (loops := int(self.setting("aio_pool_loops", 1) or 1)) > 1:
+            if self.integrated:
+                logger.warning("AsyncIOPool runs a single event loop in integrated mode, ignoring aio_pool_loops")
+            else:
+                self.shards = LoopShards(
+                    self.loop,
+                    self.loop_runner,
+                    loops,
+                    strategy=self.setting("aio_pool_loop_assignment", "round-robin"),
+                    prepare=self._configure_loop,
+                )
+
+                # Tasks are traced in dispatcher threads rather than in
+                # the consumer's, so that (up to the worker's concurrency)
+                # several of them run at once, spread over the loops
+                self.limit = max(loops, int(requested_limit or 1))
+                self.dispatcher = concurrent.futures.ThreadPoolExecutor(
+                    self.limit,
+                    thread_name_prefix="celery-aio-dispatch",
+                )
+
+        # Sampling profiler for the loop-runner threads, idle until
+        # it's switched on by the `aio_profile` control command
+        self.profiler = LoopProfiler(
+            self.loop,
+            self.loop_runner,
+            interval=self.setting("aio_pool_profile_interval", 0.01),
+            output_dir=self.setting("aio_pool_profile_dir"),
+            other_loops=[(shard.loop, shard.thread) for shard in self.shards.shards[1:]] if self.shards else (),
+        )
+
+        # Sampled per-task allocation tracking, idle unless it's
+        # enabled in the app's configuration or switched on by the
+        # `aio_memory_profile` control command
+        self.allocations = AllocationTracker()
+
+        if self.setting("aio_pool_memory_profile", False):
+            self.allocations.start(
+                every=self.setting("aio_pool_memory_profile_every", 10),
+                nframes=self.setting("aio_pool_memory_profile_nframes", 25),
+            )
+
+        # Keep track of how long the loop is being blocked for (which
+        # is reported in the pool's stats) and, if the pool has been
+        # given a budget, use it (with the rest of the budget) to
+        # decide when tasks should be deferred or shed
+        self.loop_monitor = LoopMonitor(
+            self.loop,
+            interval=self.setting("aio_pool_loop_monitor_interval", 0.1),
+        )
+        self.loop_monitor.start()
+
+        admission_limits = {
+            "max_lag": self.setting("aio_pool_admission_max_lag"),
+            "max_in_flight": self.setting("aio_pool_admission_max_in_flight"),
+            "max_rss": self.setting("aio_pool_admission_max_rss"),
+        }
+
+        if any(limit is not None for limit in admission_limits.values()):
+            self.admission = AdmissionController(
+                self.loop_monitor,
+                max_defer=self.setting("aio_pool_admission_max_defer", 30.0),
+                sleep=self.sleep,
+                **admission_limits,
+            )
+
+        # Named limiters that tasks await before calling downstream
+        # services, optionally shared with the host's other workers
+        rate_limiters.configure_from_settings(
+            self.setting("aio_pool_rate_limits") or {},
+            directory=self.setting("aio_pool_rate_limit_dir"),
+        )
+
+        # Short retries of `LocalRetryTask`-based tasks are parked
+        # on the loop instead of being re-published to the broker
+        self.retry_scheduler = LocalRetryScheduler(
+            self.loop,
+            max_parked=self.setting("aio_pool_local_retry_max_parked", 1000),
+            max_delay=self.setting("aio_pool_local_retry_max_delay", 5.0),
+            backoff=self.setting("aio_pool_local_retry_backoff", 0.1),
+        )
+
+        # The pool is created before the worker's consumer, so if
+        # the app's events haven't been set up yet, having them set
+        # up by `BatchingEvents` ensures that the consumer's event
+        # dispatcher will batch task events
+        if self.setting("aio_pool_events_batching", False):
+            self._use_batching_events(self.app or celery.current_app)
+
+        # Redelivered tasks that already succeeded are detected by
+        # the dedup index, which starts looking them up in the
+        # result backend as soon as they're received
+        if self.setting("worker_deduplicate_successful_tasks", False):
+            self.dedup = DedupIndex(
+                self.loop,
+                maxlen=self.setting("aio_pool_dedup_maxlen", 50000),
+                expires=self.setting("aio_pool_dedup_expires", 10800),
+                bloom_capacity=self.setting("aio_pool_dedup_bloom_capacity"),
+                bloom_error_rate=self.setting("aio_pool_dedup_bloom_error_rate", 1e-6),
+                batch_size=self.setting("aio_pool_dedup_batch_size", 100),
+                batch_window=self.setting("aio_pool_dedup_batch_window", 0.005),
+                wait=self.wait_for,
+            )
+            celery.signals.task_received.connect(self._prefetch_redelivered, weak=False)
+
+        # Offloaded results are purged from the claim-check store
+        # once the results they belong to have expired, as are the
+        # arguments left behind by tasks that never ran to the end
+        # (e.g. because they were revoked)
+        results_expire = maybe_timedelta(self.setting("result_expires"))
+        arguments_expire = maybe_timedelta(self.setting("aio_pool_claim_check_args_expires", results_expire))
+
+        if (claim_check := ClaimCheck.from_app(self.app or celery.current_app)) and (
+            results_expire or arguments_expire
+        ):
+            self.claim_check_expiry = aio.run_coroutine_threadsafe(
+                claim_check.expire(
+                    results_expire and results_expire.total_seconds(),
+                    arguments_expire and arguments_expire.total_seconds(),
+                    interval=self.setting("aio_pool_claim_check_purge_interval"),
+                ),
+                self.loop,
+            )
+
+        # Identical executions of `single_flight` tasks are coalesced
+        # while one of them is running (and shortly after it's done)
+        self.single_flight = SingleFlight(
+            window=self.setting("aio_pool_single_flight_window", 1.0),
+            wait=self.wait_for,
+        )
+
+        # Results of `memoize` tasks are cached in the worker
+        self.memo_cache = MemoCache(
+            max_entries=self.setting("aio_pool_memoize_max_entries", 1024),
+            max_bytes=self.setting("aio_pool_memoize_max_bytes"),
+            ttl=self.setting("aio_pool_memoize_ttl", 60.0),
         )
 
-        self.loop_runner.start()
+        # Process-bound tasks are run in a process pool which is
+        # normally created on first use, unless it's meant to be
+        # warmed up before the worker starts accepting tasks
+        if self.setting("aio_pool_process_warm", False):
+            self.get_process_executor()
 
         # Set the new event loop as the "active" eventloop
         # in current thread / process
         aio.set_event_loop(self.loop)
 
+    def set_eager_tasks(self, enabled: bool) -> None:
+        """Enable or disable the eager start of coroutines submitted to the
+        pool's loop."""
+        self.eager_tasks = bool(enabled)
+
+        for loop in self.shards.loops if self.shards else (self.loop,):
+            if loop.is_running():
+                loop.call_soon_threadsafe(self._configure_loop, loop)
+            else:
+                self._configure_loop(loop)
+
+    def _configure_loop(self, loop: aio.AbstractEventLoop) -> None:
+        if EAGER_TASK_FACTORY is not None:
+            loop.set_task_factory(EAGER_TASK_FACTORY if self.eager_tasks else None)
+
+    def task_loop(self) -> aio.AbstractEventLoop:
+        """Get the loop that the task currently being traced was assigned
+        to, or the pool's own loop."""
+        shard = current_loop_shard.get()
+        return shard.loop if shard is not None else self.loop
+
+    @staticmethod
+    def _use_batching_events(app: celery.Celery) -> None:
+        events = app.__dict__.get("events")
+
+        if isinstance(events, BatchingEvents):
+            return
+
+        if events is not None or symbol_by_name(app.events_cls) is not Events:
+            logger.warning(
+                "The events of app %r are already set up, so task events won't be batched (create the app with "
+                'events="celery_aio_pool.events:BatchingEvents" instead)',
+                app.main,
+            )
+            return
+
+        app.events_cls = BatchingEvents
+
+    def setting(self, name: str, default: Any = None) -> Any:
+        """Look up the named setting in the configuration of the pool's
+        Celery app (or the current app if the pool wasn't given one)."""
+        return (self.app or celery.current_app).conf.get(name, default)
+
     def _get_info(self) -> WorkerPoolInfo:
         info = super()._get_info()
         info.update({
             "timeouts": (),
-            "max-concurrency": 1,
+            "max-concurrency": self.limit,
             "event-loop": str(self.loop),
+            "integrated-loop": self.integrated,
+            "eager-tasks": self.eager_tasks,
+            "loops": self.shards.stats() if self.shards else None,
+            "process-workers": (
+                self.process_executor._max_workers  # pylint: disable=protected-access
+                if self.process_executor
+                else 0
+            ),
+            "dedup": dict(self.dedup.stats) if self.dedup else None,
+            "single-flight": self.single_flight.info(),
+            "memoize": self.memo_cache.info(),
+            "warm-up": self.warmup,
+            "loop-lag": self.loop_monitor.lag if self.loop_monitor.active else None,
+            "admission": (
+                dict(self.admission.stats, in_flight=self.admission.in_flight)
+                if self.admission
+                else None
+            ),
+            "rate-limiters": rate_limiters.stats(),
             "max-tasks-per-child": None,
             "processes": (os.getpid(),),
             "put-guarded-by-semaphore": True,
         })
         return info
 
+    def owns_loop(self) -> bool:
+        """Check whether the calling thread can run the pool's loop itself,
+        i.e. the pool is in integrated mode and this is the consumer's
+        thread."""
+        return (
+            self.integrated
+            and threading.current_thread() is self.loop_runner
+            and not self.loop.is_running()
+        )
+
+    def wait_for(self, future: concurrent.futures.Future) -> Any:
+        """Wait for the result of the supplied future, running the pool's
+        loop in the meantime if the calling thread owns it."""
+        if self.owns_loop():
+            return self.loop.run_until_complete(aio.wrap_future(future, loop=self.loop))
+
+        return future.result()
+
+    def sleep(self, seconds: float) -> None:
+        """Block the calling thread for the supplied number of seconds,
+        running the pool's loop in the meantime if the calling thread
+        owns it."""
+        if self.owns_loop():
+            self.loop.run_until_complete(aio.sleep(seconds))
+        else:
+            time.sleep(seconds)
+
+    def pump(self) -> None:
+        """Run a single iteration of the pool's loop in the calling thread,
+        if it owns the loop."""
+        if self.owns_loop():
+            self.loop.call_soon(self.loop.stop)
+            self.loop.run_forever()
+
+    def register_with_event_loop(self, loop: Any) -> None:
+        """Have the consumer's hub pump the pool's loop while it's waiting
+        for messages (integrated mode only)."""
+        if not self.integrated:
+            return
+
+        if self._pump_timer is not None:
+            self._pump_timer.cancel()
+
+        self._pump_timer = loop.call_repeatedly(
+            self.setting("aio_pool_integrated_pump_interval", 0.01),
+            self.pump,
+        )
+
+        # Wake the hub up as soon as the loop has I/O to handle (or
+        # a callback is scheduled on it from another thread), rather
+        # than waiting for the next timed pump
+        selector = getattr(self.loop, "_selector", None)
+
+        if callable(getattr(selector, "fileno", None)) and selector.fileno() >= 0:
+            loop.add_reader(selector.fileno(), self.pump)
+
+    def _prefetch_redelivered(self, request: Any = None, **_: Any) -> None:
+        """Start looking up the state of redelivered tasks as soon as
+        they're received by the worker."""
+        if not (self.dedup and request and (request.delivery_info or {}).get("redelivered")):
+            return
+
+        task = request.task
+
+        if (task.acks_late or task.app.conf.task_acks_late) and task.backend.persistent:
+            self.dedup.prefetch(request.id, task.backend)
+
     def run(
         self,
         task_function: AnyCallable | AnyCoroutine,
@@ -204,14 +579,38 @@ class AsyncIOPool(celery.concurrency.solo.TaskPool):
         if not inspect.isawaitable(task_function):
             return task_function
 
+        # If the loop is being profiled, tag the coroutine with
+        # the task that scheduled it so that the profiler can
+        # attribute its samples correctly
+        if (
+            self.profiler.active
+            and inspect.iscoroutine(task_function)
+            and (label := current_task_label.get())
+            and self.profiler.wants(label)
+        ):
+            task_function = self.profiler.track(task_function, label)
+
         # At this point, we're guaranteed to have something
         # that's either an actual coroutine or some other kind
         # of `asyncio.Future` which means we need to throw it
         # onto the worker's thread-bound eventloop to be run
-        result: aio.Future = aio.run_coroutine_threadsafe(
-            task_function,
-            self.loop,
-        )
+        # (or, in integrated mode, run the loop ourselves)
+        if owned := self.owns_loop():
+            result = aio.ensure_future(task_function, loop=self.loop)
+        elif self.eager_tasks and EAGER_TASK_FACTORY is None and inspect.iscoroutine(task_function):
+            result = submit_eagerly(task_function, self.task_loop())
+        else:
+            result = aio.run_coroutine_threadsafe(
+                task_function,
+                self.task_loop(),
+            )
+
+        if self.admission:
+            self.admission.enter()
+            result.add_done_callback(lambda _: self.admission.exit())
+
+        if owned:
+            self.loop.run_until_complete(result)
 
         # Once the our future has been awaited, it will either
         # have raised an exception or returned a result. If it
@@ -232,9 +631,19 @@ class AsyncIOPool(celery.concurrency.solo.TaskPool):
         *args: Any,
         **kwargs: Any,
     ) -> Any:
-        """Run the supplied task in the pool's thread-bound async loop."""
+        """Run the supplied task in the pool's thread-bound async loop.
+
+        If no worker pool has been created in the current process
+        (i.e. the task is being run eagerly or called directly),
+        the task is run by the lightweight `eager_executor` instead
+        of spinning up a whole worker pool just to run it.
+        """
         if not (worker_pool := cls.singleton):
-            worker_pool = cls()
+            return eager_executor.run(
+                task_function,
+                *args,
+                **kwargs,
+            )
 
         return worker_pool.run(
             task_function,
@@ -242,8 +651,88 @@ class AsyncIOPool(celery.concurrency.solo.TaskPool):
             **kwargs,
         )
 
+    def get_process_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Get the pool's process pool, creating it if necessary."""
+        if self.process_executor is None:
+            self.process_executor = create_process_executor(
+                self.app or celery.current_app,
+                max_workers=self.setting("aio_pool_process_workers"),
+                start_method=self.setting("aio_pool_process_start_method"),
+                warm=self.setting("aio_pool_process_warm", False),
+            )
+
+        return self.process_executor
+
+    @classmethod
+    def run_in_process_pool(
+        cls,
+        task_name: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        request: dict[str, Any],
+    ) -> Any:
+        """Run the named task in the pool's process pool, blocking the
+        calling thread (but not the eventloop) until it's done.
+
+        If no worker pool has been created in the current process,
+        the task is simply run in the calling thread.
+        """
+        if not (worker_pool := cls.singleton):
+            return call_task(task_name, args, kwargs, request)
+
+        return worker_pool.wait_for(
+            worker_pool.get_process_executor().submit(
+                call_task,
+                task_name,
+                picklable(tuple(args)),
+                dict(zip(kwargs, picklable(tuple(kwargs.values())))),
+                request,
+            )
+        )
+
+    def on_start(self) -> None:
+        """Warm the pool up (if configured to) before the worker's
+        consumer starts taking on tasks."""
+        super().on_start()
+
+        if self.setting("aio_pool_warmup", False):
+            self.warmup = warm_up(
+                self.app or celery.current_app,
+                self.shards.loops if self.shards else (self.loop,),
+                threads=self.setting("aio_pool_warmup_threads"),
+                hooks=self.setting("aio_pool_warmup_hooks") or (),
+                timeout=self.setting("aio_pool_warmup_timeout", 30.0),
+                wait=self.wait_for,
+            )
+
+    def on_stop(self) -> None:
+        """Let dispatched tasks finish and hand any locally parked retries
+        back to the broker before the worker stops."""
+        if self.dispatcher is not None:
+            self.dispatcher.shutdown(wait=True)
+
+        self.retry_scheduler.flush()
+
     async def shutdown(self) -> None:
         """Shut down the worker pool."""
+        self.profiler.stop()
+        self.allocations.stop()
+        self.loop_monitor.stop()
+        self.retry_scheduler.flush()
+
+        if self.claim_check_expiry is not None:
+            self.claim_check_expiry.cancel()
+
+        if self.process_executor is not None:
+            # `cancel_futures` is only accepted as of Python 3.9
+            if sys.version_info >= (3, 9):
+                self.process_executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                self.process_executor.shutdown(wait=False)
+
+        if self.shards is not None:
+            self.shards.stop()
+
         if self.loop.is_running():
             self.loop.stop()
             await self.loop.shutdown_asyncgens()
@@ -261,9 +750,58 @@ class AsyncIOPool(celery.concurrency.solo.TaskPool):
 
     def join(self) -> None:
         """Join the loop-runner thread."""
-        self.loop_runner.join()
+        if not self.integrated:
+            self.loop_runner.join()
+
+    def _apply(
+        self,
+        function: AnyCallable | AnyCoroutine,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Call one of the functions handed to `on_apply`.
+
+        In integrated mode, synchronous functions (e.g. the task's
+        tracer) are called directly in the consumer's thread, so any
+        coroutines they hand to the pool are run on the same thread.
+        With several loops, they're called directly in the dispatcher
+        thread instead, which blocks on whichever loop the task is
+        assigned to.
+        """
+        if (
+            (self.integrated or self.dispatcher is not None)
+            and callable(function)
+            and not inspect.iscoroutinefunction(function)
+        ):
+            return function(*args, **kwargs)
+
+        return self.run(function, *args, **kwargs)
 
     def on_apply(
+        self,
+        target: AnyCallable | AnyCoroutine,
+        args: tuple[Any, ...] = tuple(),
+        kwargs: Optional[dict[str, Any]] = None,
+        **options: Any,
+    ) -> Any:
+        """Apply function within pool context.
+
+        With several loops, the function is applied in a dispatcher
+        thread and the consumer carries on without waiting for it.
+        """
+        if self.dispatcher is None:
+            return self._apply_job(target, args, kwargs, **options)
+
+        job = self.dispatcher.submit(self._apply_job, target, args, kwargs, **options)
+        job.add_done_callback(self._dispatched)
+        return job
+
+    @staticmethod
+    def _dispatched(job: concurrent.futures.Future) -> None:
+        if not job.cancelled() and (error := job.exception()) is not None:
+            logger.error("Dispatched task failed: %r", error, exc_info=error)
+
+    def _apply_job(
         self,
         target: AnyCallable | AnyCoroutine,
         args: tuple[Any, ...] = tuple(),
@@ -276,7 +814,7 @@ class AsyncIOPool(celery.concurrency.solo.TaskPool):
         monotonic: Callable[[], int] = time.monotonic,
         **_,
     ):
-        """Apply function within pool context."""
+        """Apply the function and its callbacks."""
         kwargs = kwargs or dict()
         propagate += (
             Exception,
@@ -285,14 +823,14 @@ class AsyncIOPool(celery.concurrency.solo.TaskPool):
         )
 
         if accept_callback:
-            self.run(
+            self._apply(
                 accept_callback,
                 pid or getpid(),
                 monotonic(),
             )
 
         try:
-            ret = self.run(
+            ret = self._apply(
                 target,
                 *args,
                 **kwargs,
@@ -308,9 +846,9 @@ class AsyncIOPool(celery.concurrency.solo.TaskPool):
                     sys.exc_info()[2],
                 )
             except WorkerLostError:
-                self.run(callback, ExceptionInfo())
+                self._apply(callback, ExceptionInfo())
         else:
-            self.run(callback, ret)
+            self._apply(callback, ret)
 
     def terminate_job(self, pid, signal=None):
         """Terminate the specified job."""
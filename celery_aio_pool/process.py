@@ -0,0 +1,127 @@
+"""Process-pool offloading for CPU-bound synchronous tasks.
+
+Tasks declared with `@app.task(executor="process")` are run in a
+`ProcessPoolExecutor` owned by the worker pool, so they don't hold
+the GIL while coroutines are being run on the pool's event loop.
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import concurrent.futures
+import multiprocessing
+import os
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Sequence,
+)
+
+# Third-Party Imports
+import celery
+from celery.app.trace import task_has_custom
+
+__all__ = (
+    "PROCESS_EXECUTOR",
+    "call_task",
+    "create_process_executor",
+    "picklable",
+    "request_snapshot",
+)
+
+
+# The `executor` task option value that routes a task to the process pool
+PROCESS_EXECUTOR = "process"
+
+# The request attributes made available to tasks run in the process pool
+REQUEST_FIELDS = (
+    "id",
+    "root_id",
+    "parent_id",
+    "group",
+    "retries",
+    "eta",
+    "expires",
+    "hostname",
+    "origin",
+    "headers",
+    "reply_to",
+    "timelimit",
+    "correlation_id",
+    "delivery_info",
+)
+
+_process_app: Optional[celery.Celery] = None
+
+
+def _initialize_process(app: celery.Celery, start_method: str) -> None:
+    """Bind the Celery app in a freshly started pool process."""
+    global _process_app  # pylint: disable=global-statement
+
+    _process_app = app
+    app.set_current()
+
+    # Processes that weren't forked from the worker have to
+    # import the task modules themselves
+    if start_method != "fork":
+        app.loader.import_default_modules()
+
+
+def _noop() -> int:
+    return os.getpid()
+
+
+def request_snapshot(request: Any) -> Dict[str, Any]:
+    """Capture the picklable subset of a task request that is sent along
+    with a task to the process pool."""
+    return {field: getattr(request, field, None) for field in REQUEST_FIELDS}
+
+
+def picklable(values: Sequence[Any]) -> Sequence[Any]:
+    """Copy any `memoryview` values (e.g. memory-mapped claim-check
+    payloads) into `bytes` so they can be sent to a pool process."""
+    return type(values)(bytes(value) if isinstance(value, memoryview) else value for value in values)
+
+
+def call_task(
+    name: str,
+    args: Sequence[Any],
+    kwargs: Dict[str, Any],
+    request: Dict[str, Any],
+) -> Any:
+    """Run the named task's body in the current (pool) process."""
+    task = (_process_app or celery.current_app).tasks[name]
+    fun = task if task_has_custom(task, "__call__") else task.run
+
+    task.push_request(request, args=args, kwargs=kwargs, called_directly=False)
+
+    try:
+        return fun(*args, **kwargs)
+    finally:
+        task.pop_request()
+
+
+def create_process_executor(
+    app: celery.Celery,
+    max_workers: Optional[int] = None,
+    start_method: Optional[str] = None,
+    warm: bool = False,
+) -> concurrent.futures.ProcessPoolExecutor:
+    """Create the process pool used to run process-bound tasks."""
+    context = multiprocessing.get_context(start_method)
+    executor = concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=context,
+        initializer=_initialize_process,
+        initargs=(app, context.get_start_method()),
+    )
+
+    # Pool processes are started on demand, so submitting a no-op
+    # for each of them up front gets them started (and their task
+    # modules imported) before the first real task arrives
+    if warm:
+        concurrent.futures.wait([executor.submit(_noop) for _ in range(executor._max_workers)])
+
+    return executor
@@ -0,0 +1,266 @@
+"""On-demand sampling profiler for the worker pool's event loop threads."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import collections
+import itertools
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+# Package-Level Imports
+from celery_aio_pool.types import (
+    AnyCoroutine,
+    TaskLabel,
+)
+
+__all__ = ("LoopProfiler",)
+
+
+ProfileFormat = str
+FrameKey = Tuple[str, str, int]
+
+FORMATS: Tuple[ProfileFormat, ...] = (
+    "collapsed",
+    "speedscope",
+)
+
+
+class LoopProfiler:
+    """Periodically sample the stack of an event loop's runner thread (and
+    those of any other loops it's given) and attribute each sample to the
+    Celery task running on the sampled loop at the time."""
+
+    def __init__(
+        self,
+        loop: aio.AbstractEventLoop,
+        thread: threading.Thread,
+        interval: float = 0.01,
+        output_dir: Optional[str] = None,
+        other_loops: Iterable[Tuple[aio.AbstractEventLoop, threading.Thread]] = (),
+    ) -> None:
+        self.loop = loop
+        self.thread = thread
+        self.loops: List[Tuple[aio.AbstractEventLoop, threading.Thread]] = [(loop, thread), *other_loops]
+        self.interval = interval
+        self.output_dir = output_dir or tempfile.gettempdir()
+
+        self.fmt: ProfileFormat = FORMATS[0]
+        self.every: int = 1
+        self.task_name: Optional[str] = None
+        self.deadline: Optional[float] = None
+        self.started_at: Optional[float] = None
+        self.output_path: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._labels: Dict[aio.Task, TaskLabel] = {}
+        self._seen: itertools.count = itertools.count()
+        self._decision: Tuple[Optional[str], bool] = (None, False)
+        self._stop: threading.Event = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._samples: collections.Counter = collections.Counter()
+
+    @property
+    def active(self) -> bool:
+        """Indicate whether the profiler is currently taking samples."""
+        return self._sampler is not None and self._sampler.is_alive()
+
+    def start(
+        self,
+        duration: Optional[float] = None,
+        task_name: Optional[str] = None,
+        every: int = 1,
+        fmt: ProfileFormat = "collapsed",
+    ) -> str:
+        """Start sampling the loop threads and return the path the profile
+        will be written to once sampling stops."""
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported profile format {fmt!r}, expected one of {FORMATS}")
+
+        with self._lock:
+            if self.active:
+                raise RuntimeError("The event loop profiler is already running")
+
+            self.fmt = fmt
+            self.task_name = task_name
+            self.every = max(1, int(every))
+            self.started_at = time.monotonic()
+            self.deadline = self.started_at + duration if duration else None
+
+            self._labels.clear()
+            self._samples.clear()
+            self._seen = itertools.count()
+            self._decision = (None, False)
+            self._stop.clear()
+
+            suffix = "speedscope.json" if fmt == "speedscope" else "folded"
+            self.output_path = os.path.join(
+                self.output_dir,
+                f"celery-aio-profile-{os.getpid()}-{int(time.time())}.{suffix}",
+            )
+
+            self._sampler = threading.Thread(
+                target=self._sample_forever,
+                name="celery-worker-async-profiler",
+                daemon=True,
+            )
+            self._sampler.start()
+
+        return self.output_path
+
+    def stop(self) -> Optional[str]:
+        """Stop sampling and wait for the profile to be written."""
+        sampler = self._sampler
+
+        if sampler is None:
+            return None
+
+        self._stop.set()
+
+        if sampler is not threading.current_thread():
+            sampler.join()
+
+        return self.output_path
+
+    def wants(self, label: TaskLabel) -> bool:
+        """Decide whether the supplied task execution should be profiled."""
+        if not self.active:
+            return False
+
+        if self.task_name is None:
+            return True
+
+        # A single task execution may schedule several coroutines
+        # (hooks, the body, etc.), so only the first one counts
+        # towards the 1-in-K selection
+        if self._decision[0] != label.id:
+            selected = label.name == self.task_name and next(self._seen) % self.every == 0
+            self._decision = (label.id, selected)
+
+        return self._decision[1]
+
+    async def track(self, coroutine: AnyCoroutine, label: TaskLabel) -> Any:
+        """Await the supplied coroutine, attributing any samples taken while
+        it is running to the supplied task label."""
+        current = aio.current_task()
+
+        # Coroutines started by `submit_eagerly` have no task until
+        # they first suspend, and samples are looked up by task, so
+        # give them one of their own
+        if current is None:
+            return await aio.get_running_loop().create_task(self.track(coroutine, label))
+
+        self._labels[current] = label
+
+        try:
+            return await coroutine
+        finally:
+            self._labels.pop(current, None)
+
+    def _sample_forever(self) -> None:
+        try:
+            while not self._stop.wait(self.interval):
+                if self.deadline is not None and time.monotonic() >= self.deadline:
+                    break
+
+                self._take_sample()
+        finally:
+            self._write()
+            self._sampler = None
+
+    def _take_sample(self) -> None:
+        frames = sys._current_frames()  # pylint: disable=protected-access
+
+        for index, (loop, thread) in enumerate(self.loops):
+            frame = frames.get(thread.ident)
+
+            if frame is None:
+                continue
+
+            label = self._labels.get(aio.current_task(loop))
+
+            if label is None and self.task_name is not None:
+                continue
+
+            stack: List[FrameKey] = []
+
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, frame.f_lineno))
+                frame = frame.f_back
+
+            stack.reverse()
+
+            if label:
+                root = f"{label.name}[{label.id}]"
+            else:
+                root = f"<event-loop-{index}>" if index else "<event-loop>"
+
+            self._samples[(root, tuple(stack))] += 1
+
+    def _write(self) -> None:
+        if not self.output_path:
+            return
+
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        with open(self.output_path, "w", encoding="utf-8") as output:
+            if self.fmt == "speedscope":
+                json.dump(self._speedscope(), output)
+            else:
+                output.writelines(self._collapsed())
+
+    def _collapsed(self) -> List[str]:
+        lines = []
+
+        for (root, stack), count in sorted(self._samples.items()):
+            frames = ";".join(f"{name} ({os.path.basename(path)}:{line})" for name, path, line in stack)
+            lines.append(f"{root};{frames} {count}\n")
+
+        return lines
+
+    def _speedscope(self) -> Dict[str, Any]:
+        frames: Dict[FrameKey, int] = {}
+        profiles: Dict[str, Dict[str, Any]] = {}
+
+        for (root, stack), count in self._samples.items():
+            profile = profiles.setdefault(
+                root,
+                {
+                    "type": "sampled",
+                    "name": root,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": 0,
+                    "samples": [],
+                    "weights": [],
+                },
+            )
+
+            indices = [frames.setdefault((name, path, line), len(frames)) for name, path, line in stack]
+            profile["samples"].append(indices)
+            profile["weights"].append(count * self.interval)
+            profile["endValue"] += count * self.interval
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "exporter": "celery-aio-pool",
+            "shared": {
+                "frames": [{"name": name, "file": path, "line": line} for name, path, line in frames],
+            },
+            "profiles": list(profiles.values()),
+        }
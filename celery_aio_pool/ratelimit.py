@@ -0,0 +1,261 @@
+"""Named rate limiters for the downstream calls made by tasks.
+
+Celery's own `rate_limit` delays the dispatch of each task type, but
+the limits that usually matter for coroutine tasks are on the services
+they call ("at most 50 requests per second to vendor X, across every
+task in this worker"). Tasks await the named limiters in
+`rate_limiters` before making such calls:
+
+    async with limiter("vendor-x"):
+        await client.get(...)
+
+Limiters are configured by the worker pool from `aio_pool_rate_limits`.
+They implement the generic cell rate algorithm (a token bucket that
+allows bursts of up to `capacity` calls, or a leaky bucket when
+`capacity` is 1). Waiting for a limiter never blocks the event loop.
+Limiters declared as `shared` keep their state in a memory-mapped file,
+so every worker process on the host draws from the same budget.
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import contextlib
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Union,
+)
+
+# Third-Party Imports
+from celery.utils.time import rate as parse_rate
+
+__all__ = (
+    "RateLimiter",
+    "RateLimiterRegistry",
+    "limiter",
+    "rate_limiters",
+)
+
+Rate = Union[str, int, float]
+
+_STATE = struct.Struct("d")
+
+
+class _SharedState:
+    """A float shared between processes through a memory-mapped file,
+    guarded by an exclusive file lock."""
+
+    def __init__(self, path: str) -> None:
+        # Standard Library Imports
+        import fcntl  # not available on Windows
+
+        self._flock = fcntl.flock
+        self._locked, self._unlocked = fcntl.LOCK_EX, fcntl.LOCK_UN
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        if os.fstat(self._fd).st_size < _STATE.size:
+            os.ftruncate(self._fd, _STATE.size)
+
+        self._map = mmap.mmap(self._fd, _STATE.size)
+
+    @contextlib.contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the state's file lock."""
+        self._flock(self._fd, self._locked)
+
+        try:
+            yield
+        finally:
+            self._flock(self._fd, self._unlocked)
+
+    def load(self) -> float:
+        """Read the shared value."""
+        return _STATE.unpack_from(self._map)[0]
+
+    def store(self, value: float) -> None:
+        """Write the shared value."""
+        _STATE.pack_into(self._map, 0, value)
+
+    def close(self) -> None:
+        """Unmap and close the state's file."""
+        self._map.close()
+        os.close(self._fd)
+
+
+class RateLimiter:
+    """Allow calls at a sustained `rate` (per second), with bursts of up to
+    `capacity` calls."""
+
+    def __init__(
+        self,
+        name: str,
+        rate: Rate,
+        capacity: float = 1.0,
+        shared_path: Optional[str] = None,
+    ) -> None:
+        per_second = parse_rate(rate)
+
+        if per_second <= 0:
+            raise ValueError(f"Rate limiter {name!r} needs a positive rate, got {rate!r}")
+
+        self.name = name
+        self.rate = per_second
+        self.capacity = max(1.0, float(capacity))
+        self.interval = 1.0 / per_second
+        self.stats: Dict[str, Any] = {"acquired": 0, "delayed": 0, "waited": 0.0}
+
+        self._lock = threading.Lock()
+        self._shared = _SharedState(shared_path) if shared_path else None
+
+        # The "theoretical arrival time" of the next call, i.e. when
+        # the bucket would be empty again if nothing else arrived
+        self._tat: float = 0.0
+
+    @property
+    def shared(self) -> bool:
+        """Indicate whether the limiter's budget is shared between
+        processes."""
+        return self._shared is not None
+
+    def reserve(self, tokens: float = 1.0, commit: bool = True) -> float:
+        """Reserve the supplied number of tokens and get how long the caller
+        has to wait before using them.
+
+        With `commit=False`, nothing is reserved unless the tokens
+        are available right away.
+        """
+        cost = tokens * self.interval
+
+        with self._lock, (self._shared.locked() if self._shared else contextlib.nullcontext()):
+            now = time.monotonic()
+
+            # Shared state outlives the processes (and possibly the
+            # boot) whose monotonic clocks it was written with, so it's
+            # kept in wall-clock time and converted when it's used
+            offset = time.time() - now if self._shared else 0.0
+
+            tat = max(self._shared.load() - offset if self._shared else self._tat, now)
+            delay = max(0.0, tat + cost - self.capacity * self.interval - now)
+
+            if delay and not commit:
+                return delay
+
+            if self._shared:
+                self._shared.store(tat + cost + offset)
+            else:
+                self._tat = tat + cost
+
+            self.stats["acquired"] += 1
+
+            if delay:
+                self.stats["delayed"] += 1
+                self.stats["waited"] += delay
+
+        return delay
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait (without blocking the event loop) until the supplied number
+        of tokens may be used."""
+        if delay := self.reserve(tokens):
+            await aio.sleep(delay)
+
+    def acquire_sync(self, tokens: float = 1.0) -> None:
+        """Block the calling thread until the supplied number of tokens may
+        be used (for synchronous tasks)."""
+        if delay := self.reserve(tokens):
+            time.sleep(delay)
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take the supplied number of tokens if they're available right
+        away."""
+        return not self.reserve(tokens, commit=False)
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        return None
+
+    def close(self) -> None:
+        """Release the limiter's shared state, if it has any."""
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+
+class RateLimiterRegistry:
+    """The named rate limiters available to tasks."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._limiters: Dict[str, RateLimiter] = {}
+
+    def configure(
+        self,
+        name: str,
+        rate: Rate,
+        capacity: float = 1.0,
+        shared: bool = False,
+        directory: Optional[str] = None,
+    ) -> RateLimiter:
+        """Create (or replace) the named limiter."""
+        shared_path = None
+
+        if shared:
+            directory = directory or ("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir())
+            shared_path = os.path.join(directory, f"celery-aio-ratelimit-{re.sub(r'[^A-Za-z0-9_.-]', '_', name)}")
+
+        limiter = RateLimiter(name, rate, capacity=capacity, shared_path=shared_path)
+
+        with self._lock:
+            previous, self._limiters[name] = self._limiters.get(name), limiter
+
+        if previous is not None:
+            previous.close()
+
+        return limiter
+
+    def configure_from_settings(self, limits: Mapping[str, Any], directory: Optional[str] = None) -> None:
+        """Create the limiters described by the supplied mapping of names to
+        either rates (e.g. `"50/s"`) or keyword arguments for
+        `configure`."""
+        for name, spec in limits.items():
+            options = dict(spec) if isinstance(spec, Mapping) else {"rate": spec}
+            options.setdefault("directory", directory)
+            self.configure(name, **options)
+
+    def get(self, name: str) -> RateLimiter:
+        """Get the named limiter."""
+        try:
+            return self._limiters[name]
+        except KeyError:
+            raise KeyError(f"No rate limiter named {name!r} has been configured") from None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._limiters
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the usage statistics of every limiter."""
+        return {name: dict(limiter.stats) for name, limiter in self._limiters.items()}
+
+
+rate_limiters = RateLimiterRegistry()
+
+
+def limiter(name: str) -> RateLimiter:
+    """Get the named rate limiter from the worker's registry."""
+    return rate_limiters.get(name)
@@ -0,0 +1,256 @@
+"""Worker-local scheduling of short task retries.
+
+`Task.retry` normally re-publishes the task to the broker with an
+ETA, which the worker then has to fetch again. For tasks based on
+`LocalRetryTask`, short retries are instead parked on the worker
+pool's event loop and re-run in the same worker once their countdown
+expires. Retries that are too far in the future, that would exceed the
+cap on parked retries, or that are still parked when the worker shuts
+down go through the broker as usual.
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import random
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+)
+
+# Third-Party Imports
+import celery
+import celery.signals
+from celery.app.task import Context
+from celery.exceptions import Retry
+from celery.utils.log import get_logger
+from celery.worker import state as worker_state
+
+__all__ = (
+    "LocalRetry",
+    "LocalRetryScheduler",
+    "LocalRetryTask",
+)
+
+logger = get_logger(__name__)
+
+
+class LocalRetry(Retry):
+    """The task is to be retried locally by the worker pool."""
+
+
+class LocalRetryScheduler:
+    """Park retries on the event loop until their countdown expires."""
+
+    def __init__(
+        self,
+        loop: aio.AbstractEventLoop,
+        max_parked: int = 1000,
+        max_delay: float = 5.0,
+        backoff: float = 0.1,
+    ) -> None:
+        self.loop = loop
+        self.max_parked = max_parked
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.accepting = True
+
+        self._lock = threading.Lock()
+        self._tracers: Dict[str, Any] = {}
+        self._parked: Dict[str, Tuple[aio.Handle, float, celery.canvas.Signature]] = {}
+
+    def countdown(self, retries: int) -> float:
+        """Get a jittered, exponentially increasing countdown for the
+        supplied retry attempt."""
+        return random.uniform(0, min(self.max_delay, self.backoff * 2**retries))
+
+    def park(
+        self,
+        task: celery.Task,
+        signature: celery.canvas.Signature,
+        request: Dict[str, Any],
+        countdown: float,
+    ) -> bool:
+        """Schedule the supplied retry to be run locally, returning `False`
+        if it should go through the broker instead."""
+        with self._lock:
+            if not self.accepting or countdown > self.max_delay or len(self._parked) >= self.max_parked:
+                return False
+
+            task_id = request["id"]
+            handle = self.loop.call_soon_threadsafe(
+                self._schedule,
+                task_id,
+                task,
+                signature,
+                request,
+                countdown,
+            )
+            self._parked[task_id] = (handle, time.monotonic() + countdown, signature)
+
+        return True
+
+    def _schedule(
+        self,
+        task_id: str,
+        task: celery.Task,
+        signature: celery.canvas.Signature,
+        request: Dict[str, Any],
+        countdown: float,
+    ) -> None:
+        with self._lock:
+            if task_id not in self._parked:
+                return
+
+            handle = self.loop.call_later(countdown, self._fire, task_id, task, signature, request)
+            self._parked[task_id] = (handle, self._parked[task_id][1], signature)
+
+    def _fire(
+        self,
+        task_id: str,
+        task: celery.Task,
+        signature: celery.canvas.Signature,
+        request: Dict[str, Any],
+    ) -> None:
+        with self._lock:
+            if self._parked.pop(task_id, None) is None:
+                return
+
+        # The tracer is synchronous (it blocks on the event loop
+        # itself), so the retry has to be traced in another thread
+        self.loop.create_task(aio.to_thread(self._run, task_id, task, signature, request))
+
+    def _run(
+        self,
+        task_id: str,
+        task: celery.Task,
+        signature: celery.canvas.Signature,
+        request: Dict[str, Any],
+    ) -> Any:
+        # Parked retries never go back through the consumer, which
+        # is where revoked tasks are normally caught, so the worker's
+        # revoked task ids have to be checked here instead
+        if task_id in worker_state.revoked:
+            logger.info("Discarding revoked retry of task %s", task_id)
+            context = Context(request)
+            task.backend.mark_as_revoked(
+                task_id,
+                "revoked",
+                request=context,
+                store_result=not task.ignore_result or task.store_errors_even_if_ignored,
+            )
+            celery.signals.task_revoked.send(
+                sender=task,
+                request=context,
+                terminated=False,
+                signum=None,
+                expired=False,
+            )
+            return None
+
+        return self._tracer(task, request.get("hostname"))(task_id, signature.args, signature.kwargs, request)
+
+    def _tracer(self, task: celery.Task, hostname: Optional[str]) -> Any:
+        if (tracer := self._tracers.get(task.name)) is None:
+            # Package-Level Imports
+            from celery_aio_pool.tracer import build_async_tracer
+
+            tracer = self._tracers[task.name] = build_async_tracer(
+                task.name,
+                task,
+                app=task.app,
+                hostname=hostname,
+            )
+
+        return tracer
+
+    def flush(self) -> int:
+        """Stop accepting retries and re-publish any parked ones to the
+        broker, returning the number of retries re-published."""
+        with self._lock:
+            self.accepting = False
+            parked, self._parked = self._parked, {}
+
+        for task_id, (handle, due, signature) in parked.items():
+            handle.cancel()
+
+            try:
+                signature.apply_async(countdown=max(0.0, due - time.monotonic()))
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("Could not re-publish parked retry of task %s: %r", task_id, exc, exc_info=True)
+
+        return len(parked)
+
+
+class LocalRetryTask(celery.Task):
+    """Task base class whose short retries are run by the worker pool
+    instead of being re-published to the broker.
+
+    Use it with `@app.task(base=LocalRetryTask, bind=True)`; calls to
+    `self.retry` without an explicit `countdown` or `eta` back off
+    exponentially (with jitter) from `aio_pool_local_retry_backoff`.
+    """
+
+    def retry(
+        self,
+        args: Any = None,
+        kwargs: Any = None,
+        exc: Optional[BaseException] = None,
+        throw: bool = True,
+        eta: Any = None,
+        countdown: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        **options: Any,
+    ) -> Any:
+        """Retry the task, locally if possible."""
+        # Package-Level Imports
+        from celery_aio_pool.pool import AsyncIOPool
+
+        request = self.request
+        retries = request.retries + 1
+        limit = self.max_retries if max_retries is None else max_retries
+        scheduler = AsyncIOPool.singleton and AsyncIOPool.singleton.retry_scheduler
+
+        if (
+            not scheduler
+            or eta is not None
+            or request.is_eager
+            or request.called_directly
+            or (limit is not None and retries > limit)
+        ):
+            return super().retry(args, kwargs, exc, throw, eta, countdown, max_retries, **options)
+
+        if countdown is None:
+            countdown = scheduler.countdown(request.retries)
+
+        signature = self.signature_from_request(
+            request,
+            args,
+            kwargs,
+            countdown=countdown,
+            retries=retries,
+            **options,
+        )
+        retried_request = dict(
+            vars(request),
+            args=signature.args,
+            kwargs=signature.kwargs,
+            retries=retries,
+            eta=None,
+        )
+
+        if not scheduler.park(self, signature, retried_request, countdown):
+            return super().retry(args, kwargs, exc, throw, eta, countdown, max_retries, **options)
+
+        ret = LocalRetry(exc=exc, when=countdown, sig=signature)
+
+        if throw:
+            raise ret
+
+        return ret
@@ -0,0 +1,155 @@
+"""Several event loops per worker process.
+
+With a single loop, every coroutine callback in the worker (TLS,
+parsing, protocol framing, ...) runs on one thread. `LoopShards` runs
+additional loops in threads of their own and assigns each task
+execution to one of them. A task's hooks and body all run on the loop
+it's assigned to, which is published to the pool through the
+`current_loop_shard` context variable.
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import hashlib
+import itertools
+import threading
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+__all__ = (
+    "ASSIGNMENT_STRATEGIES",
+    "LoopShard",
+    "LoopShards",
+    "current_loop_shard",
+)
+
+ASSIGNMENT_STRATEGIES: Tuple[str, ...] = (
+    "round-robin",
+    "least-loaded",
+    "hash",
+)
+
+# The loop that the Celery task currently being traced was assigned to
+current_loop_shard: ContextVar[Optional["LoopShard"]] = ContextVar(
+    "celery_aio_pool_current_loop_shard",
+    default=None,
+)
+
+
+class LoopShard:
+    """An event loop and the thread it runs in."""
+
+    __slots__ = ("index", "loop", "thread", "in_flight", "assigned")
+
+    def __init__(self, index: int, loop: aio.AbstractEventLoop, thread: threading.Thread) -> None:
+        self.index = index
+        self.loop = loop
+        self.thread = thread
+        self.in_flight: int = 0
+        self.assigned: int = 0
+
+
+class LoopShards:
+    """A fixed set of event loops that task executions are spread over.
+
+    The pool's own loop is always the first shard. Tasks are assigned
+    in turn (`round-robin`), to the shard running the fewest tasks
+    (`least-loaded`) or by rendezvous hashing of a key (`hash`), so
+    that tasks sharing a key always run on the same loop.
+    """
+
+    def __init__(
+        self,
+        primary: aio.AbstractEventLoop,
+        primary_thread: threading.Thread,
+        count: int,
+        strategy: str = "round-robin",
+        prepare: Optional[Callable[[aio.AbstractEventLoop], Any]] = None,
+    ) -> None:
+        if strategy not in ASSIGNMENT_STRATEGIES:
+            raise ValueError(f"Unsupported loop assignment {strategy!r}, expected one of {ASSIGNMENT_STRATEGIES}")
+
+        self.strategy = strategy
+        self.shards: List[LoopShard] = [LoopShard(0, primary, primary_thread)]
+
+        for index in range(1, max(1, int(count))):
+            loop = aio.new_event_loop()
+
+            if prepare is not None:
+                prepare(loop)
+
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name=f"celery-worker-async-loop-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self.shards.append(LoopShard(index, loop, thread))
+
+        self._lock = threading.Lock()
+        self._turns = itertools.cycle(self.shards)
+
+    @property
+    def loops(self) -> List[aio.AbstractEventLoop]:
+        """Get every shard's event loop."""
+        return [shard.loop for shard in self.shards]
+
+    def _hash(self, key: str, shard: LoopShard) -> int:
+        digest = hashlib.blake2b(f"{shard.index}:{key}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+    def acquire(self, key: Optional[str] = None) -> LoopShard:
+        """Assign a task execution (optionally identified by a routing key)
+        to a shard."""
+        with self._lock:
+            if self.strategy == "hash" and key is not None:
+                shard = max(self.shards, key=lambda candidate: self._hash(key, candidate))
+            elif self.strategy == "least-loaded":
+                shard = min(self.shards, key=lambda candidate: (candidate.in_flight, candidate.assigned))
+            else:
+                shard = next(self._turns)
+
+            shard.in_flight += 1
+            shard.assigned += 1
+
+        return shard
+
+    def release(self, shard: LoopShard) -> None:
+        """Record that a task execution assigned to the shard has
+        finished."""
+        with self._lock:
+            shard.in_flight -= 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Get the number of tasks running on, and assigned to, each
+        shard."""
+        return {
+            str(shard.index): {"in_flight": shard.in_flight, "assigned": shard.assigned}
+            for shard in self.shards
+        }
+
+    def stop(self) -> None:
+        """Stop (and close) the event loops of every shard but the primary
+        one."""
+        for shard in self.shards[1:]:
+            if shard.loop.is_running():
+                shard.loop.call_soon_threadsafe(shard.loop.stop)
+
+        for shard in self.shards[1:]:
+            if shard.thread is not threading.current_thread():
+                shard.thread.join(timeout=5)
+
+            # A loop can't be closed while it's still running, so any
+            # shard whose thread didn't stop in time is left as it is
+            if not shard.thread.is_alive() and not shard.loop.is_closed():
+                shard.loop.close()
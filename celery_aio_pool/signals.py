@@ -0,0 +1,131 @@
+"""Dispatch of Celery signals to coroutine (`async def`) receivers.
+
+Celery calls signal receivers synchronously, so an `async def`
+receiver only ever returns an un-awaited coroutine. The dispatcher
+defined here sends signals as usual and then awaits any coroutines
+returned by the receivers concurrently on the worker pool's event
+loop, either before the task continues or in the background.
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import concurrent.futures
+import inspect
+import threading
+from typing import (
+    Any,
+    Collection,
+    List,
+    Set,
+    Tuple,
+    Union,
+)
+
+# Third-Party Imports
+import celery
+from celery.utils.dispatch.signal import Signal
+from celery.utils.log import get_logger
+
+# Package-Level Imports
+from celery_aio_pool.types import AnyCallable
+
+__all__ = ("AsyncSignalDispatcher",)
+
+logger = get_logger(__name__)
+
+Responses = List[Tuple[AnyCallable, Any]]
+
+
+class AsyncSignalDispatcher:
+    """Send Celery signals and await the coroutines returned by `async def`
+    receivers on the worker pool's event loop."""
+
+    def __init__(
+        self,
+        background: Union[bool, Collection[str]] = False,
+        max_background: int = 100,
+    ) -> None:
+        self.background = background
+        self.max_background = max_background
+
+        self._lock = threading.Lock()
+        self._pending: Set[concurrent.futures.Future] = set()
+
+    @classmethod
+    def from_app(cls, app: celery.Celery) -> "AsyncSignalDispatcher":
+        """Get the signal dispatcher configured for the supplied app."""
+        if (dispatcher := getattr(app, "_aio_pool_signal_dispatcher", None)) is None:
+            dispatcher = app._aio_pool_signal_dispatcher = cls(
+                background=app.conf.get("aio_pool_signals_background", False),
+                max_background=app.conf.get("aio_pool_signals_max_background", 100),
+            )
+
+        return dispatcher
+
+    def runs_in_background(self, signal: Signal) -> bool:
+        """Check whether the async receivers of the supplied signal are run
+        off the task's critical path."""
+        if isinstance(self.background, bool):
+            return self.background
+
+        return signal.name in self.background
+
+    def send(self, signal: Signal, sender: Any, **named: Any) -> Responses:
+        """Send the supplied signal and await any coroutines returned by its
+        receivers."""
+        responses = signal.send(sender=sender, **named)
+        pending = [(receiver, response) for receiver, response in responses if inspect.isawaitable(response)]
+
+        if not pending:
+            return responses
+
+        # Package-Level Imports
+        from celery_aio_pool.pool import AsyncIOPool
+
+        if (
+            self.runs_in_background(signal)
+            and (worker_pool := AsyncIOPool.singleton)
+            and self._submit(worker_pool.loop, pending)
+        ):
+            return responses
+
+        results = dict(
+            zip(
+                (id(response) for _, response in pending),
+                AsyncIOPool.run_in_pool(self._gather, pending),
+            )
+        )
+
+        return [(receiver, results.get(id(response), response)) for receiver, response in responses]
+
+    def _submit(self, loop: aio.AbstractEventLoop, pending: Responses) -> bool:
+        with self._lock:
+            # If too many receivers are already running in the
+            # background, await these ones inline instead, which
+            # slows down the task but bounds the amount of work
+            # that can pile up on the loop
+            if len(self._pending) >= self.max_background:
+                return False
+
+            future = aio.run_coroutine_threadsafe(self._gather(pending), loop)
+            self._pending.add(future)
+
+        future.add_done_callback(self._discard)
+        return True
+
+    def _discard(self, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    @staticmethod
+    async def _gather(pending: Responses) -> List[Any]:
+        results = await aio.gather(*(response for _, response in pending), return_exceptions=True)
+
+        for (receiver, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                logger.error("Signal handler %r raised: %r", receiver, result, exc_info=result)
+
+        return results
@@ -0,0 +1,167 @@
+"""Single-flight coalescing of identical task executions.
+
+Tasks declared with `single_flight=True` are keyed by their name and a
+hash of their arguments (or by whatever their `single_flight` callable
+returns for them). The first execution of a key runs the task's body;
+identical executions that overlap it, or that start shortly after it
+has finished, share its result, which the tracer then stores under
+each of their own task ids.
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import collections
+import concurrent.futures
+import hashlib
+import json
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# Third-Party Imports
+from celery.exceptions import (
+    Ignore,
+    Reject,
+    Retry,
+)
+
+__all__ = (
+    "SingleFlight",
+    "flight_key",
+)
+
+# Outcomes that belong to the execution that raised them, and so
+# can't be shared with the executions coalesced into it
+_UNSHAREABLE = (Ignore, Reject, Retry)
+
+
+def flight_key(
+    name: str,
+    single_flight: Any,
+    args: Sequence[Any],
+    kwargs: Mapping[str, Any],
+) -> Hashable:
+    """Get the key that identical executions of the named task share.
+
+    If the task's `single_flight` option is callable, it's called with
+    the task's arguments to get the key. Otherwise, the key is a hash
+    of the (JSON-encoded) arguments.
+    """
+    if callable(single_flight):
+        return name, single_flight(*args, **kwargs)
+
+    encoded = json.dumps([list(args), kwargs], sort_keys=True, default=repr)
+    return name, hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+class _Flight:
+    """A running or finished execution shared by identical ones."""
+
+    __slots__ = ("future", "finished")
+
+    def __init__(self) -> None:
+        self.future: concurrent.futures.Future = concurrent.futures.Future()
+        self.finished: Optional[float] = None
+
+
+class SingleFlight:
+    """Registry of in-flight executions, keyed by `flight_key`.
+
+    Executions share the result of an identical one while it's running
+    and for `window` seconds after it has finished, but never longer.
+    """
+
+    def __init__(
+        self,
+        window: float = 1.0,
+        wait: Callable[[concurrent.futures.Future], Any] = concurrent.futures.Future.result,
+    ) -> None:
+        self.window = max(0.0, float(window))
+        self.wait = wait
+        self.stats: Dict[str, int] = {"executed": 0, "coalesced": 0}
+
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        # Finished flights, in the order they finished (and so
+        # the order their windows end in)
+        self._finished: Deque[Tuple[Hashable, _Flight]] = collections.deque()
+
+    def _stale(self, flight: _Flight, now: float) -> bool:
+        return flight.finished is not None and now - flight.finished > self.window
+
+    def _prune(self, now: float) -> None:
+        while self._finished and self._stale(self._finished[0][1], now):
+            key, flight = self._finished.popleft()
+
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def _finish(self, key: Hashable, flight: _Flight) -> None:
+        with self._lock:
+            flight.finished = time.monotonic()
+
+            if not self.window:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            else:
+                self._finished.append((key, flight))
+
+    def run(self, key: Hashable, execute: Callable[[], Any]) -> Any:
+        """Execute the supplied task, or wait for the identical execution
+        it overlaps (or that finished less than `window` seconds ago) and
+        return that execution's result."""
+        now = time.monotonic()
+
+        with self._lock:
+            # Finished flights are dropped once they're past their
+            # window, so that later executions run the task themselves
+            # rather than get an outdated result
+            self._prune(now)
+            flight = self._flights.get(key)
+
+            if leader := flight is None:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            try:
+                value = self.wait(flight.future)
+            except _UNSHAREABLE:
+                return execute()
+
+            with self._lock:
+                self.stats["coalesced"] += 1
+
+            return value
+
+        with self._lock:
+            self.stats["executed"] += 1
+
+        try:
+            value = execute()
+        except BaseException as exc:
+            flight.future.set_exception(exc)
+            raise
+        else:
+            flight.future.set_result(value)
+        finally:
+            self._finish(key, flight)
+
+        return value
+
+    def info(self) -> Dict[str, int]:
+        """Get the number of executions run and coalesced so far, and the
+        number of flights being tracked."""
+        with self._lock:
+            return dict(self.stats, flights=len(self._flights))
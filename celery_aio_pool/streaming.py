@@ -0,0 +1,112 @@
+"""Incremental result publishing for async generator tasks.
+
+Each chunk yielded by an `async def` task that uses `yield` is stored
+in the result backend as soon as it's produced, under an id derived
+from the task's own id. Once the generator is exhausted, the task's
+result is marked as done with a summary of the stream, so consumers
+can process chunks as they arrive with `iter_stream`.
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+# Third-Party Imports
+import celery
+from celery import states
+from celery.exceptions import IncompleteStream
+from celery.exceptions import TimeoutError as CeleryTimeoutError
+from celery.result import AsyncResult
+
+# Package-Level Imports
+from celery_aio_pool.types import AnyCallable
+
+__all__ = (
+    "chunk_id",
+    "iter_stream",
+    "stream_results",
+)
+
+
+def chunk_id(task_id: str, index: int) -> str:
+    """Get the id the supplied chunk of a task's stream is stored under."""
+    return f"{task_id}.chunk.{index}"
+
+
+async def stream_results(
+    fun: AnyCallable,
+    args: Sequence[Any],
+    kwargs: Dict[str, Any],
+    task_id: str,
+    backend: Any,
+    publish: bool = True,
+) -> Union[Dict[str, int], List[Any]]:
+    """Run an async generator task, storing each chunk it yields.
+
+    If results aren't being published (e.g. `ignore_result=True`),
+    the chunks are collected and returned as a list instead.
+    """
+    if not publish:
+        return [chunk async for chunk in fun(*args, **kwargs)]
+
+    count = 0
+
+    async for chunk in fun(*args, **kwargs):
+        await aio.to_thread(backend.store_result, chunk_id(task_id, count), chunk, states.SUCCESS)
+        count += 1
+
+    return {"chunks": count}
+
+
+def iter_stream(
+    result: AsyncResult,
+    interval: float = 0.5,
+    timeout: Optional[float] = None,
+    app: Optional[celery.Celery] = None,
+) -> Iterator[Any]:
+    """Yield the chunks of an async generator task's stream as they become
+    available.
+
+    Raises `IncompleteStream` if a chunk of a finished stream is missing
+    (e.g. because it has already expired).
+    """
+    app = app or result.app
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    index = 0
+
+    while True:
+        chunk = AsyncResult(chunk_id(result.id, index), app=app)
+
+        if chunk.ready():
+            yield chunk.result
+            index += 1
+            continue
+
+        if result.ready():
+            # Re-raises the task's error if the stream failed
+            if index >= result.get(propagate=True)["chunks"]:
+                return
+
+            # Chunks are stored before the stream's result, so one
+            # that's still missing now is never going to turn up
+            if not chunk.ready():
+                raise IncompleteStream(f"Chunk {index} of stream {result.id} is missing")
+
+            continue
+
+        if deadline is not None and time.monotonic() > deadline:
+            raise CeleryTimeoutError("The operation timed out.")
+
+        time.sleep(interval)
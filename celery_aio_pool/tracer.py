@@ -7,9 +7,12 @@ utility."""
 from __future__ import annotations
 
 # Standard Library Imports
+import inspect
 import logging
 import os
 import time
+from contextlib import nullcontext
+from functools import partial
 from typing import (
     Any,
     Callable,
@@ -33,12 +36,19 @@ import celery.loaders
 import celery.loaders.app
 from celery.app.trace import AsyncResult, BackendGetMetaError, Context, EncodeError, ExceptionInfo, FAILURE, \
     gethostname, get_task_name, group, Ignore, IGNORED, IGNORE_STATES, info, InvalidTaskError, logger, LOG_IGNORED, \
-    LOG_SUCCESS, Reject, REJECTED, report_internal_error, Retry, RETRY, safe_repr, saferepr, send_postrun, send_prerun, \
-    send_success, _signal_internal_error, signals, STARTED, SUCCESS, successful_requests, task_has_custom, _task_stack, \
+    LOG_SUCCESS, Reject, REJECTED, report_internal_error, Retry, RETRY, saferepr, \
+    _signal_internal_error, signals, STARTED, SUCCESS, successful_requests, task_has_custom, _task_stack, \
     traceback_clear, TraceInfo, trace_ok_t
 
 # Package-Level Imports
-from celery_aio_pool.types import AnyException
+from celery_aio_pool.claimcheck import ClaimCheck
+from celery_aio_pool.memoize import MISSING
+from celery_aio_pool.process import PROCESS_EXECUTOR, request_snapshot
+from celery_aio_pool.sharding import current_loop_shard
+from celery_aio_pool.signals import AsyncSignalDispatcher
+from celery_aio_pool.singleflight import flight_key
+from celery_aio_pool.streaming import stream_results
+from celery_aio_pool.types import AnyException, TaskLabel
 
 __all__ = ("build_async_tracer",)
 
@@ -128,6 +138,8 @@ def build_async_tracer(
     pop_task = _task_stack.pop
     _does_info = logger.isEnabledFor(logging.INFO)
     resultrepr_maxsize = task.resultrepr_maxsize
+    argsrepr_maxsize = app.amqp.argsrepr_maxsize
+    kwargsrepr_maxsize = app.amqp.kwargsrepr_maxsize
 
     prerun_receivers = signals.task_prerun.receivers
     postrun_receivers = signals.task_postrun.receivers
@@ -137,10 +149,31 @@ def build_async_tracer(
     from celery import canvas
 
     # Package-Level Imports
-    from celery_aio_pool.pool import AsyncIOPool
+    from celery_aio_pool.pool import AsyncIOPool, current_task_label
 
     signature = canvas.maybe_signature  # maybe_ does not clone if already
 
+    run_in_process = getattr(task, 'executor', None) == PROCESS_EXECUTOR and not eager
+
+    # Coroutines (and async generators) can't be handed to a process
+    # pool, so asynchronous tasks run on the loop as usual instead
+    # (refusing them here would stop the whole worker from starting)
+    if run_in_process and (inspect.iscoroutinefunction(task.run) or inspect.isasyncgenfunction(task.run)):
+        logger.warning(
+            'Task %s is asynchronous and can\'t be run by the %r executor, running it on the event loop',
+            name, PROCESS_EXECUTOR)
+        run_in_process = False
+    streaming = inspect.isasyncgenfunction(task.run)
+    single_flight = None if streaming else getattr(task, 'single_flight', None)
+    memoize = None if streaming else getattr(task, 'memoize', None)
+    claim_check = ClaimCheck.from_app(app)
+    send_signal = AsyncSignalDispatcher.from_app(app).send
+    delete_claimed_args = app.conf.get('aio_pool_claim_check_delete_args', True)
+    # Failed tasks' arguments are still needed if their rejected
+    # messages may be dead-lettered (and so run again)
+    delete_failed_args = delete_claimed_args and (
+        not task.acks_late or app.conf.task_acks_on_failure_or_timeout)
+
     # noinspection PyUnusedLocal
     def on_error(
             request: celery.app.task.Context,
@@ -176,6 +209,7 @@ def build_async_tracer(
         # the rest of the variables, so breaking PEP8 is worth it ;)
         R = I = T = Rstr = retval = state = None
         task_request = None
+        claimed_args, claimed_kwargs = args, kwargs
         time_start = monotonic()
         try:
             try:
@@ -196,45 +230,102 @@ def build_async_tracer(
             if deduplicate_successful_tasks and redelivered:
                 if task_request.id in successful_requests:
                     return trace_ok_t(R, I, T, Rstr)
-                r = AsyncResult(task_request.id, app=app)
 
-                try:
-                    state = r.state
-                except BackendGetMetaError:
-                    pass
+                # Let the worker pool's dedup index answer from memory
+                # or from the batched lookup started when the message
+                # was received, falling back to a lookup of our own
+                dedup = AsyncIOPool.singleton and AsyncIOPool.singleton.dedup
+                if dedup:
+                    state = SUCCESS if dedup.is_duplicate(
+                        task_request.id, task.backend) else None
                 else:
-                    if state == SUCCESS:
-                        info(LOG_IGNORED, {
-                            'id': task_request.id,
-                            'name': get_task_name(task_request, name),
-                            'description': 'Task already completed successfully.'
-                        })
-                        return trace_ok_t(R, I, T, Rstr)
+                    try:
+                        state = AsyncResult(task_request.id, app=app).state
+                    except BackendGetMetaError:
+                        state = None
+
+                if state == SUCCESS:
+                    info(LOG_IGNORED, {
+                        'id': task_request.id,
+                        'name': get_task_name(task_request, name),
+                        'description': 'Task already completed successfully.'
+                    })
+                    return trace_ok_t(R, I, T, Rstr)
+                state = None
 
             push_task(task)
+            label_token = current_task_label.set(TaskLabel(uuid, name))
+            shards = AsyncIOPool.singleton and AsyncIOPool.singleton.shards
+            shard = shards.acquire(task_request.get('loop_key') or name) if shards else None
+            shard_token = current_loop_shard.set(shard)
             root_id = task_request.root_id or uuid
             task_priority = task_request.delivery_info.get('priority') if \
                 inherit_parent_priority else None
             push_request(task_request)
             try:
+                # Tasks shed by the pool's admission control are
+                # rejected before they're reported as started
+                admission = AsyncIOPool.singleton and AsyncIOPool.singleton.admission
+                admitted = not admission or admission.admit(task)
+
                 # -*- PRE -*-
-                if prerun_receivers:
-                    send_prerun(sender=task, task_id=uuid, task=task,
-                                args=args, kwargs=kwargs)
-                AsyncIOPool.run_in_pool(loader_task_init, uuid, task)
-                if track_started:
-                    task.backend.store_result(
-                        uuid, {'pid': pid, 'hostname': hostname}, STARTED,
-                        request=task_request,
-                    )
+                if admitted:
+                    if prerun_receivers:
+                        send_signal(signals.task_prerun,
+                                    sender=task, task_id=uuid, task=task,
+                                    args=args, kwargs=kwargs)
+                    AsyncIOPool.run_in_pool(loader_task_init, uuid, task)
+                    if track_started:
+                        task.backend.store_result(
+                            uuid, {'pid': pid, 'hostname': hostname}, STARTED,
+                            request=task_request,
+                        )
 
                 # -*- TRACE -*-
                 try:
+                    if not admitted:
+                        raise Reject('Worker pool is over budget', requeue=True)
+
+                    if claim_check:
+                        args, kwargs = AsyncIOPool.run_in_pool(
+                            claim_check.resolve_arguments, args, kwargs)
+
                     if task_before_start:
                         AsyncIOPool.run_in_pool(task_before_start, uuid, args,
                                                 kwargs)
 
-                    R = retval = AsyncIOPool.run_in_pool(fun, *args, **kwargs)
+                    if run_in_process:
+                        R = retval = AsyncIOPool.run_in_process_pool(
+                            name, args, kwargs, request_snapshot(task_request))
+                    else:
+                        # Memoized results skip the task's body, but not
+                        # the rest of the success path
+                        memo_cache = memoize and AsyncIOPool.singleton and AsyncIOPool.singleton.memo_cache
+                        memo_key = memo_cache and flight_key(name, None, claimed_args, claimed_kwargs)
+                        R = retval = memo_cache.get(memo_key) if memo_cache else MISSING
+                        if retval is MISSING:
+                            allocations = AsyncIOPool.singleton and AsyncIOPool.singleton.allocations
+                            with (allocations.measure(name, task.run)
+                                  if allocations and allocations.active
+                                  else nullcontext()):
+                                if streaming:
+                                    R = retval = AsyncIOPool.run_in_pool(
+                                        stream_results, fun, args, kwargs, uuid,
+                                        task.backend, publish_result)
+                                elif single_flight and (flights := AsyncIOPool.singleton
+                                                        and AsyncIOPool.singleton.single_flight):
+                                    # Identical executions share the result
+                                    # of whichever one actually runs
+                                    R = retval = flights.run(
+                                        flight_key(name, single_flight,
+                                                   claimed_args, claimed_kwargs),
+                                        partial(AsyncIOPool.run_in_pool,
+                                                fun, *args, **kwargs))
+                                else:
+                                    R = retval = AsyncIOPool.run_in_pool(fun, *args, **kwargs)
+                            if memo_cache:
+                                memo_cache.put(memo_key, retval,
+                                               None if memoize is True else memoize)
                     state = SUCCESS
                 except Reject as exc:
                     I, R = Info(REJECTED, exc), ExceptionInfo(internal=True)
@@ -253,10 +344,18 @@ def build_async_tracer(
                 except Exception as exc:
                     I, R, state, retval = on_error(task_request, exc)
                     traceback_clear(exc)
+                    if claim_check and delete_failed_args:
+                        AsyncIOPool.run_in_pool(
+                            claim_check.delete_arguments,
+                            claimed_args, claimed_kwargs)
                 except BaseException:
                     raise
                 else:
                     try:
+                        if claim_check:
+                            R = retval = AsyncIOPool.run_in_pool(
+                                claim_check.offload_result, retval)
+
                         # callback tasks must be applied before the result is
                         # stored, so that result.children is populated.
 
@@ -304,24 +403,37 @@ def build_async_tracer(
                         task.backend.mark_as_done(
                             uuid, retval, task_request, publish_result,
                         )
+                        if deduplicate_successful_tasks and (
+                                dedup := AsyncIOPool.singleton and AsyncIOPool.singleton.dedup):
+                            dedup.mark_completed(uuid)
                     except EncodeError as exc:
                         I, R, state, retval = on_error(task_request, exc)
                     else:
+                        if claim_check and delete_claimed_args:
+                            AsyncIOPool.run_in_pool(
+                                claim_check.delete_arguments,
+                                claimed_args, claimed_kwargs)
                         Rstr = saferepr(R, resultrepr_maxsize)
                         T = monotonic() - time_start
                         if task_on_success:
                             AsyncIOPool.run_in_pool(task_on_success, retval,
                                                     uuid, args, kwargs)
                         if success_receivers:
-                            send_success(sender=task, result=retval)
+                            send_signal(signals.task_success,
+                                        sender=task, result=retval)
                         if _does_info:
                             info(LOG_SUCCESS, {
                                 'id': uuid,
                                 'name': get_task_name(task_request, name),
                                 'return_value': Rstr,
                                 'runtime': T,
-                                'args': safe_repr(args),
-                                'kwargs': safe_repr(kwargs),
+                                # Prefer the (already truncated) reprs computed
+                                # by the producer, and never repr the arguments
+                                # in full as they may carry multi-MB payloads
+                                'args': (getattr(task_request, 'argsrepr', None)
+                                         or saferepr(args, argsrepr_maxsize)),
+                                'kwargs': (getattr(task_request, 'kwargsrepr', None)
+                                           or saferepr(kwargs, kwargsrepr_maxsize)),
                             })
 
                 # -* POST *-
@@ -333,10 +445,17 @@ def build_async_tracer(
             finally:
                 try:
                     if postrun_receivers:
-                        send_postrun(sender=task, task_id=uuid, task=task,
-                                     args=args, kwargs=kwargs,
-                                     retval=retval, state=state)
+                        send_signal(signals.task_postrun,
+                                    sender=task, task_id=uuid, task=task,
+                                    args=args, kwargs=kwargs,
+                                    retval=retval, state=state)
                 finally:
+                    if claim_check:
+                        claim_check.release(*args, *kwargs.values())
+                    current_task_label.reset(label_token)
+                    current_loop_shard.reset(shard_token)
+                    if shard:
+                        shards.release(shard)
                     pop_task()
                     pop_request()
                     if not eager:
@@ -10,9 +10,17 @@ __all__ = (
     "AnyCallable",
     "AnyCoroutine",
     "AnyException",
+    "TaskLabel",
 )
 
 
 AnyCallable = typing.Callable[..., typing.Any]
 AnyException = typing.Union[Exception, typing.Type[Exception]]
 AnyCoroutine = typing.Coroutine[typing.Any, typing.Any, typing.Any]
+
+
+class TaskLabel(typing.NamedTuple):
+    """The identity of the Celery task that scheduled a coroutine."""
+
+    id: str
+    name: str
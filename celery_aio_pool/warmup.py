@@ -0,0 +1,186 @@
+"""Warm-up of a worker pool before it starts taking on tasks.
+
+A freshly started worker otherwise pays for a lot of lazy work while
+serving its first tasks: the threads of each loop's default executor
+are only spawned by the first `to_thread` calls, task modules and
+result backends are set up on first use, and connections are only
+opened by the first tasks that need them. `warm_up` does all of that
+up front, timing each stage.
+
+Task tracers aren't built here: the worker's consumer (re)builds all
+of them when it starts, which is after the pool has started.
+"""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import concurrent.futures
+import inspect
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+)
+
+# Third-Party Imports
+import celery
+from celery.backends.base import DisabledBackend
+from celery.utils.imports import symbol_by_name
+from celery.utils.log import get_logger
+
+__all__ = (
+    "on_warmup",
+    "warm_up",
+    "warmup_hooks",
+)
+
+logger = get_logger(__name__)
+
+# The (nonexistent) task whose state is looked up to open a result
+# backend's connection
+WARMUP_TASK_ID = "celery-aio-pool-warm-up"
+
+# Hooks run by every worker pool's warm-up, each called with the app
+warmup_hooks: List[Callable[[celery.Celery], Any]] = []
+
+
+def on_warmup(hook: Callable[[celery.Celery], Any]) -> Callable[[celery.Celery], Any]:
+    """Register the decorated (async or sync) function to be called with
+    the app whenever a worker pool warms up, e.g. to open connection
+    pools."""
+    warmup_hooks.append(hook)
+    return hook
+
+
+async def _spawn_threads(count: Optional[int], timeout: float) -> int:
+    loop = aio.get_running_loop()
+
+    # The loop's default executor is only created on first use
+    await loop.run_in_executor(None, int)
+    executor = getattr(loop, "_default_executor", None)
+    limit = getattr(executor, "_max_workers", count or 1)
+    count = min(count or limit, limit)
+
+    # Executors only spawn a thread when none of theirs are idle,
+    # so jobs that block until all of them are running force the
+    # executor to spawn `count` threads
+    barrier = threading.Barrier(count, timeout=timeout)
+
+    try:
+        await aio.gather(*(loop.run_in_executor(None, barrier.wait) for _ in range(count)))
+    except threading.BrokenBarrierError:
+        logger.warning("Timed out spawning %d executor threads for %r", count, loop)
+        return 0
+
+    return count
+
+
+async def _run_hooks(app: celery.Celery, hooks: Sequence[Callable[[celery.Celery], Any]], timeout: float) -> int:
+    failed = 0
+
+    for hook in hooks:
+        try:
+            if inspect.iscoroutinefunction(hook):
+                await aio.wait_for(hook(app), timeout)
+            else:
+                await aio.wait_for(aio.to_thread(hook, app), timeout)
+        except Exception as exc:  # pylint: disable=broad-except
+            failed += 1
+            logger.warning("Warm-up hook %r failed: %r", hook, exc, exc_info=True)
+
+    return failed
+
+
+def _connect_backends(app: celery.Celery) -> Dict[str, int]:
+    # Task modules are imported here, rather than by the tasks'
+    # first messages
+    app.loader.import_default_modules()
+
+    backends, failed = {}, 0
+
+    for name, task in list(app.tasks.items()):
+        try:
+            backend = task.backend
+        except Exception as exc:  # pylint: disable=broad-except
+            failed += 1
+            logger.warning("Could not set up the result backend of task %s: %r", name, exc, exc_info=True)
+        else:
+            backends.setdefault(id(backend), backend)
+
+    connected = 0
+
+    for backend in backends.values():
+        # Looking a task up makes the backend open its connection,
+        # which (unlike a tracer) outlives the warm-up
+        if isinstance(backend, DisabledBackend) or not backend.persistent:
+            continue
+
+        try:
+            backend.get_state(WARMUP_TASK_ID)
+        except Exception as exc:  # pylint: disable=broad-except
+            failed += 1
+            logger.warning("Could not connect to result backend %r: %r", backend, exc, exc_info=True)
+        else:
+            connected += 1
+
+    return {"count": len(app.tasks), "backends": connected, "failed": failed}
+
+
+def warm_up(
+    app: celery.Celery,
+    loops: Iterable[aio.AbstractEventLoop],
+    threads: Optional[int] = None,
+    hooks: Iterable[Callable[[celery.Celery], Any] | str] = (),
+    timeout: float = 30.0,
+    wait: Callable[[concurrent.futures.Future], Any] = concurrent.futures.Future.result,
+) -> Dict[str, Any]:
+    """Warm up the supplied (running) loops and the app's tasks, and return
+    the time taken by each stage.
+
+    Every loop's default executor is made to spawn `threads` threads
+    (all of them if `None`), the app's task modules are imported and
+    the result backends its tasks use are connected to (from the
+    calling thread, as backends may be thread-local), and the
+    registered warm-up hooks, followed by the supplied ones (callables
+    or `"module:function"` paths), are run on the first loop. Failing
+    backends and hooks are logged rather than raised.
+    """
+    loops = list(loops)
+    report: Dict[str, Any] = {}
+    started = stage = time.perf_counter()
+
+    spawned = [
+        wait(aio.run_coroutine_threadsafe(_spawn_threads(threads, timeout), loop))
+        for loop in loops
+    ]
+    report["threads"] = {"count": sum(spawned), "seconds": time.perf_counter() - stage}
+    stage = time.perf_counter()
+
+    report["tasks"] = dict(_connect_backends(app), seconds=time.perf_counter() - stage)
+    stage = time.perf_counter()
+
+    hooks = [*warmup_hooks, *(symbol_by_name(hook) if isinstance(hook, str) else hook for hook in hooks)]
+    failed = wait(aio.run_coroutine_threadsafe(_run_hooks(app, hooks, timeout), loops[0])) if hooks else 0
+    report["hooks"] = {"count": len(hooks), "failed": failed, "seconds": time.perf_counter() - stage}
+    report["seconds"] = time.perf_counter() - started
+
+    logger.info(
+        "Worker pool warmed up in %.3fs (%d threads in %.3fs, %d result backends in %.3fs, %d hooks in %.3fs)",
+        report["seconds"],
+        report["threads"]["count"],
+        report["threads"]["seconds"],
+        report["tasks"]["backends"],
+        report["tasks"]["seconds"],
+        report["hooks"]["count"],
+        report["hooks"]["seconds"],
+    )
+
+    return report
@@ -6,6 +6,7 @@ from __future__ import annotations
 # Standard Library Imports
 import asyncio as aio
 import copy
+import os
 import subprocess
 import sys
 import time
@@ -13,7 +14,10 @@ from operator import methodcaller
 from pathlib import Path
 from typing import (
     Any,
+    AsyncGenerator,
+    Callable,
     Generator,
+    Optional,
 )
 from uuid import UUID
 
@@ -24,6 +28,8 @@ import pytest
 
 # Package-Level Imports
 import celery_aio_pool as aio_pool
+from celery_aio_pool.pool import AsyncIOPool
+from celery_aio_pool.retry import LocalRetryTask
 
 __all__ = tuple()
 
@@ -74,6 +80,8 @@ session_app: celery.Celery = celery.Celery(
     result_backend=f"file://{results}",
     broker_url=f"filesystem://{broker}",
     worker_pool=aio_pool.pool.AsyncIOPool,
+    aio_pool_events_batching=True,
+    aio_pool_warmup=True,
     broker_transport_options={
         "data_folder_in": str(msg_dir),
         "data_folder_out": str(msg_dir),
@@ -133,6 +141,43 @@ async def _async_task(data: str) -> str:
     return data
 
 
+@session_app.task(executor="process")
+def _process_task(data: str) -> tuple[str, int]:
+    """A simple dummy function run in the worker pool's process pool."""
+    return data.upper(), os.getpid()
+
+
+@session_app.task(base=LocalRetryTask, bind=True)
+async def _flaky_async_task(self: celery.Task) -> int:
+    """A dummy async function that has to be retried twice."""
+    if self.request.retries < 2:
+        raise self.retry(countdown=0.1)
+
+    return self.request.retries
+
+
+@session_app.task
+async def _streaming_async_task(data: str) -> AsyncGenerator[str, None]:
+    """A dummy async generator function that streams its result."""
+    for word in data.split():
+        await aio.sleep(0.1)
+        yield word.upper()
+
+
+@session_app.task(single_flight=True)
+async def _single_flight_async_task(data: str) -> str:
+    """A dummy async function whose identical executions are coalesced."""
+    await aio.sleep(0.5)
+    return f"{data}@{time.monotonic()}"
+
+
+@session_app.task(memoize=30)
+async def _memoized_async_task(data: str) -> str:
+    """A dummy async function whose results are memoized."""
+    await aio.sleep(0.1)
+    return f"{data}@{time.monotonic()}"
+
+
 @session_app.task(bind=True)
 def _bound_sync_task(self: celery.Task) -> dict[str, bool]:
     """Guard against malformed / improperly populated request objects."""
@@ -189,6 +234,36 @@ def async_task() -> Generator[celery.Task, None, None]:
     yield _async_task
 
 
+@pytest.fixture(scope="session", autouse=True)
+def process_task() -> Generator[celery.Task, None, None]:
+    """A session-scoped Celery `Task` routed to the process pool."""
+    yield _process_task
+
+
+@pytest.fixture(scope="session", autouse=True)
+def flaky_async_task() -> Generator[celery.Task, None, None]:
+    """A session-scoped async Celery `Task` that retries locally."""
+    yield _flaky_async_task
+
+
+@pytest.fixture(scope="session", autouse=True)
+def streaming_async_task() -> Generator[celery.Task, None, None]:
+    """A session-scoped async generator Celery `Task`."""
+    yield _streaming_async_task
+
+
+@pytest.fixture(scope="session", autouse=True)
+def single_flight_async_task() -> Generator[celery.Task, None, None]:
+    """A session-scoped async Celery `Task` with `single_flight=True`."""
+    yield _single_flight_async_task
+
+
+@pytest.fixture(scope="session", autouse=True)
+def memoized_async_task() -> Generator[celery.Task, None, None]:
+    """A session-scoped async Celery `Task` with `memoize=30`."""
+    yield _memoized_async_task
+
+
 @pytest.fixture(scope="session", autouse=True)
 def bound_sync_task() -> Generator[celery.Task, None, None]:
     """A session-scoped Celery `Task` with `bind=True` enabled."""
@@ -220,5 +295,34 @@ def session_worker() -> Generator[Any, None, None]:
     worker_process.kill()
 
 
+@pytest.fixture()
+def make_pool() -> Generator[Callable[..., AsyncIOPool], None, None]:
+    """Create (and clean up) worker pools without touching the
+    process-wide `AsyncIOPool` singleton."""
+    pools = []
+
+    def factory(app: Optional[celery.Celery] = None, **kwargs: Any) -> AsyncIOPool:
+        pool_cls = type("IsolatedAsyncIOPool", (AsyncIOPool,), {"singleton": None})
+        pools.append(pool := pool_cls(1, app=app or celery.Celery(set_as_current=False), **kwargs))
+        return pool
+
+    yield factory
+
+    for pool in pools:
+        pool.loop_monitor.stop()
+        pool.on_stop()
+
+        if pool.shards is not None:
+            pool.shards.stop()
+
+        if not pool.integrated:
+            pool.loop.call_soon_threadsafe(pool.loop.stop)
+            pool.join()
+
+        pool.loop.close()
+
+    aio.set_event_loop(None)
+
+
 if __name__ == "__main__":
     _run_celery_worker()
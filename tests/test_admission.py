@@ -0,0 +1,136 @@
+"""Test loop-health-aware task admission."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import threading
+import time
+from types import SimpleNamespace
+from typing import Callable
+
+# Third-Party Imports
+import celery
+import pytest
+from celery import signals
+from celery.result import AsyncResult
+
+# Package-Level Imports
+from celery_aio_pool.admission import (
+    AdmissionController,
+    LoopMonitor,
+)
+from celery_aio_pool.eager import eager_executor
+from celery_aio_pool.pool import AsyncIOPool
+from celery_aio_pool.tracer import build_async_tracer
+
+__all__ = tuple()
+
+
+@pytest.mark.descriptor
+def describe_admission_controller() -> None:
+    """Test that tasks are deferred or shed while the pool is over budget."""
+
+    @pytest.mark.description
+    def when_the_loop_is_blocked() -> None:
+        """Test that the loop monitor notices the loop being blocked."""
+        loop = aio.new_event_loop()
+        runner = threading.Thread(target=loop.run_forever, daemon=True)
+        runner.start()
+
+        monitor = LoopMonitor(loop, interval=0.01)
+        monitor.start()
+
+        try:
+            time.sleep(0.05)
+            loop.call_soon_threadsafe(time.sleep, 0.2)
+            time.sleep(0.3)
+        finally:
+            probe = monitor._probe_task
+            monitor.stop()
+            loop.call_soon_threadsafe(loop.stop)
+            runner.join()
+            loop.close()
+
+        assert monitor.max_lag >= 0.1
+        assert probe.cancelled() and not monitor.active
+
+    @pytest.mark.description
+    def when_the_pool_has_no_budget(make_pool: Callable[..., AsyncIOPool]) -> None:
+        """Test that the pool measures (and reports) its loop's lag even
+        when admission control is off."""
+        pool = make_pool(celery.Celery(set_as_current=False, aio_pool_loop_monitor_interval=0.01), threads=True)
+        pool.start()
+
+        time.sleep(0.05)
+        pool.loop.call_soon_threadsafe(time.sleep, 0.2)
+        time.sleep(0.3)
+
+        assert pool.admission is None
+        assert pool.loop_monitor.max_lag >= 0.1
+        assert pool._get_info()["loop-lag"] is not None
+
+    @pytest.mark.description
+    def when_over_budget() -> None:
+        """Test that sheddable (late-acknowledged) tasks are refused and
+        others are deferred until the pool recovers."""
+        monitor = SimpleNamespace(lag=1.0)
+        admission = AdmissionController(monitor, max_lag=0.5, max_defer=5.0, poll_interval=0.01)
+
+        assert not admission.admit(SimpleNamespace(name="shed.me", sheddable=True, acks_late=True))
+
+        # Without `acks_late` the message is already acknowledged, so
+        # the task is deferred rather than lost
+        for task in (SimpleNamespace(name="wait.for.me"), SimpleNamespace(name="acked", sheddable=True)):
+            threading.Timer(0.05, setattr, (monitor, "lag", 0.0)).start()
+            started = time.monotonic()
+
+            assert admission.admit(task)
+            assert 0.04 <= time.monotonic() - started < 5.0
+            monitor.lag = 1.0
+
+        assert admission.stats == {"admitted": 2, "deferred": 2, "shed": 1}
+
+    @pytest.mark.description
+    def when_too_many_coroutines_are_in_flight() -> None:
+        """Test that the number of in-flight coroutines is budgeted."""
+        admission = AdmissionController(SimpleNamespace(lag=0.0), max_in_flight=1)
+
+        admission.enter()
+        assert admission.overloaded()
+
+        admission.exit()
+        assert admission.overloaded() is None
+
+    @pytest.mark.description
+    def when_a_task_is_shed(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that shed tasks are rejected before they're reported as
+        started (or `task_prerun` is sent for them)."""
+        app = celery.Celery(set_as_current=False, result_backend="cache+memory://")
+
+        @app.task(sheddable=True, acks_late=True, track_started=True)
+        def shed_me() -> int:
+            return 1
+
+        admission = AdmissionController(SimpleNamespace(lag=0.0), max_in_flight=0)
+        worker_pool = SimpleNamespace(admission=admission, shards=None, run=eager_executor.run)
+        monkeypatch.setattr(AsyncIOPool, "singleton", worker_pool)
+
+        prerun = []
+
+        def on_prerun(**kwargs) -> None:
+            prerun.append(kwargs["task_id"])
+
+        signals.task_prerun.connect(on_prerun, weak=False)
+
+        try:
+            tracer = build_async_tracer(shed_me.name, shed_me, app=app)
+            traced = tracer("shed-task-id", (), {}, {"delivery_info": {}})
+        finally:
+            signals.task_prerun.disconnect(on_prerun)
+
+        assert traced.info.state == "REJECTED"
+        assert AsyncResult("shed-task-id", app=app).state == "PENDING"
+        assert prerun == []
+        assert admission.stats["shed"] == 1
@@ -0,0 +1,107 @@
+"""Test sampled per-task allocation tracking."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import threading
+import tracemalloc
+from typing import (
+    Any,
+    Generator,
+    List,
+)
+
+# Third-Party Imports
+import pytest
+
+# Package-Level Imports
+from celery_aio_pool.allocations import AllocationTracker
+
+__all__ = tuple()
+
+
+retained: List[Any] = []
+
+
+@pytest.fixture()
+def tracker() -> Generator[AllocationTracker, None, None]:
+    """An allocation tracker that's stopped once the test is done."""
+    tracker = AllocationTracker()
+
+    yield tracker
+
+    tracker.stop()
+    retained.clear()
+
+
+async def _leaky() -> None:
+    """Retain 200KB, yielding to the eventloop in between allocations."""
+    for _ in range(4):
+        retained.append(bytearray(50_000))
+        await aio.sleep(0.01)
+
+
+async def _noisy() -> None:
+    """Retain 1MB while `_leaky` is running on the same loop."""
+    for _ in range(4):
+        retained.append(bytearray(250_000))
+        await aio.sleep(0.01)
+
+
+@pytest.mark.descriptor
+def describe_allocation_tracker() -> None:
+    """Test that `AllocationTracker` attributes retained memory to tasks."""
+
+    @pytest.mark.description
+    def when_tasks_interleave_on_the_loop(tracker: AllocationTracker) -> None:
+        """Test that only the tracked task's own allocations count towards
+        it."""
+        loop = aio.new_event_loop()
+        runner = threading.Thread(target=loop.run_forever, daemon=True)
+        runner.start()
+
+        tracker.start(every=1)
+
+        try:
+            noise = aio.run_coroutine_threadsafe(_noisy(), loop)
+
+            with tracker.measure("leaky.task", _leaky):
+                aio.run_coroutine_threadsafe(_leaky(), loop).result()
+
+            noise.result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            runner.join()
+            loop.close()
+
+        report = tracker.report(limit=3)["leaky.task"]
+
+        assert report["samples"] == 1
+        assert 200_000 <= report["retained"] < 300_000
+        assert report["top_sites"][0][0].endswith(f"test_allocations.py:{_leaky.__code__.co_firstlineno + 3}")
+
+    @pytest.mark.description
+    def when_sampling_one_in_k_executions(tracker: AllocationTracker) -> None:
+        """Test that only every K-th execution of a task is tracked."""
+        tracker.start(every=3, task_name="sampled.task")
+
+        for _ in range(6):
+            with tracker.measure("sampled.task", _leaky):
+                pass
+
+            with tracker.measure("other.task", _leaky):
+                pass
+
+        assert tracker.report() == {
+            "sampled.task": {
+                "samples": 2,
+                "retained": 0,
+                "retained_per_task": 0,
+                "top_sites": [],
+            },
+        }
+
+        assert tracker.stop()
+        assert not tracemalloc.is_tracing()
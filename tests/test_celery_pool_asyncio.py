@@ -5,8 +5,10 @@ from __future__ import annotations
 
 # Standard Library Imports
 import asyncio as aio
+import time
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     Coroutine,
 )
@@ -18,6 +20,16 @@ import celery.canvas
 import celery.contrib.testing.worker
 import celery.result
 import pytest
+from celery import states
+from celery.exceptions import IncompleteStream
+
+# Package-Level Imports
+from celery_aio_pool.pool import AsyncIOPool
+from celery_aio_pool.streaming import (
+    chunk_id,
+    iter_stream,
+)
+from celery_aio_pool.tracer import build_async_tracer
 
 __all__ = tuple()
 
@@ -73,6 +85,37 @@ def describe_sync_tasks() -> None:
 
         assert reply == message.upper()
 
+    @pytest.mark.description
+    def when_applied_eagerly(sync_task: celery.Task) -> None:
+        """Test that Celery `Task`-wrapped regular (synchronous) functions
+        behave as expected when run eagerly via `.apply()`, without a
+        worker pool being created in the calling process."""
+
+        result: celery.result.EagerResult = sync_task.apply(
+            kwargs=dict(data=message),
+        )
+
+        assert result.get(timeout=60) == message.upper()
+        assert AsyncIOPool.singleton is None
+
+    @pytest.mark.description
+    def when_routed_to_the_process_pool(
+        process_task: celery.Task,
+        session_worker: Any,
+    ) -> None:
+        """Test that Celery `Task`-wrapped regular (synchronous) functions
+        declared with `executor="process"` are run outside the worker's own
+        process."""
+
+        result: celery.result.AsyncResult = process_task.delay(
+            data=message,
+        )
+
+        reply, pid = result.get(timeout=60)
+
+        assert reply == message.upper()
+        assert pid != session_worker.pid
+
     @pytest.mark.description
     def when_task_binding_is_enabled(bound_sync_task: celery.Task) -> None:
         """Test that the `request` attribute of the `self` instance passed to
@@ -150,6 +193,131 @@ def describe_async_tasks() -> None:
 
         assert reply == message.upper()
 
+    @pytest.mark.description
+    def when_applied_eagerly(async_task: celery.Task) -> None:
+        """Test that Celery `Task`-wrapped coroutine (async) functions behave
+        as expected when run eagerly via `.apply()`, without a worker pool
+        being created in the calling process."""
+
+        result: celery.result.EagerResult = async_task.apply(
+            kwargs=dict(data=message),
+        )
+
+        assert result.get(timeout=60) == message.upper()
+        assert AsyncIOPool.singleton is None
+
+    @pytest.mark.anyio
+    @pytest.mark.description
+    async def when_applied_eagerly_from_asynchronous_code(
+        async_task: celery.Task,
+    ) -> None:
+        """Test that Celery `Task`-wrapped coroutine (async) functions can be
+        run eagerly from inside a running asyncio eventloop."""
+
+        result: celery.result.EagerResult = async_task.apply(
+            kwargs=dict(data=message),
+        )
+
+        assert result.get(timeout=60) == message.upper()
+
+    @pytest.mark.description
+    def when_routed_to_the_process_pool(caplog: pytest.LogCaptureFixture) -> None:
+        """Test that Celery `Task`-wrapped coroutine (async) functions and
+        async generators declared with `executor="process"` are still run
+        (on the event loop), with a warning."""
+        app = celery.Celery(set_as_current=False)
+
+        @app.task(executor="process", shared=False)
+        async def coroutine_task() -> str:
+            """A coroutine function that can't be run in a process pool."""
+            return message.upper()
+
+        @app.task(executor="process", shared=False)
+        async def streaming_task() -> AsyncIterator[int]:
+            """An async generator that can't be run in a process pool."""
+            yield 1
+
+        for task in (coroutine_task, streaming_task):
+            build_async_tracer(task.name, task, app=app)
+
+            assert f"Task {task.name} is asynchronous" in caplog.text
+
+        traced = build_async_tracer(coroutine_task.name, coroutine_task, app=app)(
+            "process-task-id", (), {}, {"delivery_info": {}}
+        )
+
+        assert traced.retval == message.upper()
+
+    @pytest.mark.description
+    def when_retried_locally(flaky_async_task: celery.Task) -> None:
+        """Test that `LocalRetryTask`-based coroutine (async) functions are
+        retried by the worker pool until they succeed."""
+
+        result: celery.result.AsyncResult = flaky_async_task.delay()
+
+        assert result.get(timeout=60) == 2
+
+    @pytest.mark.description
+    def when_streaming_results(streaming_async_task: celery.Task) -> None:
+        """Test that the chunks yielded by Celery `Task`-wrapped async
+        generator functions are published as they're produced."""
+
+        result: celery.result.AsyncResult = streaming_async_task.delay(message)
+
+        assert list(iter_stream(result, interval=0.1, timeout=60)) == message.upper().split()
+        assert result.get(timeout=60) == {"chunks": 2}
+
+    @pytest.mark.description
+    def when_a_streamed_chunk_is_missing() -> None:
+        """Test that a finished stream whose chunk has gone missing is
+        reported as incomplete straight away, rather than polled until
+        the timeout."""
+        app = celery.Celery(set_as_current=False, backend="cache+memory://")
+        app.backend.store_result(chunk_id("stream-id", 0), "first", states.SUCCESS)
+        app.backend.store_result("stream-id", {"chunks": 2}, states.SUCCESS)
+
+        chunks = iter_stream(celery.result.AsyncResult("stream-id", app=app), interval=5, timeout=60)
+        started = time.monotonic()
+
+        assert next(chunks) == "first"
+
+        with pytest.raises(IncompleteStream, match="Chunk 1 of stream stream-id"):
+            next(chunks)
+
+        assert time.monotonic() - started < 1
+
+    @pytest.mark.description
+    def when_single_flight_is_enabled(single_flight_async_task: celery.Task) -> None:
+        """Test that identical executions of Celery `Task`-wrapped async
+        functions declared with `single_flight=True` share a single result
+        (stored under each of their task ids) only while it's fresh."""
+
+        # Messages with a countdown are received (and held) by the
+        # worker straight away, so each one is executed right after
+        # the one before it
+        results = [single_flight_async_task.apply_async((message,), countdown=1) for _ in range(3)]
+        replies = {result.get(timeout=60) for result in results}
+
+        assert len(replies) == 1
+        assert replies.pop().startswith(message)
+
+        # Once the window after the shared execution has passed,
+        # identical executions run the task themselves again
+        first = single_flight_async_task.delay(message).get(timeout=60)
+        time.sleep(1.5)
+
+        assert single_flight_async_task.delay(message).get(timeout=60) != first
+
+    @pytest.mark.description
+    def when_memoization_is_enabled(memoized_async_task: celery.Task) -> None:
+        """Test that the results of Celery `Task`-wrapped async functions
+        declared with `memoize` are reused for the same arguments."""
+
+        first = memoized_async_task.delay(message).get(timeout=60)
+
+        assert memoized_async_task.delay(message).get(timeout=60) == first
+        assert memoized_async_task.delay(message.upper()).get(timeout=60) != first
+
     @pytest.mark.description
     def when_task_binding_is_enabled(bound_async_task: celery.Task) -> None:
         """Test that the `request` attribute of the `self` instance passed to
@@ -0,0 +1,156 @@
+"""Test claim-check offloading of large task arguments and results."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import os
+import time
+from pathlib import Path
+
+# Third-Party Imports
+import celery
+import pytest
+from celery.states import SUCCESS
+
+# Package-Level Imports
+from celery_aio_pool.claimcheck import (
+    ClaimCheck,
+    ClaimCheckTask,
+    FileSystemBlobStore,
+    is_reference,
+)
+from celery_aio_pool.eager import eager_executor
+
+__all__ = tuple()
+
+
+@pytest.mark.descriptor
+def describe_claim_check() -> None:
+    """Test that large payloads are swapped for references and back."""
+
+    @pytest.mark.description
+    def when_payload_is_below_threshold(tmp_path: Path) -> None:
+        """Test that small values are passed through untouched."""
+        app = celery.Celery(set_as_current=False)
+        app.conf.update(aio_pool_claim_check_threshold=16, aio_pool_claim_check_dir=str(tmp_path))
+
+        claim_check = ClaimCheck.from_app(app)
+
+        assert claim_check.retrieve(b"small") == b"small"
+        assert ClaimCheck.from_app(celery.Celery(set_as_current=False)) is None
+
+    @pytest.mark.description
+    def when_task_is_applied_eagerly(tmp_path: Path) -> None:
+        """Test that large arguments are offloaded by the producer, resolved
+        for the task, and that large results are offloaded in turn."""
+        app = celery.Celery(set_as_current=False)
+        app.conf.update(
+            task_always_eager=True,
+            task_store_eager_result=False,
+            aio_pool_claim_check_threshold=16,
+            aio_pool_claim_check_dir=str(tmp_path),
+        )
+
+        @app.task(base=ClaimCheckTask)
+        async def _reverse(payload: bytes) -> bytes:
+            assert isinstance(payload, memoryview)
+            return bytes(payload)[::-1]
+
+        payload = bytes(range(64))
+
+        reply = _reverse.delay(payload).get(timeout=60)
+
+        assert is_reference(reply)
+        assert ClaimCheck.from_app(app).retrieve(reply) == payload[::-1]
+
+        # The argument's blob is removed once the task has succeeded
+        assert len(list(tmp_path.iterdir())) == 1
+
+    @pytest.mark.description
+    def when_the_task_fails(tmp_path: Path) -> None:
+        """Test that a failed task's offloaded arguments are deleted, unless
+        its message may be dead-lettered and run again."""
+        app = celery.Celery(set_as_current=False)
+        app.conf.update(
+            task_always_eager=True,
+            task_store_eager_result=False,
+            aio_pool_claim_check_threshold=16,
+            aio_pool_claim_check_dir=str(tmp_path),
+        )
+
+        @app.task(base=ClaimCheckTask, shared=False)
+        async def _fail(payload: bytes) -> None:
+            raise LookupError(len(payload))
+
+        with pytest.raises(LookupError):
+            _fail.delay(bytes(64)).get(timeout=60)
+
+        assert not list(tmp_path.iterdir())
+
+        app.conf.task_acks_on_failure_or_timeout = False
+
+        @app.task(base=ClaimCheckTask, shared=False, acks_late=True)
+        async def _fail_late(payload: bytes) -> None:
+            raise LookupError(len(payload))
+
+        with pytest.raises(LookupError):
+            _fail_late.delay(bytes(64)).get(timeout=60)
+
+        assert len(list(tmp_path.iterdir())) == 1
+
+    @pytest.mark.description
+    def when_a_resolved_argument_is_released(tmp_path: Path) -> None:
+        """Test that releasing a resolved argument closes the memory-mapped
+        file backing it."""
+        app = celery.Celery(set_as_current=False)
+        app.conf.update(aio_pool_claim_check_threshold=16, aio_pool_claim_check_dir=str(tmp_path))
+
+        claim_check = ClaimCheck.from_app(app)
+        view = claim_check.retrieve(eager_executor.run(claim_check.offload, bytes(64)))
+        mapped = view.obj
+
+        ClaimCheck.release(view, b"untouched")
+
+        assert mapped.closed
+        with pytest.raises(ValueError):
+            view.tobytes()
+
+    @pytest.mark.description
+    def when_a_result_is_forgotten(tmp_path: Path) -> None:
+        """Test that forgetting an offloaded result deletes its blob."""
+        app = celery.Celery(set_as_current=False, backend="cache+memory://")
+        app.conf.update(aio_pool_claim_check_threshold=16, aio_pool_claim_check_dir=str(tmp_path))
+
+        @app.task(base=ClaimCheckTask, shared=False)
+        async def _echo(payload: bytes) -> bytes:
+            return payload
+
+        claim_check = ClaimCheck.from_app(app)
+        app.backend.store_result("task-id", eager_executor.run(claim_check.offload_result, bytes(64)), SUCCESS)
+
+        assert len(list(tmp_path.iterdir())) == 1
+
+        _echo.AsyncResult("task-id").forget()
+
+        assert not list(tmp_path.iterdir())
+
+    @pytest.mark.description
+    def when_blobs_expire(tmp_path: Path) -> None:
+        """Test that offloaded results and arguments older than the maximum
+        age are purged, each without touching the other kind of blob."""
+        store = FileSystemBlobStore(str(tmp_path))
+
+        expired, fresh, argument = (
+            eager_executor.run(store.put_result, b"expired"),
+            eager_executor.run(store.put_result, b"fresh"),
+            eager_executor.run(store.put, b"argument"),
+        )
+        os.utime(store.path(expired), (time.time() - 120, time.time() - 120))
+        os.utime(store.path(argument), (time.time() - 120, time.time() - 120))
+
+        assert eager_executor.run(store.purge_results, 60) == 1
+        assert sorted(path.name for path in tmp_path.iterdir()) == sorted((fresh, argument))
+
+        assert eager_executor.run(store.purge_arguments, 60) == 1
+        assert [path.name for path in tmp_path.iterdir()] == [fresh]
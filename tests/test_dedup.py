@@ -0,0 +1,96 @@
+"""Test deduplication of redelivered tasks."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import threading
+
+# Third-Party Imports
+import celery
+import pytest
+
+# Package-Level Imports
+from celery_aio_pool.dedup import (
+    BloomFilter,
+    DedupIndex,
+)
+
+__all__ = tuple()
+
+
+@pytest.mark.descriptor
+def describe_dedup_index() -> None:
+    """Test that `DedupIndex` batches result backend lookups."""
+
+    @pytest.mark.description
+    def when_redelivered_tasks_are_received() -> None:
+        """Test that lookups queued together are performed as a single
+        batch and that successful tasks are remembered."""
+        app = celery.Celery(set_as_current=False, result_backend="cache+memory://")
+        backend = app.backend
+        backend.mark_as_done("done", 42)
+        backend.mark_as_started("running")
+
+        loop = aio.new_event_loop()
+        runner = threading.Thread(target=loop.run_forever, daemon=True)
+        runner.start()
+
+        try:
+            dedup = DedupIndex(loop, batch_window=0.05)
+
+            for task_id in ("done", "running", "unknown"):
+                dedup.prefetch(task_id, backend)
+
+            assert dedup.is_duplicate("done", backend)
+            assert not dedup.is_duplicate("running", backend)
+            assert not dedup.is_duplicate("unknown", backend)
+            assert dedup.stats == {"hits": 0, "lookups": 3, "batches": 1, "filtered": 0}
+
+            assert dedup.is_duplicate("done", backend)
+            assert dedup.stats["hits"] == 1
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            runner.join()
+            loop.close()
+
+    @pytest.mark.description
+    def when_the_bloom_filter_reports_a_task() -> None:
+        """Test that Bloom filter hits are confirmed with the result backend
+        (so that a false positive never skips a task), and that misses
+        aren't looked up at all."""
+        app = celery.Celery(set_as_current=False, result_backend="cache+memory://")
+        backend = app.backend
+        backend.mark_as_done("done", 42)
+
+        loop = aio.new_event_loop()
+        runner = threading.Thread(target=loop.run_forever, daemon=True)
+        runner.start()
+
+        try:
+            dedup = DedupIndex(loop, maxlen=1, bloom_capacity=100, batch_window=0.01)
+
+            # A false positive, as far as the index is concerned
+            dedup.bloom.add("never-ran")
+            dedup.bloom.add("done")
+
+            assert not dedup.is_duplicate("never-ran", backend)
+            assert dedup.is_duplicate("done", backend)
+            assert not dedup.is_duplicate("unseen", backend)
+            assert dedup.stats == {"hits": 0, "lookups": 2, "batches": 2, "filtered": 1}
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            runner.join()
+            loop.close()
+
+    @pytest.mark.description
+    def when_using_a_bloom_filter() -> None:
+        """Test that the bloom filter remembers the ids added to it."""
+        bloom = BloomFilter(capacity=1000)
+
+        for index in range(1000):
+            bloom.add(f"task-{index}")
+
+        assert all(f"task-{index}" in bloom for index in range(1000))
+        assert sum(f"other-{index}" in bloom for index in range(1000)) <= 1
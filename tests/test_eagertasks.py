@@ -0,0 +1,77 @@
+"""Test the eager start of coroutines submitted to the pool's loop."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import threading
+from typing import (
+    Generator,
+    Optional,
+)
+
+# Third-Party Imports
+import pytest
+
+# Package-Level Imports
+from celery_aio_pool.eagertasks import submit_eagerly
+
+__all__ = tuple()
+
+
+@pytest.fixture()
+def loop() -> Generator[aio.AbstractEventLoop, None, None]:
+    """An asyncio eventloop running in a dedicated thread."""
+    loop = aio.new_event_loop()
+    runner = threading.Thread(target=loop.run_forever, daemon=True)
+    runner.start()
+
+    yield loop
+
+    loop.call_soon_threadsafe(loop.stop)
+    runner.join()
+    loop.close()
+
+
+@pytest.mark.descriptor
+def describe_submit_eagerly() -> None:
+    """Test that coroutines run up to their first suspension without a
+    `Task`."""
+
+    @pytest.mark.description
+    def when_the_coroutine_never_suspends(loop: aio.AbstractEventLoop) -> None:
+        """Test that coroutines that never suspend finish without a `Task`
+        being created for them."""
+
+        async def cache_hit() -> Optional[aio.Task]:
+            return aio.current_task()
+
+        assert submit_eagerly(cache_hit(), loop).result(timeout=5) is None
+
+    @pytest.mark.description
+    def when_the_coroutine_suspends(loop: aio.AbstractEventLoop) -> None:
+        """Test that coroutines that suspend are resumed by a `Task` and see
+        the results of what they awaited."""
+
+        async def cache_miss() -> tuple[bool, int]:
+            started_without_task = aio.current_task() is None
+            value = await aio.get_running_loop().run_in_executor(None, lambda: 21)
+            await aio.sleep(0.01)
+            return started_without_task and aio.current_task() is not None, value * 2
+
+        assert submit_eagerly(cache_miss(), loop).result(timeout=5) == (True, 42)
+
+    @pytest.mark.description
+    def when_the_coroutine_fails(loop: aio.AbstractEventLoop) -> None:
+        """Test that errors are propagated before and after suspending."""
+
+        async def fails(suspend: bool) -> None:
+            if suspend:
+                await aio.sleep(0)
+
+            raise LookupError("cache is gone")
+
+        for suspend in (False, True):
+            with pytest.raises(LookupError, match="cache is gone"):
+                submit_eagerly(fails(suspend), loop).result(timeout=5)
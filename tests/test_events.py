@@ -0,0 +1,144 @@
+"""Test batched task-event publishing."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import threading
+from typing import (
+    Any,
+    Callable,
+)
+
+# Third-Party Imports
+import celery
+import pytest
+
+# Package-Level Imports
+from celery_aio_pool.events import (
+    BatchingEventDispatcher,
+    BatchingEvents,
+)
+from celery_aio_pool.pool import AsyncIOPool
+
+__all__ = tuple()
+
+
+@pytest.mark.descriptor
+def describe_batching_event_dispatcher() -> None:
+    """Test that task events are published in batches from the event loop."""
+
+    @pytest.mark.description
+    def when_task_events_are_sent(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that task events are buffered, dropped oldest-first once the
+        buffer is full and published as a `task.multi` batch when
+        flushed."""
+        app = celery.Celery(set_as_current=False, broker="memory://")
+        app.conf.update(
+            aio_pool_events_max_buffered=3,
+            aio_pool_events_flush_interval=60,
+        )
+
+        published: list[tuple[Any, str]] = []
+        dispatcher = app.subclass_with_self(BatchingEventDispatcher)(enabled=True)
+
+        monkeypatch.setattr(
+            dispatcher,
+            "_publish",
+            lambda event, producer, routing_key, **_: published.append((event, routing_key)),
+        )
+
+        loop = aio.new_event_loop()
+        runner = threading.Thread(target=loop.run_forever, daemon=True)
+        runner.start()
+        dispatcher.loop = loop
+
+        try:
+            dispatcher.send("worker-heartbeat")
+
+            for uuid in "12345":
+                dispatcher.send("task-started", uuid=uuid)
+
+            assert [routing_key for _, routing_key in published] == ["worker.heartbeat"]
+
+            dispatcher.flush()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            runner.join()
+            loop.close()
+
+        assert dispatcher.dropped == 2
+        assert published[1][1] == "task.multi"
+        assert [event["uuid"] for event in published[1][0]] == ["3", "4", "5"]
+
+    @pytest.mark.description
+    def when_publishing_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a batch that fails to publish is put back in the buffer,
+        and that closing the dispatcher waits for it before publishing what's
+        left."""
+        app = celery.Celery(set_as_current=False, broker="memory://")
+        app.conf.update(aio_pool_events_flush_interval=60)
+
+        published: list[Any] = []
+        started, release = threading.Event(), threading.Event()
+        dispatcher = app.subclass_with_self(BatchingEventDispatcher)(enabled=True)
+
+        def publish(event: Any, producer: Any, routing_key: str, **_: Any) -> None:
+            if not started.is_set():
+                started.set()
+                release.wait(5)
+                raise ConnectionError("Broker is down")
+
+            published.append(event)
+
+        monkeypatch.setattr(dispatcher, "_publish", publish)
+
+        loop = aio.new_event_loop()
+        runner = threading.Thread(target=loop.run_forever, daemon=True)
+        runner.start()
+        dispatcher.loop = loop
+
+        try:
+            for uuid in "12":
+                dispatcher.send("task-started", uuid=uuid)
+
+            loop.call_soon_threadsafe(dispatcher._flush_now)
+            assert started.wait(5)
+
+            dispatcher.send("task-succeeded", uuid="1")
+            threading.Timer(0.1, release.set).start()
+            dispatcher.close()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            runner.join()
+            loop.close()
+
+        assert not dispatcher._publishing
+        assert [(event["type"], event["uuid"]) for batch in published for event in batch] == [
+            ("task-started", "1"),
+            ("task-started", "2"),
+            ("task-succeeded", "1"),
+        ]
+
+    @pytest.mark.description
+    def when_the_pool_is_created(make_pool: Callable[..., AsyncIOPool], caplog: pytest.LogCaptureFixture) -> None:
+        """Test that the pool has the app's event dispatchers batch task
+        events, unless the app's events were already set up, and that
+        `BatchingEvents` only batches them while the setting is on."""
+        app = celery.Celery(set_as_current=False, aio_pool_events_batching=True)
+        make_pool(app, threads=True)
+
+        assert isinstance(app.events, BatchingEvents)
+        assert issubclass(app.events.Dispatcher, BatchingEventDispatcher)
+
+        configured = celery.Celery(set_as_current=False, aio_pool_events_batching=True)
+        assert not issubclass(configured.events.Dispatcher, BatchingEventDispatcher)
+        make_pool(configured, threads=True)
+
+        assert not isinstance(configured.events, BatchingEvents)
+        assert "task events won't be batched" in caplog.text
+
+        unbatched = celery.Celery(set_as_current=False, events="celery_aio_pool.events:BatchingEvents")
+
+        assert not issubclass(unbatched.events.Dispatcher, BatchingEventDispatcher)
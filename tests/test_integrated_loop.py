@@ -0,0 +1,62 @@
+"""Test running the pool's event loop in the consumer's thread."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import threading
+import time
+from typing import Callable
+
+# Third-Party Imports
+import celery
+import pytest
+from kombu.asynchronous import Hub
+
+# Package-Level Imports
+from celery_aio_pool.pool import AsyncIOPool
+
+__all__ = tuple()
+
+
+@pytest.mark.descriptor
+def describe_integrated_loop() -> None:
+    """Test that the pool's loop can be owned and pumped by the consumer."""
+
+    @pytest.mark.description
+    def when_the_consumer_has_a_hub(make_pool: Callable[..., AsyncIOPool]) -> None:
+        """Test that coroutines are run in the consumer's own thread, and
+        that the consumer's hub pumps the loop in between messages."""
+        pool = make_pool(celery.Celery(set_as_current=False, aio_pool_integrated_loop=True), threads=False)
+        consumer = threading.current_thread()
+
+        async def current_thread() -> threading.Thread:
+            return threading.current_thread()
+
+        assert pool.integrated
+        assert pool.run(current_thread) is consumer
+        assert pool.run(time.sleep, 0) is None
+
+        hub = Hub()
+        pool.register_with_event_loop(hub)
+
+        called = threading.Event()
+        threading.Thread(target=pool.loop.call_soon_threadsafe, args=(called.set,)).start()
+
+        ticks, deadline = hub.create_loop(), time.monotonic() + 5
+
+        try:
+            while not called.is_set() and time.monotonic() < deadline:
+                next(ticks)
+        finally:
+            hub.close()
+
+        assert called.is_set()
+
+    @pytest.mark.description
+    def when_the_consumer_has_no_hub(make_pool: Callable[..., AsyncIOPool]) -> None:
+        """Test that the pool falls back to a thread-bound loop."""
+        pool = make_pool(celery.Celery(set_as_current=False, aio_pool_integrated_loop=True), threads=True)
+
+        assert not pool.integrated
+        assert pool.loop_runner is not threading.current_thread()
@@ -0,0 +1,76 @@
+"""Test the offline load-test harness."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import json
+import subprocess
+import sys
+
+# Third-Party Imports
+import pytest
+
+# Package-Level Imports
+from celery_aio_pool.loadtest import (
+    LoadProfile,
+    percentile,
+    schedule,
+)
+
+__all__ = tuple()
+
+
+@pytest.mark.descriptor
+def describe_load_test() -> None:
+    """Test replaying task mixes against an in-memory worker."""
+
+    @pytest.mark.description
+    def when_planning_the_task_mix() -> None:
+        """Test that the same seed always produces the same task mix."""
+        profile = LoadProfile(count=500, rate=100, async_ratio=0.25, failure_rate=0.1, seed=42)
+        planned = schedule(profile)
+
+        assert planned == schedule(profile)
+        assert planned != schedule(profile._replace(seed=43))
+        assert all(earlier[0] < later[0] for earlier, later in zip(planned, planned[1:]))
+        assert 0.15 < sum(name == "loadtest.async" for _, name, _ in planned) / len(planned) < 0.35
+
+    @pytest.mark.description
+    def when_computing_percentiles() -> None:
+        """Test that percentiles are computed by nearest rank."""
+        values = [float(value) for value in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile(values, 100) == 100.0
+        assert percentile([], 50) == 0.0
+
+    @pytest.mark.description
+    def when_replaying_load_against_a_worker() -> None:
+        """Test that a load test runs end to end and reports on every task."""
+        # The load test starts a worker pool of its own, which has
+        # to be kept out of the test suite's process
+        completed = subprocess.run(
+            (
+                sys.executable,
+                "-m",
+                "celery_aio_pool.loadtest",
+                "--count=40",
+                "--rate=400",
+                "--failure-rate=0.25",
+                "--json",
+            ),
+            capture_output=True,
+            check=True,
+            timeout=120,
+        )
+        report = json.loads(completed.stdout)
+
+        assert report["submitted"] == 40
+        assert report["succeeded"] + report["failed"] == 40
+        assert report["failed"] > 0
+        assert report["throughput"] > 0
+        assert set(report["latency"]) == {"p50", "p90", "p99", "max"}
+        assert report["peak_rss"] > 0
+        assert report["loop_lag"]["max"] > 0
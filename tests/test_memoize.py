@@ -0,0 +1,75 @@
+"""Test the worker-local memoization of task results."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import time
+
+# Third-Party Imports
+import pytest
+
+# Package-Level Imports
+from celery_aio_pool.memoize import (
+    MISSING,
+    MemoCache,
+)
+
+__all__ = tuple()
+
+
+@pytest.mark.descriptor
+def describe_memo_cache() -> None:
+    """Test that `MemoCache` caches results within its bounds."""
+
+    @pytest.mark.description
+    def when_results_expire() -> None:
+        """Test that results are only returned until they expire."""
+        cache = MemoCache(ttl=60)
+        cache.put("default", 1)
+        cache.put("short", 2, ttl=0.05)
+
+        assert cache.get("short") == 2
+        time.sleep(0.1)
+
+        assert cache.get("short") is MISSING
+        assert cache.get("default") == 1
+        assert cache.info() == {
+            "hits": 2,
+            "misses": 1,
+            "evictions": 0,
+            "expirations": 1,
+            "entries": 1,
+            "bytes": 0,
+        }
+
+    @pytest.mark.description
+    def when_limited_by_entries() -> None:
+        """Test that the least recently used results are evicted first."""
+        cache = MemoCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is MISSING
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        assert cache.info()["evictions"] == 1
+
+    @pytest.mark.description
+    def when_limited_by_size() -> None:
+        """Test that results are evicted to stay within the size limit, and
+        that results too large (or unpicklable) aren't cached at all."""
+        cache = MemoCache(max_bytes=2500)
+
+        for key in "abc":
+            assert cache.put(key, b"x" * 1000)
+
+        assert cache.get("a") is MISSING
+        assert cache.info()["entries"] == 2
+        assert cache.info()["bytes"] <= 2500
+
+        assert not cache.put("huge", b"x" * 5000)
+        assert not cache.put("lambda", lambda: None)
+        assert cache.clear() == 2
+        assert cache.info()["bytes"] == 0
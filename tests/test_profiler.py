@@ -0,0 +1,118 @@
+"""Test the event loop sampling profiler."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Generator
+
+# Third-Party Imports
+import pytest
+
+# Package-Level Imports
+from celery_aio_pool.eagertasks import submit_eagerly
+from celery_aio_pool.profiler import LoopProfiler
+from celery_aio_pool.types import TaskLabel
+
+__all__ = tuple()
+
+
+@pytest.fixture()
+def loop_thread() -> Generator[tuple[aio.AbstractEventLoop, threading.Thread], None, None]:
+    """An asyncio eventloop running in a dedicated thread."""
+    loop = aio.new_event_loop()
+    runner = threading.Thread(target=loop.run_forever, daemon=True)
+    runner.start()
+
+    yield loop, runner
+
+    loop.call_soon_threadsafe(loop.stop)
+    runner.join()
+    loop.close()
+
+
+async def _spin(seconds: float) -> None:
+    """Keep the eventloop busy without ever yielding control."""
+    deadline = time.monotonic() + seconds
+
+    while time.monotonic() < deadline:
+        sum(range(1000))
+
+
+async def _sleep_then_spin(seconds: float) -> None:
+    """Yield control to the eventloop, then keep it busy."""
+    await aio.sleep(seconds)
+    await _spin(seconds)
+
+
+@pytest.mark.descriptor
+def describe_loop_profiler() -> None:
+    """Test that `LoopProfiler` attributes samples to the task running on the
+    loop."""
+
+    @pytest.mark.description
+    def when_writing_collapsed_stacks(loop_thread, tmp_path: Path) -> None:
+        """Test that samples are written as collapsed stacks rooted at the
+        profiled task's label."""
+        loop, runner = loop_thread
+        profiler = LoopProfiler(loop, runner, interval=0.001, output_dir=str(tmp_path))
+        label = TaskLabel("some-id", "some.task")
+
+        path = profiler.start(task_name="some.task")
+
+        assert profiler.wants(label)
+
+        aio.run_coroutine_threadsafe(profiler.track(_spin(0.1), label), loop).result()
+
+        assert profiler.stop() == path
+
+        lines = Path(path).read_text().splitlines()
+
+        assert lines
+        assert all(line.startswith("some.task[some-id];") for line in lines)
+        assert any("_spin" in line for line in lines)
+
+    @pytest.mark.description
+    def when_the_task_is_started_eagerly(loop_thread, tmp_path: Path) -> None:
+        """Test that samples of a coroutine started by `submit_eagerly`
+        (which has no task of its own) are still attributed to its label,
+        and not to the idle loop."""
+        loop, runner = loop_thread
+        profiler = LoopProfiler(loop, runner, interval=0.001, output_dir=str(tmp_path))
+        label = TaskLabel("eager-id", "some.task")
+
+        path = profiler.start(task_name="some.task")
+
+        submit_eagerly(profiler.track(_sleep_then_spin(0.1), label), loop).result()
+
+        assert profiler.stop() == path
+        assert None not in profiler._labels
+
+        lines = Path(path).read_text().splitlines()
+
+        assert any("_spin" in line for line in lines)
+        assert not any("select" in line for line in lines)
+        assert all(line.startswith("some.task[eager-id];") for line in lines)
+
+    @pytest.mark.description
+    def when_sampling_one_in_k_tasks(loop_thread, tmp_path: Path) -> None:
+        """Test that only every K-th execution of the named task is
+        selected."""
+        loop, runner = loop_thread
+        profiler = LoopProfiler(loop, runner, output_dir=str(tmp_path))
+
+        profiler.start(task_name="some.task", every=3, fmt="speedscope")
+
+        selected = [profiler.wants(TaskLabel(str(index), "some.task")) for index in range(6)]
+
+        assert not profiler.wants(TaskLabel("other", "other.task"))
+        assert selected == [True, False, False, True, False, False]
+
+        path = profiler.stop()
+
+        assert json.loads(Path(path).read_text())["profiles"] == []
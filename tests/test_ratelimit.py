@@ -0,0 +1,123 @@
+"""Test the pool's named rate limiters."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import struct
+import time
+from pathlib import Path
+
+# Third-Party Imports
+import pytest
+
+# Package-Level Imports
+from celery_aio_pool.ratelimit import (
+    RateLimiter,
+    RateLimiterRegistry,
+)
+
+__all__ = tuple()
+
+
+@pytest.mark.descriptor
+def describe_rate_limiter() -> None:
+    """Test that rate limiters space out calls without blocking the loop."""
+
+    @pytest.mark.description
+    def when_bursting_past_capacity() -> None:
+        """Test that a burst of up to `capacity` calls goes through at once
+        and later calls are spaced out at the limiter's rate."""
+        limiter = RateLimiter("bursty", "100/s", capacity=5)
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+
+            while True:
+                await aio.sleep(0.005)
+                ticks += 1
+
+        async def burst() -> float:
+            ticker = aio.create_task(tick())
+            started = time.monotonic()
+
+            await aio.gather(*(limiter.acquire() for _ in range(15)))
+
+            ticker.cancel()
+
+            return time.monotonic() - started
+
+        elapsed = aio.run(burst())
+
+        assert 0.09 <= elapsed < 0.3
+        assert ticks >= 10  # the loop kept running while the calls waited
+        assert limiter.stats["acquired"] == 15
+        assert limiter.stats["delayed"] == 10
+
+    @pytest.mark.description
+    def when_tokens_are_not_available() -> None:
+        """Test that `try_acquire` doesn't reserve tokens it can't take."""
+        limiter = RateLimiter("strict", 10)
+
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert limiter.stats["acquired"] == 1
+
+    @pytest.mark.description
+    def when_shared_between_processes(tmp_path: Path) -> None:
+        """Test that limiters backed by the same file draw from one budget."""
+        first = RateLimiter("shared", "10/s", shared_path=str(tmp_path / "shared"))
+        second = RateLimiter("shared", "10/s", shared_path=str(tmp_path / "shared"))
+
+        try:
+            assert first.reserve() == 0.0
+            assert 0.05 < second.reserve() <= 0.1
+            assert 0.15 < first.reserve() <= 0.2
+        finally:
+            first.close()
+            second.close()
+
+    @pytest.mark.description
+    def when_shared_state_is_persisted(tmp_path: Path) -> None:
+        """Test that shared state is kept in wall-clock time, so that it
+        stays meaningful to processes with other monotonic clocks."""
+        path = tmp_path / "shared"
+        limiter = RateLimiter("persisted", "10/s", shared_path=str(path))
+
+        try:
+            limiter.reserve()
+
+            assert abs(struct.unpack("d", path.read_bytes()[:8])[0] - (time.time() + 0.1)) < 1.0
+
+            path.write_bytes(struct.pack("d", time.time() + 5.0))
+
+            assert 4.5 < limiter.reserve() <= 5.1
+        finally:
+            limiter.close()
+
+
+@pytest.mark.descriptor
+def describe_rate_limiter_registry() -> None:
+    """Test configuring named rate limiters."""
+
+    @pytest.mark.description
+    def when_configured_from_settings(tmp_path: Path) -> None:
+        """Test that limiters are created from rates or keyword arguments."""
+        registry = RateLimiterRegistry()
+        registry.configure_from_settings(
+            {
+                "vendor-x": "50/s",
+                "vendor-y": {"rate": "10/m", "capacity": 5, "shared": True},
+            },
+            directory=str(tmp_path),
+        )
+
+        assert registry.get("vendor-x").rate == 50.0
+        assert registry.get("vendor-y").capacity == 5.0
+        assert registry.get("vendor-y").shared
+        assert set(registry.stats()) == {"vendor-x", "vendor-y"}
+
+        with pytest.raises(KeyError, match="vendor-z"):
+            registry.get("vendor-z")
@@ -0,0 +1,69 @@
+"""Test worker-local scheduling of short task retries."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import threading
+import time
+
+# Third-Party Imports
+import celery
+import celery.signals
+import pytest
+from celery import states
+from celery.worker import state as worker_state
+
+# Package-Level Imports
+from celery_aio_pool.retry import LocalRetryScheduler
+
+__all__ = tuple()
+
+
+@pytest.mark.descriptor
+def describe_local_retry_scheduler() -> None:
+    """Test that parked retries are re-run by the worker once they're due."""
+
+    @pytest.mark.description
+    def when_the_task_is_revoked_while_parked() -> None:
+        """Test that a retry whose task has been revoked in the meantime is
+        recorded as revoked instead of being run."""
+        app = celery.Celery(set_as_current=False, backend="cache+memory://")
+        runs: list[str] = []
+        revoked: list[str] = []
+
+        @app.task(shared=False, bind=True)
+        def _retried(self: celery.Task) -> None:
+            runs.append(self.request.id)
+
+        def on_revoked(request: celery.app.task.Context, **_: object) -> None:
+            revoked.append(request.id)
+
+        loop = aio.new_event_loop()
+        runner = threading.Thread(target=loop.run_forever, daemon=True)
+        runner.start()
+        scheduler = LocalRetryScheduler(loop)
+        celery.signals.task_revoked.connect(on_revoked, sender=_retried)
+        worker_state.revoked.add("revoked-task")
+
+        try:
+            for task_id in ("revoked-task", "live-task"):
+                request = {"id": task_id, "args": (), "kwargs": {}, "retries": 1, "hostname": "test"}
+                assert scheduler.park(_retried, _retried.s(), request, 0.01)
+
+            deadline = time.monotonic() + 5
+
+            while len(runs) + len(revoked) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            worker_state.revoked.discard("revoked-task")
+            celery.signals.task_revoked.disconnect(on_revoked, sender=_retried)
+            loop.call_soon_threadsafe(loop.stop)
+            runner.join()
+            loop.close()
+
+        assert runs == ["live-task"]
+        assert revoked == ["revoked-task"]
+        assert app.backend.get_state("revoked-task") == states.REVOKED
+        assert app.backend.get_state("live-task") == states.SUCCESS
@@ -0,0 +1,192 @@
+"""Test spreading task executions over several event loops."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+# Third-Party Imports
+import celery
+import pytest
+
+# Package-Level Imports
+from celery_aio_pool.pool import AsyncIOPool
+from celery_aio_pool.sharding import (
+    LoopShards,
+    current_loop_shard,
+)
+from celery_aio_pool.types import TaskLabel
+
+__all__ = tuple()
+
+
+def _shards(strategy: str) -> LoopShards:
+    """Shards whose primary loop isn't actually running."""
+    return LoopShards(aio.new_event_loop(), threading.current_thread(), 4, strategy=strategy)
+
+
+@pytest.fixture()
+def sharded_pool(make_pool: Callable[..., AsyncIOPool]) -> AsyncIOPool:
+    """A worker pool with three event loops."""
+    return make_pool(celery.Celery(set_as_current=False, aio_pool_loops=3), threads=True)
+
+
+@pytest.mark.descriptor
+def describe_loop_shards() -> None:
+    """Test that task executions are assigned to loops as configured."""
+
+    @pytest.mark.description
+    def when_assigning_round_robin() -> None:
+        """Test that shards take turns."""
+        shards = _shards("round-robin")
+
+        try:
+            assert [shards.acquire().index for _ in range(6)] == [0, 1, 2, 3, 0, 1]
+        finally:
+            shards.stop()
+
+    @pytest.mark.description
+    def when_assigning_to_the_least_loaded() -> None:
+        """Test that the shard running the fewest tasks is picked."""
+        shards = _shards("least-loaded")
+
+        try:
+            busy = [shards.acquire() for _ in range(4)]
+            shards.release(busy[2])
+
+            assert shards.acquire() is busy[2]
+        finally:
+            shards.stop()
+
+    @pytest.mark.description
+    def when_assigning_by_hash() -> None:
+        """Test that tasks sharing a key always run on the same shard, while
+        different keys are spread out."""
+        shards = _shards("hash")
+
+        try:
+            assert len({shards.acquire("tenant-42").index for _ in range(10)}) == 1
+            assert len({shards.acquire(f"tenant-{key}").index for key in range(100)}) == 4
+        finally:
+            shards.stop()
+
+    @pytest.mark.description
+    def when_given_an_unknown_strategy() -> None:
+        """Test that unknown assignment strategies are refused."""
+        with pytest.raises(ValueError, match="random"):
+            LoopShards(aio.new_event_loop(), threading.current_thread(), 2, strategy="random")
+
+    @pytest.mark.description
+    def when_the_pool_runs_coroutines(sharded_pool: AsyncIOPool) -> None:
+        """Test that coroutines run on the loop of the shard they were
+        assigned to."""
+
+        async def current_thread() -> str:
+            return threading.current_thread().name
+
+        assert sharded_pool.run(current_thread) == "celery-worker-async-loop"
+
+        names = set()
+
+        for _ in range(3):
+            shard = sharded_pool.shards.acquire()
+            token = current_loop_shard.set(shard)
+
+            try:
+                names.add(sharded_pool.run(current_thread))
+            finally:
+                current_loop_shard.reset(token)
+                sharded_pool.shards.release(shard)
+
+        assert names == {
+            "celery-worker-async-loop",
+            "celery-worker-async-loop-1",
+            "celery-worker-async-loop-2",
+        }
+        assert sharded_pool._get_info()["loops"]["1"] == {"in_flight": 0, "assigned": 1}
+
+    @pytest.mark.description
+    def when_tasks_are_applied(sharded_pool: AsyncIOPool) -> None:
+        """Test that tasks applied to the pool run at the same time, each on
+        the loop of the shard it was assigned to."""
+        spans, done = [], threading.Barrier(4, timeout=10)
+
+        async def slow() -> tuple[str, float, float]:
+            started = time.monotonic()
+            await aio.sleep(0.3)
+            return threading.current_thread().name, started, time.monotonic()
+
+        def trace() -> tuple[str, float, float]:
+            shard = sharded_pool.shards.acquire()
+            token = current_loop_shard.set(shard)
+
+            try:
+                return sharded_pool.run(slow)
+            finally:
+                current_loop_shard.reset(token)
+                sharded_pool.shards.release(shard)
+
+        def finished(span: tuple[str, float, float]) -> None:
+            spans.append(span)
+            done.wait()
+
+        started = time.monotonic()
+
+        for _ in range(3):
+            assert sharded_pool.apply_async(trace, callback=finished) is not None
+
+        # `apply_async` returns straight away, so the consumer
+        # isn't kept waiting while the tasks run
+        assert time.monotonic() - started < 0.1
+
+        done.wait()
+
+        assert time.monotonic() - started < 0.6
+        assert {name for name, _, _ in spans} == {
+            "celery-worker-async-loop",
+            "celery-worker-async-loop-1",
+            "celery-worker-async-loop-2",
+        }
+        assert max(start for _, start, _ in spans) < min(end for _, _, end in spans)
+        assert sharded_pool._get_info()["max-concurrency"] == 3
+
+    @pytest.mark.description
+    def when_the_pool_is_profiled(sharded_pool: AsyncIOPool, tmp_path: Path) -> None:
+        """Test that the profiler samples every shard's loop, not just the
+        pool's own."""
+        label = TaskLabel("sharded-id", "some.task")
+        shard = sharded_pool.shards.shards[2]
+
+        async def spin() -> None:
+            deadline = time.monotonic() + 0.1
+
+            while time.monotonic() < deadline:
+                sum(range(1000))
+
+        sharded_pool.profiler.interval = 0.001
+        sharded_pool.profiler.output_dir = str(tmp_path)
+        path = sharded_pool.profiler.start()
+
+        aio.run_coroutine_threadsafe(sharded_pool.profiler.track(spin(), label), shard.loop).result()
+
+        assert sharded_pool.profiler.stop() == path
+
+        lines = Path(path).read_text().splitlines()
+
+        assert any(line.startswith("some.task[sharded-id];") and "spin" in line for line in lines)
+        assert any(line.startswith("<event-loop-1>;") for line in lines)
+
+    @pytest.mark.description
+    def when_stopped() -> None:
+        """Test that every shard's loop but the primary one is stopped and
+        closed."""
+        shards = _shards("round-robin")
+        shards.stop()
+
+        assert all(not shard.thread.is_alive() and shard.loop.is_closed() for shard in shards.shards[1:])
+        assert not shards.shards[0].loop.is_closed()
@@ -0,0 +1,66 @@
+"""Test dispatch of Celery signals to coroutine receivers."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+from typing import Any
+
+# Third-Party Imports
+import celery
+import celery.signals
+import pytest
+
+# Package-Level Imports
+from celery_aio_pool.signals import AsyncSignalDispatcher
+
+__all__ = tuple()
+
+
+@pytest.mark.descriptor
+def describe_async_signal_receivers() -> None:
+    """Test that `async def` signal receivers are actually awaited."""
+
+    @pytest.mark.description
+    def when_task_is_applied_eagerly() -> None:
+        """Test that coroutine receivers of the task signals are awaited
+        concurrently alongside regular receivers."""
+        app = celery.Celery(set_as_current=False)
+        received: list[str] = []
+
+        @app.task
+        async def _add(x: int, y: int) -> int:
+            return x + y
+
+        async def _on_prerun(sender: Any, **_: Any) -> None:
+            await aio.sleep(0.01)
+            received.append("prerun")
+
+        def _on_success(sender: Any, result: Any, **_: Any) -> None:
+            received.append(f"success:{result}")
+
+        async def _on_postrun(sender: Any, state: str, **_: Any) -> None:
+            await aio.sleep(0)
+            received.append(f"postrun:{state}")
+
+        celery.signals.task_prerun.connect(_on_prerun, sender=_add)
+        celery.signals.task_success.connect(_on_success, sender=_add)
+        celery.signals.task_postrun.connect(_on_postrun, sender=_add)
+
+        try:
+            assert _add.apply((1, 2)).get() == 3
+        finally:
+            celery.signals.task_prerun.disconnect(_on_prerun, sender=_add)
+            celery.signals.task_success.disconnect(_on_success, sender=_add)
+            celery.signals.task_postrun.disconnect(_on_postrun, sender=_add)
+
+        assert received == ["prerun", "success:3", "postrun:SUCCESS"]
+
+    @pytest.mark.description
+    def when_choosing_background_signals() -> None:
+        """Test that background dispatch can be enabled per signal."""
+        dispatcher = AsyncSignalDispatcher(background=("task_postrun",))
+
+        assert dispatcher.runs_in_background(celery.signals.task_postrun)
+        assert not dispatcher.runs_in_background(celery.signals.task_prerun)
@@ -0,0 +1,126 @@
+"""Test single-flight coalescing of identical task executions."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import concurrent.futures
+import threading
+import time
+
+# Third-Party Imports
+import pytest
+from celery.exceptions import Retry
+
+# Package-Level Imports
+from celery_aio_pool.singleflight import (
+    SingleFlight,
+    flight_key,
+)
+
+__all__ = tuple()
+
+
+@pytest.mark.descriptor
+def describe_single_flight() -> None:
+    """Test that `SingleFlight` runs identical executions once."""
+
+    @pytest.mark.description
+    def when_executions_overlap() -> None:
+        """Test that an execution started while an identical one is running
+        waits for, and shares, its result."""
+        flights, started, release = SingleFlight(window=0), threading.Event(), threading.Event()
+        calls = []
+
+        def refresh() -> dict:
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"refreshed": True}
+
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(flights.run, "key", refresh)
+            started.wait(5)
+            follower = executor.submit(flights.run, "key", refresh)
+            time.sleep(0.05)
+            release.set()
+
+            assert leader.result(5) is follower.result(5)
+
+        assert len(calls) == 1
+        assert flights.info() == {"executed": 1, "coalesced": 1, "flights": 0}
+
+    @pytest.mark.description
+    def when_executions_follow_each_other() -> None:
+        """Test that executions starting within the window after an identical
+        one has finished share its result, while later ones run the task
+        themselves."""
+        flights = SingleFlight(window=0.1)
+
+        assert flights.run("key", lambda: 1) == 1
+        assert flights.run("key", lambda: 2) == 1
+
+        time.sleep(0.15)
+
+        assert flights.run("key", lambda: 3) == 3
+        assert flights.info() == {"executed": 2, "coalesced": 1, "flights": 1}
+
+    @pytest.mark.description
+    def when_finished_flights_expire() -> None:
+        """Test that every flight past its window is dropped by the next
+        execution, whatever its key, and that executions from several
+        threads are all counted."""
+        flights = SingleFlight(window=0.05)
+
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            list(executor.map(lambda index: flights.run(index, lambda: index), range(400)))
+
+        assert flights.info() == {"executed": 400, "coalesced": 0, "flights": 400}
+
+        time.sleep(0.1)
+
+        assert flights.run("other", lambda: 0) == 0
+        assert flights.info() == {"executed": 401, "coalesced": 0, "flights": 1}
+
+    @pytest.mark.description
+    def when_the_window_is_disabled() -> None:
+        """Test that finished executions aren't shared (or kept) at all
+        without a window."""
+        flights = SingleFlight(window=0)
+
+        assert flights.run("key", lambda: 1) == 1
+        assert flights.run("key", lambda: 2) == 2
+        assert flights.info() == {"executed": 2, "coalesced": 0, "flights": 0}
+
+    @pytest.mark.description
+    def when_the_execution_fails() -> None:
+        """Test that errors are shared, but retries aren't."""
+        flights = SingleFlight(window=60)
+
+        def fails() -> None:
+            raise LookupError("gone")
+
+        with pytest.raises(LookupError, match="gone"):
+            flights.run("failing", fails)
+
+        with pytest.raises(LookupError, match="gone"):
+            flights.run("failing", lambda: 0)
+
+        def retries() -> None:
+            raise Retry("later")
+
+        with pytest.raises(Retry):
+            flights.run("retrying", retries)
+
+        assert flights.run("retrying", lambda: 4) == 4
+
+    @pytest.mark.description
+    def when_keying_executions() -> None:
+        """Test that keys depend on the task's name and arguments, or on its
+        `single_flight` callable."""
+        key = flight_key("refresh", True, (1, [2]), {"b": 1, "a": 2})
+
+        assert key == flight_key("refresh", True, (1, [2]), {"a": 2, "b": 1})
+        assert key != flight_key("refresh", True, (1, [3]), {"a": 2, "b": 1})
+        assert key != flight_key("other", True, (1, [2]), {"a": 2, "b": 1})
+        assert flight_key("refresh", lambda tenant, **_: tenant, ("t1",), {"at": 1}) == ("refresh", "t1")
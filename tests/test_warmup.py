@@ -0,0 +1,120 @@
+"""Test the warm-up of the worker pool before it takes on tasks."""
+
+# Future Imports
+from __future__ import annotations
+
+# Standard Library Imports
+import asyncio as aio
+import sys
+import threading
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+)
+
+# Third-Party Imports
+import celery
+import pytest
+from celery.backends.cache import CacheBackend
+
+# Package-Level Imports
+from celery_aio_pool.pool import AsyncIOPool
+from celery_aio_pool.warmup import (
+    on_warmup,
+    warmup_hooks,
+)
+
+__all__ = tuple()
+
+warmed: list[str] = []
+
+
+class CountingBackend(CacheBackend):
+    """An in-memory result backend that counts its lookups."""
+
+    lookups: list[str] = []
+
+    def get(self, key: bytes | str) -> Any:
+        self.lookups.append(key.decode() if isinstance(key, bytes) else key)
+        return super().get(key)
+
+
+class UnreachableBackend(CacheBackend):
+    """An in-memory result backend that can't be connected to."""
+
+    def get(self, key: bytes | str) -> Any:
+        raise ConnectionError(key)
+
+
+async def open_connections(app: celery.Celery) -> None:
+    """A dummy async warm-up hook."""
+    await aio.sleep(0)
+    warmed.append(f"async:{app.main}")
+
+
+def failing_hook(app: celery.Celery) -> None:
+    """A dummy warm-up hook that fails."""
+    raise ConnectionError(app.main)
+
+
+@pytest.mark.descriptor
+def describe_warm_up() -> None:
+    """Test that the pool warms up before the worker consumes tasks."""
+
+    @pytest.mark.description
+    def when_the_pool_starts(
+        make_pool: Callable[..., AsyncIOPool],
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        """Test that executor threads are spawned, task modules are
+        imported, result backends are connected to (skipping the ones that
+        fail) and hooks are run, with the time taken by each reported."""
+        (tmp_path / "warm_up_tasks.py").write_text("imported = True\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "warm_up_tasks", raising=False)
+        CountingBackend.lookups.clear()
+
+        app = celery.Celery(
+            "warm",
+            set_as_current=False,
+            backend=f"{__name__}:CountingBackend",
+            cache_backend="memory",
+            imports=["warm_up_tasks"],
+            aio_pool_warmup=True,
+            aio_pool_warmup_threads=4,
+            aio_pool_warmup_hooks=[f"{__name__}:open_connections", failing_hook],
+        )
+
+        @app.task(shared=False)
+        async def ping() -> str:
+            return "pong"
+
+        @app.task(shared=False, backend=UnreachableBackend(app=app, backend="memory"))
+        async def unreachable() -> str:
+            return "pong"
+
+        @on_warmup
+        def registered(app: Any) -> None:
+            warmed.append(f"sync:{threading.current_thread().name}")
+
+        pool = make_pool(app, threads=True)
+
+        try:
+            pool.start()
+
+            loop_threads = pool.run(lambda: {thread.name for thread in threading.enumerate()})
+            report = pool._get_info()["warm-up"]
+        finally:
+            warmup_hooks.remove(registered)
+
+        assert report["threads"]["count"] == 4
+        assert sum(name.startswith("asyncio_") for name in loop_threads) >= 4
+        assert "warm_up_tasks" in sys.modules
+        assert report["tasks"]["count"] == len(app.tasks)
+        assert report["tasks"]["backends"] == 1 and report["tasks"]["failed"] == 1
+        assert any("celery-aio-pool-warm-up" in key for key in CountingBackend.lookups)
+        assert report["hooks"] == {"count": 3, "failed": 1, "seconds": report["hooks"]["seconds"]}
+        assert report["seconds"] >= report["threads"]["seconds"]
+        assert warmed[0].startswith("sync:asyncio_") and warmed[1] == "async:warm"